@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from wexample_app.const.globals import APP_PATH_APP_MANAGER
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 from wexample_wex_core.common.abstract_addon_manager import AbstractAddonManager
 
@@ -12,12 +13,19 @@ if TYPE_CHECKING:
     from wexample_cli.middleware.abstract_middleware import AbstractMiddleware
     from wexample_helpers.const.types import PathOrString
 
+    from wexample_wex_addon_app.common.service_manifest_store import (
+        ServiceManifestStore,
+    )
     from wexample_wex_addon_app.service.app_service import AppService
     from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
 
 
 @base_class
 class AppAddonManager(AbstractAddonManager):
+    _service_manifest_store: ServiceManifestStore | None = private_field(
+        default=None, description="Service manifests, built on first lookup"
+    )
+
     @classmethod
     def from_kernel(cls, kernel) -> AppAddonManager:
         for addon in kernel.get_addons().values():
@@ -97,18 +105,15 @@ class AppAddonManager(AbstractAddonManager):
     def docker_cp(
         self, service: str, local_src: Path | str, container_dest: str
     ) -> None:
-        import subprocess
+        from wexample_wex_addon_app.helper.docker import docker_copy_to_container
 
         container = self.get_service_docker_container_name(service)
         if not container:
             raise RuntimeError(f"No Docker container found for service '{service}'")
-        subprocess.run(
-            ["docker", "cp", str(local_src), f"{container}:{container_dest}"],
-            check=True,
-        )
+        docker_copy_to_container(container, local_src, container_dest)
 
     def docker_exec(self, service: str, args: list[str]) -> str:
-        from wexample_helpers.helper.docker import docker_exec as _docker_exec
+        from wexample_wex_addon_app.helper.docker import docker_exec as _docker_exec
 
         container = self.get_service_docker_container_name(service)
         if not container:
@@ -116,36 +121,10 @@ class AppAddonManager(AbstractAddonManager):
         return _docker_exec(container_name=container, command=args)
 
     def find_service_dir(self, service_name: str) -> Path | None:
-        from wexample_wex_addon_app.resolver.service_command_resolver import (
-            _SERVICES_SUBDIR,
-        )
-
-        for addon in self.kernel.get_addons().values():
-            service_dir = addon.workdir.get_path() / _SERVICES_SUBDIR / service_name
-            if service_dir.is_dir():
-                return service_dir
-        return None
+        return self.get_service_manifest_store().find_service_dir(service_name)
 
     def find_services_by_tag(self, tag: str) -> list[str]:
-        from wexample_wex_addon_app.resolver.service_command_resolver import (
-            _SERVICES_SUBDIR,
-        )
-
-        matches: list[str] = []
-        for addon in self.kernel.get_addons().values():
-            services_dir = addon.workdir.get_path() / _SERVICES_SUBDIR
-            if not services_dir.is_dir():
-                continue
-
-            for service_dir in sorted(services_dir.iterdir()):
-                if not service_dir.is_dir():
-                    continue
-
-                manifest = self.get_service_manifest(service_dir.name)
-                if tag in (manifest.get("tags") or []):
-                    matches.append(service_dir.name)
-
-        return matches
+        return self.get_service_manifest_store().find_services_by_tag(tag)
 
     def get_app_service(
         self, service_name: str, app_workdir: ManagedWorkdir
@@ -242,55 +221,63 @@ class AppAddonManager(AbstractAddonManager):
         return app_workdir.docker_build_long_container_name(service)
 
     def get_service_inheritance_chain(self, service_name: str) -> list[str]:
-        chain: list[str] = []
-        current = service_name
-        visiting: set[str] = set()
-
-        while current:
-            if current in visiting:
-                raise ValueError(
-                    f"Cyclic service inheritance detected: {' -> '.join(chain + [current])}"
-                )
-
-            visiting.add(current)
-            chain.append(current)
-            manifest = self.get_service_manifest_raw(current)
-            parent = manifest.get("extends")
-            current = str(parent) if parent else ""
-
-        chain.reverse()
-        return chain
+        return self.get_service_manifest_store().get_inheritance_chain(service_name)
 
     def get_service_manifest(self, service_name: str) -> dict[str, Any]:
-        from wexample_helpers.helper.dict import dict_merge
+        import copy
+
+        return copy.deepcopy(
+            self.get_service_manifest_store().get_manifest(service_name)
+        )
 
-        chain = self.get_service_inheritance_chain(service_name)
-        merged: dict[str, Any] = {}
-        list_keys = {"tags", "dependencies"}
+    def get_service_manifest_raw(self, service_name: str) -> dict[str, Any]:
+        import copy
 
-        for inherited_service_name in chain:
-            raw_manifest = self.get_service_manifest_raw(inherited_service_name)
-            merged = dict_merge(merged, raw_manifest)
+        return copy.deepcopy(
+            self.get_service_manifest_store().get_manifest_raw(service_name)
+        )
 
-            for key in list_keys:
-                seen: dict[Any, None] = {}
-                for source in (merged, raw_manifest):
-                    for v in source.get(key, []) or []:
-                        seen[v] = None
-                if seen:
-                    merged[key] = list(seen)
+    def get_service_manifest_store(self) -> ServiceManifestStore:
+        """Service dirs and manifests of every addon, loaded once per kernel."""
+        if self._service_manifest_store is None:
+            from wexample_app.const.path import APP_DIR_NAME_TMP
 
-        merged.pop("extends", None)
-        return merged
+            from wexample_wex_addon_app.common.service_manifest_store import (
+                ServiceManifestStore,
+            )
+            from wexample_wex_addon_app.const.path import APP_FILE_SERVICE_MANIFESTS
+            from wexample_wex_addon_app.resolver.service_command_resolver import (
+                _SERVICES_SUBDIR,
+            )
 
-    def get_service_manifest_raw(self, service_name: str) -> dict[str, Any]:
-        from wexample_helpers_yaml.helper.yaml_helpers import yaml_read
+            self._service_manifest_store = ServiceManifestStore(
+                services_paths=[
+                    addon.workdir.get_path() / _SERVICES_SUBDIR
+                    for addon in self.kernel.get_addons().values()
+                ],
+                snapshot_path=self.kernel.workdir.get_path()
+                / APP_DIR_NAME_TMP
+                / APP_FILE_SERVICE_MANIFESTS,
+            )
+        return self._service_manifest_store
 
-        service_dir = self.find_service_dir(service_name)
-        if service_dir is None:
-            return {}
+    def get_services_with_hook(
+        self, hook: str, app_workdir: ManagedWorkdir
+    ) -> list[AppService]:
+        """Services of the app declaring the ``group/name`` hook command."""
+        from wexample_helpers.helper.string import string_to_snake_case
 
-        return yaml_read(file_path=str(service_dir / "service.yml"), default={}) or {}
+        parts = hook.split("/")
+        group_path = Path(*parts[:-1]) if len(parts) > 1 else Path()
+        hook_cmd_filename = f"{string_to_snake_case(parts[-1])}.py"
+        return [
+            service
+            for service in self.get_app_services(app_workdir)
+            if service.service_dir
+            and (
+                service.service_dir / "commands" / group_path / hook_cmd_filename
+            ).exists()
+        ]
 
     def get_step_guard_classes(self) -> list[type]:
         from wexample_wex_addon_app.yaml.app_should_run_step_guard import (
@@ -349,34 +336,54 @@ class AppAddonManager(AbstractAddonManager):
         Hook name follows the command path convention: ``group/name`` (e.g. ``service/ready``).
         Services that do not declare the hook are silently skipped.
         """
-        from wexample_app.const.output import OUTPUT_TARGET_NONE
-        from wexample_helpers.helper.string import string_to_snake_case
-        from wexample_wex_core.common.command_request import CommandRequest
-
-        results: dict[str, Any] = {}
-        parts = hook.split("/")
-        group_path = Path(*parts[:-1]) if len(parts) > 1 else Path()
-        hook_cmd_filename = f"{string_to_snake_case(parts[-1])}.py"
-        for service in self.get_app_services(app_workdir):
-            if not service.service_dir:
-                continue
+        return {
+            service.name: self.run_service_hook_on(
+                hook=hook,
+                service=service,
+                app_workdir=app_workdir,
+                arguments=arguments,
+            )
+            for service in self.get_services_with_hook(hook, app_workdir)
+        }
 
-            cmd_path = service.service_dir / "commands" / group_path / hook_cmd_filename
-            if not cmd_path.exists():
-                continue
+    def run_service_hook_in_manager(
+        self,
+        hook: str,
+        service: AppService,
+        app_workdir: ManagedWorkdir,
+    ) -> Any:
+        """Call a hook declared by one service in an app-manager process.
 
-            request = CommandRequest(
-                kernel=self.kernel,
-                name=f"@{service.address_name}::{hook}",
-                arguments={
-                    "app_path": str(app_workdir.get_path()),
-                    **(arguments or {}),
-                },
-                output_target=[OUTPUT_TARGET_NONE],
-            )
-            response = self.kernel.execute_kernel_command(request)
-            results[service.name] = (
-                response.content if hasattr(response, "content") else None
-            )
+        Unlike `run_service_hook_on`, which goes through the kernel of this
+        process, it may run from several threads at once.
+        """
+        path = app_workdir.get_path()
+        return app_workdir.manager_run_command_from_path(
+            path=path,
+            command=f"@{service.address_name}::{hook}",
+            arguments=["--app-path", str(path)],
+            inherit_stdio=False,
+        ).get_output()
+
+    def run_service_hook_on(
+        self,
+        hook: str,
+        service: AppService,
+        app_workdir: ManagedWorkdir,
+        arguments: dict | None = None,
+    ) -> Any:
+        """Call a hook declared by one service, return its response content."""
+        from wexample_app.const.output import OUTPUT_TARGET_NONE
+        from wexample_wex_core.common.command_request import CommandRequest
 
-        return results
+        request = CommandRequest(
+            kernel=self.kernel,
+            name=f"@{service.address_name}::{hook}",
+            arguments={
+                "app_path": str(app_workdir.get_path()),
+                **(arguments or {}),
+            },
+            output_target=[OUTPUT_TARGET_NONE],
+        )
+        response = self.kernel.execute_kernel_command(request)
+        return response.content if hasattr(response, "content") else None
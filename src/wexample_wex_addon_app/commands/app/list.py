@@ -27,12 +27,17 @@ if TYPE_CHECKING:
 def app__app__list(
     context: ExecutionContext,
 ) -> AbstractResponse:
+    from wexample_app.response.default_response import DefaultResponse
     from wexample_app.response.log_response import LogResponse
     from wexample_app.response.multiple_response import MultipleResponse
     from wexample_app.response.title_response import TitleResponse
+    from wexample_prompt.enums.verbosity_level import VerbosityLevel
 
-    from wexample_wex_addon_app.commands.container.list import app__container__list
+    from wexample_wex_addon_app.commands.container.list import (
+        _build_containers_table,
+    )
     from wexample_wex_addon_app.common.app_registry import registry_read
+    from wexample_wex_addon_app.helper.docker import docker_inspect_containers
 
     data = registry_read()
     apps = data.get("apps", {})
@@ -43,11 +48,43 @@ def app__app__list(
             message="No running apps in registry",
         )
 
+    # Read every app's runtime files first, so that all containers are
+    # inspected in one batch instead of once per app.
+    snapshots = {app_path: _read_app_snapshot(app_path) for app_path in apps}
+    inspect_by_name = docker_inspect_containers(
+        [
+            attrs.get("container_name", service_name)
+            for snapshot in snapshots.values()
+            for service_name, attrs in (snapshot.get("services") or {}).items()
+        ]
+    )
+    verbose = context.io.default_context_verbosity >= VerbosityLevel.HIGH
+
     kernel = context.kernel
     responses: list[AbstractResponse] = []
     for app_path, entry in apps.items():
         domains = entry.get("domains") or []
         domains_str = ", ".join(f"@magenta{{{d}}}" for d in domains) if domains else "-"
+        snapshot = snapshots[app_path]
+        if snapshot.get("services") is None:
+            containers = DefaultResponse(
+                kernel=kernel, content="Runtime docker-compose file is missing"
+            )
+        elif not snapshot["services"]:
+            containers = DefaultResponse(
+                kernel=kernel,
+                content="No app containers declared in runtime docker-compose",
+            )
+        else:
+            containers = _build_containers_table(
+                kernel=kernel,
+                services=snapshot["services"],
+                inspect_by_name=inspect_by_name,
+                main_service=snapshot["main_service"],
+                main_db_service=snapshot["main_db_service"],
+                verbose=verbose,
+            )
+
         responses.extend([
             TitleResponse(
                 kernel=kernel,
@@ -55,7 +92,48 @@ def app__app__list(
             ),
             LogResponse(kernel=kernel, message=f"  Domains: {domains_str}"),
             LogResponse(kernel=kernel, message="  Containers:"),
-            kernel.run_function(app__container__list, {"app_path": app_path}),
+            containers,
         ])
 
     return MultipleResponse(kernel=kernel, responses=responses)
+
+
+def _read_app_snapshot(app_path: str) -> dict:
+    """Services and roles of an app, read from its runtime files only.
+
+    Building the app workdir, as `app/container/list` does through its
+    middleware, costs far more than these two reads. `services` is None when
+    the runtime compose file is missing.
+    """
+    import json
+    from pathlib import Path
+
+    from wexample_app.const.globals import APP_FILE_APP_RUNTIME_CONFIG, APP_PATH_TMP
+
+    from wexample_wex_addon_app.item.file.docker_compose_yaml_file import (
+        DockerComposeYamlFile,
+    )
+
+    tmp_dir = Path(app_path) / APP_PATH_TMP
+    compose_path = tmp_dir / "docker-compose.runtime.yml"
+    services = (
+        DockerComposeYamlFile.create_from_path(
+            path=compose_path, configure=False
+        ).read_services()
+        if compose_path.exists()
+        else None
+    )
+
+    try:
+        runtime = json.loads((tmp_dir / APP_FILE_APP_RUNTIME_CONFIG).read_text())
+    except (OSError, ValueError):
+        runtime = {}
+    runtime = runtime if isinstance(runtime, dict) else {}
+
+    return {
+        "services": services,
+        "main_service": (runtime.get("global") or {}).get("main_service"),
+        "main_db_service": ((runtime.get("docker") or {}).get("db") or {}).get(
+            "main"
+        ),
+    }
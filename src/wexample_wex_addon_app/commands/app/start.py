@@ -82,6 +82,8 @@ def app__app__start(
     no_proxy: bool = False,
     fast: bool = False,
 ) -> AbstractResponse:
+    import functools
+
     from wexample_app.const.globals import APP_PATH_TMP
     from wexample_app.response.queued_collection_response import (
         QueuedCollectionResponse,
@@ -197,7 +199,7 @@ def app__app__start(
         app_path_str = str(app_path)
         context.kernel.run_function(app__app__perms, {"app_path": app_path_str})
         return context.kernel.run_function(
-            app__config__build, {"app_path": app_path_str}
+            app__config__build, {"app_path": app_path_str, "force": rebuild}
         )
 
     def _setup_services(previous_value=None) -> None:
@@ -251,27 +253,44 @@ def app__app__start(
 
     def _pending(previous_value=None) -> None:
         from wexample_wex_addon_app.app_addon_manager import AppAddonManager
+        from wexample_wex_addon_app.common.service_readiness_waiter import (
+            ServiceReadinessWaiter,
+        )
 
         app_manager = AppAddonManager.from_kernel(context.kernel)
+        services = app_manager.get_services_with_hook(
+            hook="service/ready", app_workdir=app_workdir
+        )
 
-        def _check() -> tuple[bool, list[str]]:
-            results = app_manager.run_service_hook(
-                hook="service/ready",
-                app_workdir=app_workdir,
-            )
-            all_ready = True
-            status_lines = []
-            for service_name, ready in results.items():
-                if not ready:
-                    status_lines.append(f"{service_name} is not ready yet...")
-                    all_ready = False
-            return all_ready, status_lines
-
-        context.io.pending(
-            callback=_check,
-            label="Waiting for services...",
-            interval=2.0,
+        # Each service is checked again as soon as docker reports its
+        # container started or healthy, rather than on a fixed interval.
+        # Hooks run in manager processes, as the checks due together run
+        # concurrently.
+        waiter = ServiceReadinessWaiter(
+            checks={
+                service.name: functools.partial(
+                    app_manager.run_service_hook_in_manager,
+                    hook="service/ready",
+                    service=service,
+                    app_workdir=app_workdir,
+                )
+                for service in services
+            },
+            containers={
+                service.name: app_workdir.docker_build_long_container_name(
+                    service.name
+                )
+                for service in services
+            },
         )
+        try:
+            context.io.pending(
+                callback=waiter.poll,
+                label="Waiting for services...",
+                interval=0,
+            )
+        finally:
+            waiter.close()
 
     def _complete(previous_value=None) -> AbstractResponse:
         from wexample_app.response.suggestions_response import SuggestionsResponse
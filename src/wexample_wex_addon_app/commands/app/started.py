@@ -58,10 +58,10 @@ def app__app__started(
 
 def _check_started(app_workdir: ManagedWorkdir, mode: str, context) -> bool:
     import json
-    import subprocess
 
     from wexample_app.const.globals import WORKDIR_SETUP_DIR
 
+    from wexample_wex_addon_app.helper.docker import docker_list_running_containers
     from wexample_wex_addon_app.item.file.docker_compose_yaml_file import (
         DockerComposeYamlFile,
     )
@@ -93,12 +93,7 @@ def _check_started(app_workdir: ManagedWorkdir, mode: str, context) -> bool:
     ).read_container_names()
 
     # Check running containers
-    result = subprocess.run(
-        ["docker", "ps", "--format", "{{.Names}}"],
-        capture_output=True,
-        text=True,
-    )
-    running = {line for line in result.stdout.splitlines() if line}
+    running = {container["name"] for container in docker_list_running_containers()}
 
     any_mode = mode == APP_STARTED_CHECK_MODE_ANY_CONTAINER
     full_mode = mode == APP_STARTED_CHECK_MODE_FULL
@@ -5,18 +5,29 @@ from typing import TYPE_CHECKING
 from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
 from wexample_cli.decorator.command import command
 from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
 from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
 
 from wexample_wex_addon_app.const.tags import DomainTag
 from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_app.response.abstract_response import AbstractResponse
     from wexample_cli.context.execution_context import ExecutionContext
 
+    from wexample_wex_addon_app.app_addon_manager import AppAddonManager
     from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
 
 
+@option(
+    name="force",
+    type=bool,
+    is_flag=True,
+    required=False,
+    description="Rebuild every step, even when its inputs did not change",
+)
 @middleware(middleware=AppMiddleware)
 @command(
     type=COMMAND_TYPE_ADDON,
@@ -34,11 +45,15 @@ if TYPE_CHECKING:
 def app__config__build(
     context: ExecutionContext,
     app_workdir: ManagedWorkdir,
+    force: bool = False,
 ) -> AbstractResponse:
+    import json
     import socket
+    from pathlib import Path
 
     from wexample_app.const.globals import (
         APP_PATH_DOCKER_COMPOSE,
+        APP_PATH_LOCAL_ENV,
         APP_PATH_TMP,
         WORKDIR_SETUP_DIR,
     )
@@ -53,11 +68,39 @@ def app__config__build(
     name = app_workdir.get_project_name()
     project_name = app_workdir.get_docker_project_name(env)
     tmp_dir = app_path / APP_PATH_TMP
+    runtime_path = app_workdir.get_runtime_config_file().get_path()
+    docker_env_path = tmp_dir / "docker.env"
+    compose_runtime_path = tmp_dir / "docker-compose.runtime.yml"
+
+    # Each step records its input fingerprints and output hashes: a step whose
+    # inputs did not change and whose outputs are untouched is reused as is.
+    build_cache = app_workdir.get_config_build_cache()
+    if force:
+        build_cache.clear()
+
+    def _reuse(step: str, inputs: list, outputs: list, extra: tuple = ()) -> bool:
+        if not build_cache.is_fresh(step, inputs=inputs, outputs=outputs, extra=extra):
+            return False
+        context.io.log(f"{step}: reused, inputs unchanged")
+        return True
 
     def _runtime(previous_value=None) -> None:
+        from wexample_wex_addon_app.app_addon_manager import AppAddonManager
+
         tmp_dir.mkdir(parents=True, exist_ok=True)
 
         domains_config = app_workdir.get_domains_config()
+        host_ip = socket.gethostbyname(socket.gethostname())
+
+        app_manager = AppAddonManager.from_kernel(context.kernel)
+        services = app_manager.get_app_services(app_workdir)
+        inputs, cacheable = _runtime_inputs(
+            app_workdir=app_workdir, app_manager=app_manager, services=services
+        )
+        domains_json = json.dumps(domains_config, sort_keys=True)
+        extra = (env, name, project_name, host_ip, domains_json)
+        if cacheable and _reuse("runtime", inputs, [runtime_path], extra):
+            return
         # base provides docker.*, global.*, service.*, wex.* etc. at the correct
         # top level — these natural namespaces flatten to DOCKER_*, GLOBAL_*,
         # SERVICE_*, WEX_* for docker.env. The `app.*` subtree below is reserved
@@ -72,7 +115,7 @@ def app__config__build(
                     "env": env,
                     "name": name,
                     "project_name": project_name,
-                    "host": {"ip": socket.gethostbyname(socket.gethostname())},
+                    "host": {"ip": host_ip},
                     "started": False,
                     "path": str(app_path) + "/",
                     "setup_path": str(app_path / WORKDIR_SETUP_DIR) + "/",
@@ -81,10 +124,6 @@ def app__config__build(
             },
         )
 
-        from wexample_wex_addon_app.app_addon_manager import AppAddonManager
-
-        app_manager = AppAddonManager.from_kernel(context.kernel)
-        services = app_manager.get_app_services(app_workdir)
         for app_service in services:
             contribution = app_service.get_runtime_contribution()
             merged = dict_merge(merged, contribution)
@@ -98,20 +137,25 @@ def app__config__build(
                 merged = dict_merge(merged, hook_contribution)
 
         app_workdir.write_runtime_config(NestedConfigValue(raw=merged))
+        build_cache.record("runtime", inputs, [runtime_path], extra)
         context.io.log(f"Runtime config written ({len(services) - 1} service(s))")
 
     def _env(previous_value=None) -> None:
         from wexample_filestate.item.file.env_file import EnvFile
         from wexample_helpers.helper.dict import dict_flatten
 
+        inputs = [runtime_path, app_path / APP_PATH_LOCAL_ENV]
+        if _reuse("env", inputs, [docker_env_path]):
+            return
+
         # Load .env first (user-defined vars), runtime flattened on top (takes priority)
         dot_env = app_workdir.get_env_parameters().to_dict()
         runtime = app_workdir.get_runtime_config_file().read_config().to_dict()
         env_vars = {**dot_env, **dict_flatten(runtime)}
 
-        docker_env_path = tmp_dir / "docker.env"
         env_file = EnvFile.create_from_path(path=docker_env_path, io=context.io)
         env_file.write_config(NestedConfigValue(raw=env_vars))
+        build_cache.record("env", inputs, [docker_env_path])
         context.io.log(f"docker.env written ({len(env_vars)} variable(s))")
 
     def _docker(previous_value=None) -> None:
@@ -125,9 +169,6 @@ def app__config__build(
         # produce a label-less network that conflicts when the proxy itself
         # tries to (re)create it.
         app_manager = AppAddonManager.from_kernel(context.kernel)
-        docker_env_path = tmp_dir / "docker.env"
-        compose_runtime_path = tmp_dir / "docker-compose.runtime.yml"
-
         compose_files = []
 
         # Check if any service in this app creates the docker network (tagged "network", e.g. proxy)
@@ -177,6 +218,21 @@ def app__config__build(
             context.io.log("No docker compose files found, skipping")
             return
 
+        # Service composes are pulled through `extends: file: ${SERVICE_X_COMPOSE}`
+        # so they are inputs too, even though they are not passed with -f.
+        runtime = app_workdir.get_runtime_config_file().read_parsed() or {}
+        service_composes = [
+            Path(value)
+            for service_config in (runtime.get("service") or {}).values()
+            if isinstance(service_config, dict)
+            for key, value in service_config.items()
+            if key.startswith("compose") and isinstance(value, str)
+        ]
+        inputs = [*map(Path, compose_files), *service_composes, docker_env_path]
+        outputs = [compose_runtime_path, app_workdir.get_local_data_path("debug")]
+        if _reuse("docker", inputs, outputs, (env, project_name)):
+            return
+
         cmd = ["docker", "compose"]
         for f in compose_files:
             cmd.extend(("-f", f))
@@ -218,6 +274,7 @@ def app__config__build(
                     if source.endswith("/"):
                         host_paths_map[target + "/"] = source
         app_workdir.set_local_data("debug", {"host_paths_map": host_paths_map})
+        build_cache.record("docker", inputs, outputs, (env, project_name))
         context.io.log(f"debug.yml written ({len(host_paths_map)} path(s))")
 
     return QueuedCollectionResponse(
@@ -228,3 +285,46 @@ def app__config__build(
             _docker,
         ],
     )
+
+
+def _runtime_inputs(
+    app_workdir: ManagedWorkdir, app_manager: AppAddonManager, services: list
+) -> tuple[list[Path], bool]:
+    """Files the runtime step reads, and whether its result can be reused.
+
+    A service exposing a `runtime/contribution` hook may compute anything, so
+    its presence makes the step always run.
+    """
+    from wexample_app.const.globals import WORKDIR_SETUP_DIR
+
+    env = app_workdir.get_app_env() or ""
+    wex_dir = app_workdir.get_path() / WORKDIR_SETUP_DIR
+    paths = list(app_workdir.get_runtime_config_source_paths())
+    cacheable = True
+
+    for app_service in services:
+        if app_service.service_dir is None:
+            continue
+
+        hook_dir = app_service.service_dir / "commands" / "runtime"
+        if (hook_dir / "contribution.py").exists():
+            cacheable = False
+
+        for service_name in app_manager.get_service_inheritance_chain(app_service.name):
+            service_dir = app_manager.find_service_dir(service_name)
+            if not service_dir:
+                continue
+
+            paths.append(service_dir / "service.yml")
+            paths.append(service_dir / "app_service.py")
+            paths.append(service_dir / "env" / env / "docker" / "docker-compose.yml")
+            manifest = app_manager.get_service_manifest_raw(service_name)
+            compose_rel = manifest.get("docker", {}).get("compose")
+            if compose_rel:
+                paths.append(service_dir / compose_rel)
+
+        for rel_path in app_service.manifest.get("runtime", {}).get("bind", {}).values():
+            paths.append(wex_dir / "env" / env / rel_path)
+            paths.append(wex_dir / rel_path)
+
+    return paths, cacheable
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import json
-import subprocess
 from typing import TYPE_CHECKING, Any
 
 from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
@@ -15,6 +13,7 @@ from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
 
 if TYPE_CHECKING:
     from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_app.response.table_response import TableResponse
     from wexample_cli.context.execution_context import ExecutionContext
 
     from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
@@ -42,8 +41,8 @@ def app__container__list(
 ) -> AbstractResponse:
     from wexample_app.const.globals import WORKDIR_SETUP_DIR
     from wexample_app.response.default_response import DefaultResponse
-    from wexample_app.response.table_response import TableResponse
 
+    from wexample_wex_addon_app.helper.docker import docker_inspect_containers
     from wexample_wex_addon_app.item.file.docker_compose_yaml_file import (
         DockerComposeYamlFile,
     )
@@ -72,24 +71,35 @@ def app__container__list(
         for service_name, attrs in services.items()
     ]
 
-    inspect_by_name: dict[str, dict[str, Any]] = {}
-    result = subprocess.run(
-        ["docker", "inspect", *container_names],
-        capture_output=True,
-        text=True,
+    inspect_by_name: dict[str, dict[str, Any]] = docker_inspect_containers(
+        container_names
+    )
+
+    return _build_containers_table(
+        kernel=context.kernel,
+        services=services,
+        inspect_by_name=inspect_by_name,
+        main_service=app_workdir.get_main_service(),
+        main_db_service=app_workdir.get_main_db_service(),
+        verbose=context.io.default_context_verbosity >= VerbosityLevel.HIGH,
     )
-    if result.returncode == 0 and result.stdout.strip():
-        for item in json.loads(result.stdout):
-            inspect_by_name[item["Name"].lstrip("/")] = item
 
-    verbose = context.io.default_context_verbosity >= VerbosityLevel.HIGH
+
+def _build_containers_table(
+    kernel,
+    services: dict[str, Any],
+    inspect_by_name: dict[str, dict[str, Any]],
+    main_service: str | None,
+    main_db_service: str | None,
+    verbose: bool,
+) -> TableResponse:
+    """Render the containers of one app from already inspected containers."""
+    from wexample_app.response.table_response import TableResponse
+
     headers = ["Role", "Service", "State", "Ports"]
     if verbose:
         headers += ["Image", "Container"]
 
-    main_service = app_workdir.get_main_service()
-    main_db_service = app_workdir.get_main_db_service()
-
     rows: list[list[str]] = []
     for service_name, attrs in services.items():
         container_name = attrs.get("container_name", service_name)
@@ -114,7 +124,7 @@ def app__container__list(
         rows.append(row)
 
     return TableResponse(
-        kernel=context.kernel,
+        kernel=kernel,
         content=rows,
         headers=headers,
     )
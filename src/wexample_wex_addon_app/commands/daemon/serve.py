@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+
+if TYPE_CHECKING:
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
+
+
+@option(
+    name="asynchronous",
+    type=bool,
+    is_flag=True,
+    required=False,
+    description="Start the daemon in the background and return",
+)
+@option(
+    name="idle_timeout",
+    type=int,
+    required=False,
+    default=0,
+    description="Exit after this many seconds without request (0 = never)",
+)
+@middleware(middleware=AppMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Serve app-manager commands from a long-lived process",
+    tags=[
+        DomainTag.APP_LIFECYCLE,
+        DomainTag.PERFORMANCE,
+        EffectTag.LONG_RUNNING,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__daemon__serve(
+    context: ExecutionContext,
+    app_workdir: ManagedWorkdir,
+    asynchronous: bool = False,
+    idle_timeout: int = 0,
+) -> AbstractResponse | None:
+    import sys
+    import time
+
+    from wexample_app.response.failure_response import FailureResponse
+    from wexample_app.response.success_response import SuccessResponse
+
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    daemon = AppManagerDaemon(app_path=app_workdir.get_path())
+    socket_path = daemon.get_socket_path()
+
+    if asynchronous:
+        daemon.spawn()
+        for _ in range(20):
+            if daemon.is_enabled():
+                return SuccessResponse(
+                    kernel=context.kernel,
+                    message=f"App-manager daemon listening on {socket_path}",
+                )
+            time.sleep(0.25)
+
+        return FailureResponse(
+            kernel=context.kernel,
+            message="App-manager daemon spawned but its socket is not ready yet",
+        )
+
+    entrypoint = sys.argv[0]
+
+    def _run_argv(argv: list[str]) -> int:
+        import runpy
+
+        # Runs in a forked child: run the entry script again, as a fresh
+        # `app-manager <argv>` process would, on a kernel of its own. Only the
+        # imports are saved, the modules being loaded already.
+        sys.argv = [entrypoint, *argv]
+        runpy.run_path(entrypoint, run_name="__main__")
+        return 0
+
+    context.io.log(f"Serving app-manager commands on {socket_path}")
+    daemon.serve(run_argv=_run_argv, idle_timeout=idle_timeout)
+    return None
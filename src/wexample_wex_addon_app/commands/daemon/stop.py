@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+
+if TYPE_CHECKING:
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
+
+
+@middleware(middleware=AppMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Stop the app-manager daemon and go back to one process per command",
+    tags=[
+        DomainTag.APP_LIFECYCLE,
+        DomainTag.PERFORMANCE,
+        EffectTag.WRITE,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__daemon__stop(
+    context: ExecutionContext,
+    app_workdir: ManagedWorkdir,
+) -> AbstractResponse:
+    from wexample_app.response.success_response import SuccessResponse
+    from wexample_app.response.warning_response import WarningResponse
+
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    if not AppManagerDaemon(app_path=app_workdir.get_path()).stop():
+        return WarningResponse(
+            kernel=context.kernel, message="App-manager daemon is not running"
+        )
+
+    return SuccessResponse(kernel=context.kernel, message="App-manager daemon stopped")
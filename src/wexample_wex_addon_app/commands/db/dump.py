@@ -30,12 +30,23 @@ if TYPE_CHECKING:
     required=False,
     description="Suffix tag appended to the generated file name",
 )
+@option(
+    name="compression",
+    type=str,
+    required=False,
+    default="gzip",
+    description=(
+        "Compressor applied to the dump: gzip, zstd, zip or none. The dump is "
+        "compressed on the fly only when the DB service provides "
+        "get_db_dump_command(), after being written to a .sql file otherwise"
+    ),
+)
 @option(
     name="zip",
     type=bool,
     is_flag=True,
     required=False,
-    description="Zip the dump file (default: True)",
+    description="Deprecated, same as --compression zip",
 )
 @option(
     name="service",
@@ -62,12 +73,33 @@ def app__db__dump(
     app_workdir: ManagedWorkdir,
     file_name: str | None = None,
     tag: str | None = None,
-    zip: bool = True,
+    compression: str = "gzip",
+    zip: bool = False,
     service: str | None = None,
 ) -> AbstractResponse | str | None:
+    import time
+    from pathlib import Path
+
     from wexample_app.response.warning_response import WarningResponse
+    from wexample_helpers.helper.file import file_get_human_readable_size
     from wexample_helpers.helper.string import string_to_kebab_case
 
+    from wexample_wex_addon_app.app_addon_manager import AppAddonManager
+    from wexample_wex_addon_app.const.db import (
+        DB_DUMP_COMPRESSION_NONE,
+        DB_DUMP_COMPRESSION_SUFFIXES,
+        DB_DUMP_COMPRESSION_ZIP,
+    )
+    from wexample_wex_addon_app.helper.db_dump import (
+        db_dump_file_name,
+        db_dump_run,
+        db_dump_stream,
+    )
+
+    if zip:
+        context.io.warning("--zip is deprecated, use --compression zip")
+        compression = DB_DUMP_COMPRESSION_ZIP
+
     service_name = service or app_workdir.get_main_db_service()
     if not service_name:
         return WarningResponse(
@@ -77,11 +109,7 @@ def app__db__dump(
 
     runtime = app_workdir.get_runtime_config()
     env = runtime.search("app.env").get_str_or_default("local")
-    db_name = (
-        runtime.search(f"service.{service_name}.name").get_str_or_none()
-        or runtime.search("db.main").get_str_or_none()
-        or runtime.search("app.name").get_str()
-    )
+    db_name = app_workdir.get_db_name(service_name)
 
     if not file_name:
         from datetime import datetime
@@ -91,50 +119,101 @@ def app__db__dump(
         if tag:
             file_name += f"-{tag}"
 
-    context.io.log(f"Exporting dump: {file_name}")
+    output_name = db_dump_file_name(file_name, compression)
+    context.io.log(f"Exporting dump: {output_name}")
+
+    started = time.monotonic()
+    last_report = started
+
+    def _on_progress(read_size: int, written_size: int) -> None:
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report < 2:
+            return
+        last_report = now
+        rate = read_size / max(now - started, 1e-6)
+        context.io.log(
+            f"{file_get_human_readable_size(read_size)} dumped, "
+            f"{file_get_human_readable_size(written_size)} written "
+            f"({file_get_human_readable_size(int(rate))}/s)"
+        )
 
-    request = context.kernel._get_command_request_class()(
-        kernel=context.kernel,
-        name=f"@{string_to_kebab_case(service_name)}::db/dump",
-        arguments={
-            "app_path": str(app_workdir.get_path()),
-            "file_name": file_name,
-        },
+    app_manager = AppAddonManager.from_kernel(context.kernel)
+    dump_cmd = app_manager.get_app_service(
+        service_name, app_workdir
+    ).get_db_dump_command(db_name)
+
+    if dump_cmd:
+        # The service streams SQL on stdout: compress it on the fly, no
+        # intermediate .sql file ever hits the disk.
+        dump_dir = app_workdir.get_db_dumps_dir(service_name)
+        dump_dir.mkdir(parents=True, exist_ok=True)
+        output_path = dump_dir / output_name
+
+        context.io.command(command=dump_cmd)
+        read_size, written_size = db_dump_run(
+            dump_cmd,
+            target=output_path,
+            compression=compression,
+            on_progress=_on_progress,
+        )
+    else:
+        request = context.kernel._get_command_request_class()(
+            kernel=context.kernel,
+            name=f"@{string_to_kebab_case(service_name)}::db/dump",
+            arguments={
+                "app_path": str(app_workdir.get_path()),
+                "file_name": file_name,
+            },
+        )
+        response = context.kernel.execute_kernel_command(request)
+        dump_path_str = getattr(response, "content", None)
+
+        if not dump_path_str:
+            return None
+
+        dump_path = Path(dump_path_str)
+
+        if not dump_path.exists():
+            raise RuntimeError(f"Dump file not found: {dump_path}")
+
+        dump_dir = dump_path.parent
+        output_path = dump_dir / output_name
+
+        if compression == DB_DUMP_COMPRESSION_NONE:
+            output_path = dump_path
+            read_size = written_size = dump_path.stat().st_size
+        else:
+            context.io.log(f"Compressing with {compression}")
+            with dump_path.open("rb") as source:
+                read_size, written_size = db_dump_stream(
+                    source,
+                    target=output_path,
+                    compression=compression,
+                    on_progress=_on_progress,
+                )
+            dump_path.unlink()
+
+    elapsed = max(time.monotonic() - started, 1e-6)
+    context.io.log(
+        f"Dump written: {output_path.name} "
+        f"({file_get_human_readable_size(read_size)} of SQL, "
+        f"{file_get_human_readable_size(written_size)} on disk, "
+        f"{file_get_human_readable_size(int(read_size / elapsed))}/s)"
     )
-    response = context.kernel.execute_kernel_command(request)
-    dump_path_str = getattr(response, "content", None)
-
-    if not dump_path_str:
-        return None
 
-    from pathlib import Path
-
-    dump_path = Path(dump_path_str)
-
-    if not dump_path.exists():
-        raise RuntimeError(f"Dump file not found: {dump_path}")
-
-    output_path = dump_path
-    dump_dir = dump_path.parent
-
-    if zip:
-        import zipfile as _zipfile
-
-        context.io.log("Creating zip file")
-        zip_path = dump_path.with_suffix(".sql.zip")
-        with _zipfile.ZipFile(zip_path, "w", _zipfile.ZIP_DEFLATED) as zf:
-            zf.write(dump_path, dump_path.name)
-        dump_path.unlink()
-        output_path = zip_path
-
-        zip_symlink = dump_dir / "db.latest.zip"
-        if zip_symlink.is_symlink():
-            zip_symlink.unlink()
-        zip_symlink.symlink_to(zip_path.name)
-
-    symlink = dump_dir / "db.latest"
-    if symlink.is_symlink():
-        symlink.unlink()
-    symlink.symlink_to(output_path.name)
+    # db.latest always points to the last dump; compressed dumps also get a
+    # db.latest.<ext> link (db.latest.zip, ...) so tools can tell the format
+    # from the name.
+    link_names = ["db.latest"]
+    suffix = DB_DUMP_COMPRESSION_SUFFIXES[compression]
+    if suffix:
+        link_names.append(f"db.latest{suffix}")
+
+    for link_name in link_names:
+        symlink = dump_dir / link_name
+        if symlink.is_symlink():
+            symlink.unlink()
+        symlink.symlink_to(output_path.name)
 
     return str(output_path)
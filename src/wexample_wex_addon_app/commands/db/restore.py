@@ -58,27 +58,33 @@ def app__db__restore(
     database: str | None = None,
     service: str | None = None,
 ) -> AbstractResponse | None:
-    import zipfile
+    import time
     from pathlib import Path
 
-    from wexample_app.const.globals import WORKDIR_SETUP_DIR
     from wexample_app.response.success_response import SuccessResponse
+    from wexample_helpers.helper.file import file_get_human_readable_size
     from wexample_helpers.helper.string import string_to_kebab_case
 
+    from wexample_wex_addon_app.app_addon_manager import AppAddonManager
+    from wexample_wex_addon_app.helper.db_dump import (
+        db_dump_extract,
+        db_dump_restore,
+    )
+
     service_name = service or app_workdir.get_main_db_service()
     if not service_name:
         raise RuntimeError("No DB service configured (docker.db.main)")
 
-    dumps_dir = app_workdir.get_path() / WORKDIR_SETUP_DIR / service_name / "dumps"
+    dumps_dir = app_workdir.get_db_dumps_dir(service_name)
     dumps_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build ordered map of available dumps (zip + sql, excluding symlinks)
+    # Build ordered map of available dumps (archives + sql, excluding symlinks)
     dump_map = {
         p.name: p
         for p in sorted(
             (
                 p
-                for pattern in ("*.zip", "*.sql")
+                for pattern in ("*.zip", "*.gz", "*.zst", "*.sql")
                 for p in dumps_dir.glob(pattern)
                 if not p.is_symlink()
             ),
@@ -108,24 +114,16 @@ def app__db__restore(
     if not resolved.exists():
         raise RuntimeError(f"Dump file not found: {resolved}")
 
-    is_zip = resolved.suffix == ".zip"
-    sql_path = resolved
-
-    if is_zip:
-        context.io.log("Unpacking...")
-        with zipfile.ZipFile(resolved, "r") as zf:
-            names = zf.namelist()
-            if not names:
-                raise RuntimeError("Zip file is empty")
-            zf.extractall(dumps_dir)
-            sql_path = dumps_dir / names[0]
-        context.io.log(f"Extracted: {sql_path.name}")
-
     app_path = str(app_workdir.get_path())
     extra = {"database": database} if database else {}
     cmd_request_cls = context.kernel._get_command_request_class()
     service_slug = string_to_kebab_case(service_name)
 
+    app_manager = AppAddonManager.from_kernel(context.kernel)
+    restore_cmd = app_manager.get_app_service(
+        service_name, app_workdir
+    ).get_db_restore_command(database or app_workdir.get_db_name(service_name))
+
     # Destroy + recreate DB
     context.io.log("Restoring...")
     context.kernel.execute_kernel_command(
@@ -136,18 +134,56 @@ def app__db__restore(
         )
     )
 
-    # Restore from SQL file
-    context.kernel.execute_kernel_command(
-        cmd_request_cls(
-            kernel=context.kernel,
-            name=f"@{service_slug}::db/restore",
-            arguments={"app_path": app_path, "file_name": sql_path.name, **extra},
+    if restore_cmd:
+        # Decompress on the fly into the service client: nothing is extracted.
+        started = time.monotonic()
+        last_report = started
+
+        def _on_progress(sent: int, consumed: int, total: int) -> None:
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report < 2:
+                return
+            last_report = now
+            percent = consumed * 100 // total if total else 100
+            rate = sent / max(now - started, 1e-6)
+            context.io.log(
+                f"{percent}% of {resolved.name}, "
+                f"{file_get_human_readable_size(sent)} restored "
+                f"({file_get_human_readable_size(int(rate))}/s)"
+            )
+
+        context.io.command(command=restore_cmd)
+        sent = db_dump_restore(restore_cmd, source=resolved, on_progress=_on_progress)
+        elapsed = max(time.monotonic() - started, 1e-6)
+        context.io.log(
+            f"{file_get_human_readable_size(sent)} restored in {elapsed:.1f}s "
+            f"({file_get_human_readable_size(int(sent / elapsed))}/s)"
         )
-    )
-
-    # Clean up extracted SQL if it came from a zip
-    if is_zip and sql_path.exists():
-        sql_path.unlink()
+    else:
+        # The service restores from a file: decompress archives next to the
+        # dumps first, and drop the extracted copy once restored.
+        sql_path = resolved
+        if resolved.suffix in (".zip", ".gz", ".zst"):
+            context.io.log("Unpacking...")
+            sql_path = db_dump_extract(resolved, dumps_dir)
+            context.io.log(f"Extracted: {sql_path.name}")
+
+        try:
+            context.kernel.execute_kernel_command(
+                cmd_request_cls(
+                    kernel=context.kernel,
+                    name=f"@{service_slug}::db/restore",
+                    arguments={
+                        "app_path": app_path,
+                        "file_name": sql_path.name,
+                        **extra,
+                    },
+                )
+            )
+        finally:
+            if sql_path != resolved:
+                sql_path.unlink(missing_ok=True)
 
     return SuccessResponse(
         kernel=context.kernel,
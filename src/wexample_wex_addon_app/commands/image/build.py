@@ -38,6 +38,21 @@ if TYPE_CHECKING:
     required=False,
     description="Skip transitive dependencies; build only the named image",
 )
+@option(
+    name="workers",
+    type=int,
+    required=False,
+    default=1,
+    description="Number of images built in parallel, following depends_on",
+)
+@option(
+    name="cached",
+    type=bool,
+    is_flag=True,
+    required=False,
+    description="Use the docker layer cache and skip images whose Dockerfile "
+    "and context did not change",
+)
 @middleware(middleware=AppMiddleware)
 @command(
     type=COMMAND_TYPE_ADDON,
@@ -59,6 +74,8 @@ def app__image__build(
     name: str | None = None,
     all: bool = False,
     no_deps: bool = False,
+    workers: int = 1,
+    cached: bool = False,
 ) -> AbstractResponse:
     from wexample_app.response.interactive_shell_command_response import (
         InteractiveShellCommandResponse,
@@ -68,6 +85,7 @@ def app__image__build(
     )
 
     from wexample_wex_addon_app.helper.image_builds import (
+        build_command,
         load_builds,
         resolve_build_order,
     )
@@ -88,30 +106,118 @@ def app__image__build(
     else:
         ordered = resolve_build_order(builds, name if not all else None)
 
-    str_app_path = str(app_path)
+    if cached or workers > 1:
+
+        def _build(previous_value=None) -> None:
+            _build_graph(
+                context=context,
+                app_workdir=app_workdir,
+                builds=builds,
+                ordered=ordered,
+                workers=workers,
+                cached=cached,
+            )
+
+        return QueuedCollectionResponse(kernel=context.kernel, content=[_build])
+
     steps = []
     for build_name in ordered:
-        build = builds[build_name]
-        dockerfile = str(app_path / build["dockerfile"])
-        tag = build["tag"]
-
-        build_args = build.get("build_args") or {}
+        cmd = build_command(app_path, builds[build_name])
 
         def _step(
             previous_value=None,
-            _dockerfile=dockerfile,
-            _tag=tag,
+            _cmd=cmd,
+            _tag=builds[build_name]["tag"],
             _build_name=build_name,
-            _build_args=build_args,
-            _str_app_path=str_app_path,
         ) -> InteractiveShellCommandResponse:
             context.io.log(f"Building image: {_build_name} → {_tag}")
-            cmd = ["docker", "build", "--no-cache", "-f", _dockerfile, "-t", _tag]
-            for key, value in _build_args.items():
-                cmd.extend(["--build-arg", f"{key}={value}"])
-            cmd.append(_str_app_path)
-            return InteractiveShellCommandResponse(kernel=context.kernel, content=cmd)
+            return InteractiveShellCommandResponse(kernel=context.kernel, content=_cmd)
 
         steps.append(_step)
 
     return QueuedCollectionResponse(kernel=context.kernel, content=steps)
+
+
+def _build_graph(
+    context: ExecutionContext,
+    app_workdir: ManagedWorkdir,
+    builds: dict,
+    ordered: list[str],
+    workers: int,
+    cached: bool,
+) -> None:
+    """Build images concurrently once their `depends_on` image is built.
+
+    In cached mode, an image is skipped when it still exists locally and its
+    Dockerfile, context and build args did not change since its last build,
+    unless the image it depends on is being rebuilt.
+    """
+    from wexample_helpers.helper.shell import shell_run
+
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+    from wexample_wex_addon_app.helper.docker import docker_list_image_tags
+    from wexample_wex_addon_app.helper.image_builds import (
+        build_command,
+        build_inputs,
+        build_tag_reference,
+    )
+
+    app_path = app_workdir.get_path()
+    build_cache = app_workdir.get_image_build_cache()
+    inputs: dict[str, tuple] = {}
+
+    stale = list(ordered)
+    if cached:
+        inputs = {name: build_inputs(app_path, builds[name]) for name in ordered}
+        existing = docker_list_image_tags()
+        stale = []
+        for build_name in ordered:
+            build = builds[build_name]
+            files, extra = inputs[build_name]
+            if (
+                build.get("depends_on") in stale
+                or build_tag_reference(build["tag"]) not in existing
+                or not build_cache.is_fresh(build_name, files, [], extra)
+            ):
+                stale.append(build_name)
+            else:
+                context.io.log(f"Image up to date: {build_name} → {build['tag']}")
+
+    if not stale:
+        return
+
+    context.io.log(f"Building {len(stale)} image(s) with {workers} worker(s)")
+
+    def _run(build_name: str):
+        cmd = build_command(app_path, builds[build_name], no_cache=not cached)
+        if workers <= 1:
+            tag = builds[build_name]["tag"]
+            context.io.log(f"Building image: {build_name} → {tag}")
+        return shell_run(cmd, cwd=app_path, inherit_stdio=workers <= 1)
+
+    def _on_done(build_name: str, result, error: BaseException | None) -> None:
+        if workers > 1:
+            context.io.log(f"Image {build_name} → {builds[build_name]['tag']}")
+            source = error if error is not None else result
+            outputs = (getattr(source, "stdout", None), getattr(source, "stderr", None))
+            for output in outputs:
+                for line in (output or "").splitlines():
+                    context.io.log(f"[{build_name}] {line}", indentation=1)
+
+        if error is not None:
+            context.io.log(f"Image {build_name} failed")
+        elif cached:
+            files, extra = inputs[build_name]
+            build_cache.record(build_name, files, [], extra)
+
+    failures = dependency_graph_run(
+        dependencies={
+            name: [builds[name]["depends_on"]] if builds[name].get("depends_on") else []
+            for name in stale
+        },
+        fn=_run,
+        max_workers=workers,
+        on_done=_on_done,
+    )
+    if failures:
+        raise next(iter(failures.values()))
@@ -5,33 +5,103 @@ from typing import TYPE_CHECKING
 from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
 from wexample_cli.decorator.command import command
 from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
 from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
 
 from wexample_wex_addon_app.const.tags import DomainTag
 from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wexample_app.response.abstract_response import AbstractResponse
     from wexample_cli.context.execution_context import ExecutionContext
 
 
+@option(
+    name="compare",
+    type=str,
+    required=False,
+    default=None,
+    description=(
+        "Compare with the last recorded run of a git ref, "
+        'or with the baseline run when set to "baseline"'
+    ),
+)
+@option(
+    name="fail_on_regression",
+    type=float,
+    required=False,
+    default=None,
+    description=(
+        "Fail when a benchmark median regressed significantly by at least "
+        "this percentage (compares with the baseline unless --compare is set)"
+    ),
+)
+@option(
+    name="allow_missing_baseline",
+    type=bool,
+    is_flag=True,
+    required=False,
+    default=False,
+    description=(
+        "With --fail-on-regression, only warn when there is no recorded run "
+        "to compare with"
+    ),
+)
+@option(
+    name="baseline",
+    type=bool,
+    is_flag=True,
+    required=False,
+    default=False,
+    description="Record this run as the baseline of later comparisons",
+)
 @middleware(middleware=AppMiddleware)
 @command(
     type=COMMAND_TYPE_ADDON,
-    description="Run performance benchmarks and display a report. Python only (requires pytest-benchmark tests).",
+    description=(
+        "Run performance benchmarks, record them in the local history and "
+        "display a report. Python only (requires pytest-benchmark tests)."
+    ),
     tags=[
         DomainTag.APP_LIFECYCLE,
         DomainTag.PERFORMANCE,
-        EffectTag.READ_ONLY,
+        EffectTag.WRITE,
         AudienceTag.AGENT_SAFE,
         ScopeTag.APP,
         ScopeTag.LOCAL,
     ],
 )
-def app__performance__report(context: ExecutionContext, app_workdir: AppMiddleware):
+def app__performance__report(
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    compare: str | None = None,
+    fail_on_regression: float | None = None,
+    allow_missing_baseline: bool = False,
+    baseline: bool = False,
+) -> AbstractResponse:
+    from datetime import datetime, timezone
+
+    from wexample_app.const.globals import WORKDIR_LOCAL_DIR_NAME, WORKDIR_SETUP_DIR
     from wexample_app.response.failure_response import FailureResponse
+    from wexample_app.response.multiple_response import MultipleResponse
     from wexample_app.response.properties_response import PropertiesResponse
     from wexample_app.response.warning_response import WarningResponse
 
+    from wexample_wex_addon_app.const.path import APP_FILE_BENCHMARK_HISTORY
+    from wexample_wex_addon_app.exception.performance_regression_exception import (
+        PerformanceRegressionException,
+    )
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        BENCHMARK_HISTORY_BASELINE,
+        BENCHMARK_HISTORY_MIN_CHANGE_PCT,
+        benchmark_history_append,
+        benchmark_history_compare,
+        benchmark_history_find_run,
+        benchmark_history_machine_fingerprint,
+        benchmark_history_read,
+    )
     from wexample_wex_addon_app.workdir.mixin.abstract_profiling_workdir_mixin import (
         AbstractProfilingWorkdirMixin,
     )
@@ -57,17 +127,150 @@ def app__performance__report(context: ExecutionContext, app_workdir: AppMiddlewa
             kernel=context.kernel, message="No benchmark results found."
         )
 
-    return PropertiesResponse(
-        kernel=context.kernel,
-        title=f"Performance Report ({result['language']} / {result['tool']})",
-        properties={
-            entry["name"]: (
-                f"median={entry['median_ms']}ms  "
-                f"mean={entry['mean_ms']}ms  "
-                f"min={entry['min_ms']}ms  "
-                f"max={entry['max_ms']}ms  "
-                f"({entry['rounds']} rounds)"
-            )
-            for entry in entries
+    app_path = app_workdir.get_path()
+    history_path = (
+        app_path / WORKDIR_SETUP_DIR / WORKDIR_LOCAL_DIR_NAME
+    ) / APP_FILE_BENCHMARK_HISTORY
+    history = benchmark_history_read(history_path)
+    machine = benchmark_history_machine_fingerprint()
+
+    benchmark_history_append(
+        history_path,
+        {
+            "baseline": baseline,
+            "commit": _resolve_commit(app_path, "HEAD"),
+            "entries": entries,
+            "language": result["language"],
+            "machine": machine,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "tool": result["tool"],
         },
     )
+
+    report_title = f"Performance Report ({result['language']} / {result['tool']})"
+    report = {
+        entry["name"]: (
+            f"median={entry['median_ms']}ms  "
+            f"mean={entry['mean_ms']}ms  "
+            f"min={entry['min_ms']}ms  "
+            f"max={entry['max_ms']}ms  "
+            f"({entry['rounds']} rounds)"
+        )
+        for entry in entries
+    }
+    responses: list[AbstractResponse] = [
+        PropertiesResponse(kernel=context.kernel, title=report_title, properties=report)
+    ]
+
+    if compare is None and fail_on_regression is not None:
+        compare = BENCHMARK_HISTORY_BASELINE
+    if compare is None:
+        return responses[0]
+
+    if compare == BENCHMARK_HISTORY_BASELINE:
+        reference = benchmark_history_find_run(history, baseline=True, machine=machine)
+    else:
+        commit = _resolve_commit(app_path, compare)
+        reference = (
+            benchmark_history_find_run(history, commit=commit, machine=machine)
+            if commit
+            else None
+        )
+
+    if reference is None:
+        if fail_on_regression is not None and not allow_missing_baseline:
+            from wexample_app.exception.app_runtime_exception import (
+                AppRuntimeException,
+            )
+
+            # A gate without reference would pass whatever the timings are.
+            context.io.properties(properties=report, title=report_title)
+            raise AppRuntimeException(
+                message=(
+                    f"No recorded run to compare with for {compare!r}: record one "
+                    "with --baseline, or pass --allow-missing-baseline. This run "
+                    f"is recorded in {history_path}."
+                )
+            )
+        responses.append(
+            WarningResponse(
+                kernel=context.kernel,
+                message=(
+                    f"No recorded run to compare with for {compare!r}, "
+                    f"this run is recorded in {history_path}."
+                ),
+            )
+        )
+        return MultipleResponse(kernel=context.kernel, responses=responses)
+
+    if reference.get("machine") != machine:
+        responses.append(
+            WarningResponse(
+                kernel=context.kernel,
+                message=(
+                    "The compared run was recorded on another machine, "
+                    "timings may differ for reasons unrelated to the code."
+                ),
+            )
+        )
+
+    threshold = (
+        fail_on_regression
+        if fail_on_regression is not None
+        else BENCHMARK_HISTORY_MIN_CHANGE_PCT
+    )
+    comparison = benchmark_history_compare(
+        reference.get("entries") or [], entries, threshold_pct=threshold
+    )
+    comparison_title = (
+        f"Comparison with {compare} "
+        f"({str(reference.get('commit') or '?')[:12]}, "
+        f"{reference.get('timestamp', '?')})"
+    )
+    changes = {item["name"]: _format_change(item) for item in comparison}
+
+    regressions = [
+        item["name"] for item in comparison if item["status"] == "regression"
+    ]
+    if fail_on_regression is not None and regressions:
+        # Exit with an error, for CI gates, once the figures are shown.
+        context.io.properties(properties=report, title=report_title)
+        context.io.properties(properties=changes, title=comparison_title)
+        raise PerformanceRegressionException(
+            benchmark_names=regressions,
+            reference=compare,
+            threshold_pct=fail_on_regression,
+        )
+
+    responses.append(
+        PropertiesResponse(
+            kernel=context.kernel, title=comparison_title, properties=changes
+        )
+    )
+    return MultipleResponse(kernel=context.kernel, responses=responses)
+
+
+def _format_change(item: dict) -> str:
+    if item["status"] == "new":
+        return f"{item['current_ms']}ms  (new)"
+    return (
+        f"{item['baseline_ms']}ms -> {item['current_ms']}ms  "
+        f"({item['change_pct']:+.1f}%, {item['status']})"
+    )
+
+
+def _resolve_commit(path: Path, ref: str) -> str | None:
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
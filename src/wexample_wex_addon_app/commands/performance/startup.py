@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
+
+
+@option(
+    name="rounds",
+    type=int,
+    required=False,
+    default=5,
+    description="Number of timed runs per measure",
+)
+@middleware(middleware=AppMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description=(
+        "Measure the command registry scans run at CLI startup, "
+        "with and without the command index"
+    ),
+    tags=[
+        DomainTag.APP_LIFECYCLE,
+        DomainTag.PERFORMANCE,
+        EffectTag.READ_ONLY,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__performance__startup(
+    context: ExecutionContext,
+    app_workdir: ManagedWorkdir,
+    rounds: int = 5,
+) -> AbstractResponse:
+    import tempfile
+    from pathlib import Path
+
+    from wexample_app.response.properties_response import PropertiesResponse
+
+    from wexample_wex_addon_app.common.command_index import CommandIndex
+    from wexample_wex_addon_app.resolver.app_command_resolver import (
+        AppCommandResolver,
+    )
+    from wexample_wex_addon_app.resolver.service_command_resolver import (
+        ServiceCommandResolver,
+    )
+
+    rounds = max(1, rounds)
+    properties: dict[str, str] = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path = Path(tmp_dir) / "command.index.json"
+
+        for resolver in context.kernel.get_resolvers().values():
+            if isinstance(resolver, AppCommandResolver):
+                label = "App commands"
+                base = resolver.get_base_path()
+                targets = [(base / "commands", "app")] if base else []
+            elif isinstance(resolver, ServiceCommandResolver):
+                label = "Service commands"
+                targets = _service_targets(context)
+            else:
+                continue
+
+            if not targets:
+                continue
+
+            def _full_scan(resolver=resolver, targets=targets) -> None:
+                for commands_base, addon_name in targets:
+                    resolver._scan_commands_dir(commands_base, addon_name)
+
+            def _indexed_scan(resolver=resolver, targets=targets) -> None:
+                index = CommandIndex(path=index_path)
+                for commands_base, addon_name in targets:
+                    index.scan(resolver, commands_base, addon_name)
+                index.save()
+
+            index_path.unlink(missing_ok=True)
+            # Fills the index, so the timed indexed runs all hit it.
+            _indexed_scan()
+
+            full_ms = _median_ms(_full_scan, rounds)
+            indexed_ms = _median_ms(_indexed_scan, rounds)
+            speedup = full_ms / indexed_ms if indexed_ms else 0
+            properties[label] = (
+                f"full scan={full_ms:.1f}ms  "
+                f"indexed={indexed_ms:.1f}ms  "
+                f"(x{speedup:.1f}, {len(targets)} dirs, {rounds} rounds)"
+            )
+
+    return PropertiesResponse(
+        kernel=context.kernel,
+        title="Startup registry scans (median)",
+        properties=properties,
+    )
+
+
+def _median_ms(callback: Callable[[], None], rounds: int) -> float:
+    import statistics
+    import time
+
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        callback()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def _service_targets(context: ExecutionContext) -> list[tuple]:
+    # Same directories as ServiceCommandResolver.build_registry_data().
+    targets = []
+    for addon in context.kernel.get_addons().values():
+        services_base = addon.workdir.get_path() / "services"
+        if not services_base.is_dir():
+            continue
+        for service_dir in sorted(services_base.iterdir()):
+            if service_dir.is_dir() and not service_dir.name.startswith("_"):
+                targets.append((service_dir / "commands", service_dir.name))
+    return targets
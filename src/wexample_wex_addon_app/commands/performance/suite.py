@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.package_suite_middleware import (
+    PackageSuiteMiddleware,
+)
+
+if TYPE_CHECKING:
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.framework_packages_suite_workdir import (
+        FrameworkPackageSuiteWorkdir,
+    )
+
+# Sort keys of the table, the default one first.
+_SORT_KEYS = ("median", "package", "benchmark")
+
+
+@option(
+    name="jobs",
+    type=int,
+    required=False,
+    default=1,
+    description=(
+        "Number of packages benchmarked in parallel. Concurrent benchmarks "
+        "share the CPU, keep 1 for timings comparable between runs."
+    ),
+)
+@option(
+    name="sort",
+    type=str,
+    required=False,
+    default="median",
+    description=(
+        'Table order: "median" (slowest first), "package" or "benchmark"'
+    ),
+)
+@option(
+    name="export",
+    type=str,
+    required=False,
+    default=None,
+    description="Also write the results to this JSON file",
+)
+@middleware(middleware=PackageSuiteMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description=(
+        "Run the benchmarks of every package of the suite and display them "
+        "in one table. Python only (requires pytest-benchmark tests)."
+    ),
+    tags=[
+        DomainTag.PACKAGE,
+        DomainTag.PERFORMANCE,
+        EffectTag.WRITE,
+        EffectTag.LONG_RUNNING,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__performance__suite(
+    context: ExecutionContext,
+    app_workdir: FrameworkPackageSuiteWorkdir,
+    jobs: int = 1,
+    sort: str = "median",
+    export: str | None = None,
+) -> AbstractResponse:
+    import json
+    from datetime import datetime, timezone
+    from pathlib import Path
+
+    from wexample_app.response.failure_response import FailureResponse
+    from wexample_app.response.multiple_response import MultipleResponse
+    from wexample_app.response.table_response import TableResponse
+    from wexample_app.response.warning_response import WarningResponse
+    from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+    if sort not in _SORT_KEYS:
+        return FailureResponse(
+            kernel=context.kernel,
+            message=f"Unknown sort {sort!r}, expected one of: {', '.join(_SORT_KEYS)}",
+        )
+
+    result = app_workdir.packages_run_profiling(jobs=jobs)
+    entries = result["entries"]
+    errors = result["errors"]
+
+    if sort == "median":
+        entries.sort(key=lambda entry: -float(entry["median_ms"]))
+    elif sort == "package":
+        entries.sort(key=lambda entry: (entry["package"], entry["name"]))
+    else:
+        entries.sort(key=lambda entry: (entry["name"], entry["package"]))
+
+    if export:
+        export_path = Path(export)
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        export_path.write_text(
+            json.dumps(
+                {
+                    "suite": app_workdir.get_project_name(),
+                    "timestamp": datetime.now(timezone.utc).isoformat(
+                        timespec="seconds"
+                    ),
+                    "jobs": jobs,
+                    "entries": entries,
+                    "errors": errors,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        file_chown_as_real_user_if_elevated(export_path)
+
+    responses: list[AbstractResponse] = [
+        WarningResponse(
+            kernel=context.kernel,
+            message=f"Benchmarks of {package_name} failed: {error}",
+        )
+        for package_name, error in errors.items()
+    ]
+
+    if not entries:
+        responses.append(
+            WarningResponse(
+                kernel=context.kernel, message="No benchmark results found."
+            )
+        )
+        return MultipleResponse(kernel=context.kernel, responses=responses)
+
+    responses.insert(
+        0,
+        TableResponse(
+            kernel=context.kernel,
+            content=[
+                [
+                    entry["package"],
+                    entry["name"],
+                    f"{entry['median_ms']}ms",
+                    f"{entry['mean_ms']}ms",
+                    f"{entry['min_ms']}ms",
+                    f"{entry['max_ms']}ms",
+                    str(entry["rounds"]),
+                ]
+                for entry in entries
+            ],
+            headers=["PACKAGE", "BENCHMARK", "MEDIAN", "MEAN", "MIN", "MAX", "ROUNDS"],
+        ),
+    )
+    return MultipleResponse(kernel=context.kernel, responses=responses)
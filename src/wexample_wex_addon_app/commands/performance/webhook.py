@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.option import option
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+
+@option(
+    name="apps",
+    type=int,
+    required=False,
+    default=50,
+    description="Number of fake apps holding a tokens file",
+)
+@option(
+    name="requests",
+    type=int,
+    required=False,
+    default=5000,
+    description="Number of token lookups per measure",
+)
+@option(
+    name="threads",
+    type=int,
+    required=False,
+    default=8,
+    description="Number of concurrent lookup threads, as in the webhook server",
+)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description=(
+        "Measure the webhook token lookup cost per request under concurrent "
+        "load, parsing the tokens file on each request or using the token index"
+    ),
+    tags=[
+        DomainTag.PERFORMANCE,
+        DomainTag.WEBHOOK,
+        EffectTag.READ_ONLY,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__performance__webhook(
+    context: ExecutionContext,
+    apps: int = 50,
+    requests: int = 5000,
+    threads: int = 8,
+) -> AbstractResponse:
+    import tempfile
+    from pathlib import Path
+
+    from wexample_app.response.properties_response import PropertiesResponse
+
+    from wexample_wex_addon_app.common.webhook_token_index import WebhookTokenIndex
+
+    apps = max(1, apps)
+    requests = max(1, requests)
+    threads = max(1, threads)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = Path(tmp_dir)
+        lookups = _create_apps(base, apps)
+        index = WebhookTokenIndex(apps_base_path=base)
+
+        def _parsed(env: str, app_name: str, command_str: str) -> str | None:
+            return _parse_token(base, env, app_name, command_str)
+
+        measures = {
+            "Parse per request": _parsed,
+            "Token index": index.get_token,
+        }
+        properties: dict[str, str] = {}
+        for label, lookup in measures.items():
+            # Warm up: imports, and the index filled as after the first requests.
+            for env, app_name, command_str in lookups:
+                lookup(env, app_name, command_str)
+
+            wall, latencies, missed = _run_concurrently(
+                lookup, lookups, requests, threads
+            )
+            properties[label] = (
+                f"median={_percentile(latencies, 50):.1f}µs  "
+                f"p95={_percentile(latencies, 95):.1f}µs  "
+                f"throughput={requests / wall:.0f} req/s  "
+                f"missed={missed}"
+            )
+
+    return PropertiesResponse(
+        kernel=context.kernel,
+        title=(
+            f"Webhook token lookup ({requests} requests, {threads} threads, "
+            f"{apps} apps)"
+        ),
+        properties=properties,
+    )
+
+
+def _create_apps(base: Path, apps: int) -> list[tuple[str, str, str]]:
+    from wexample_app.const.globals import WORKDIR_LOCAL_DIR_NAME, WORKDIR_SETUP_DIR
+
+    from wexample_wex_addon_app.common.webhook_token_index import (
+        WEBHOOK_TOKENS_FILE_NAME,
+    )
+
+    lookups = []
+    for number in range(apps):
+        env = ("prod", "staging")[number % 2]
+        app_name = f"app-{number}"
+        local_dir = base / env / app_name / WORKDIR_SETUP_DIR / WORKDIR_LOCAL_DIR_NAME
+        local_dir.mkdir(parents=True)
+        commands = [f".wex/webhook/command-{position}" for position in range(10)]
+        (local_dir / WEBHOOK_TOKENS_FILE_NAME).write_text(
+            "".join(
+                f"{command_str}: {number:04d}{position:04d}{'x' * 32}\n"
+                for position, command_str in enumerate(commands)
+            )
+        )
+        lookups.append((env, app_name, commands[number % len(commands)]))
+    return lookups
+
+
+def _parse_token(base: Path, env: str, app_name: str, command_str: str) -> str | None:
+    # The lookup done by the resolver before the token index.
+    from wexample_app.const.globals import WORKDIR_LOCAL_DIR_NAME, WORKDIR_SETUP_DIR
+
+    from wexample_wex_addon_app.common.webhook_token_index import (
+        WEBHOOK_TOKENS_FILE_NAME,
+    )
+    from wexample_wex_addon_app.item.file.webhook_tokens_yaml_file import (
+        WebhookTokensYamlFile,
+    )
+
+    token_file = (
+        base / env / app_name / WORKDIR_SETUP_DIR / WORKDIR_LOCAL_DIR_NAME
+    ) / WEBHOOK_TOKENS_FILE_NAME
+    if not token_file.exists():
+        return None
+    return WebhookTokensYamlFile.create_from_path(path=token_file).get_token(
+        command_str
+    )
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+def _run_concurrently(
+    lookup: Callable[[str, str, str], str | None],
+    lookups: list[tuple[str, str, str]],
+    requests: int,
+    threads: int,
+) -> tuple[float, list[float], int]:
+    """Spread the lookups over threads.
+
+    Returns the wall seconds, the µs of each lookup, and the count of lookups
+    that found no token although every fake app defines one.
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _worker(offset: int) -> tuple[list[float], int]:
+        latencies = []
+        missed = 0
+        for position in range(offset, requests, threads):
+            env, app_name, command_str = lookups[position % len(lookups)]
+            start = time.perf_counter()
+            token = lookup(env, app_name, command_str)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+            missed += token is None
+        return latencies, missed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(_worker, range(threads)))
+    wall = time.perf_counter() - start
+
+    return (
+        wall,
+        [latency for latencies, _ in results for latency in latencies],
+        sum(missed for _, missed in results),
+    )
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.as_sudo import as_sudo
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_cli.decorator.option import option
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.package_suite_middleware import (
+    PackageSuiteMiddleware,
+)
+
+if TYPE_CHECKING:
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.framework_packages_suite_workdir import (
+        FrameworkPackageSuiteWorkdir,
+    )
+
+
+@option(name="force", type=bool, default=False, is_flag=True)
+@option(
+    name="skip_test",
+    type=bool,
+    default=False,
+    is_flag=True,
+    description="Skip the test phase before publishing.",
+)
+@option(
+    name="jobs",
+    type=int,
+    required=False,
+    default=1,
+    description=(
+        "Number of packages to release in parallel, following the dependency "
+        "graph. Packages must have their publication strategy configured."
+    ),
+)
+@as_sudo()
+@middleware(middleware=PackageSuiteMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Publish every changed package of the suite, dependencies first.",
+    tags=[
+        DomainTag.APP_LIFECYCLE,
+        DomainTag.DEPLOY,
+        DomainTag.GIT,
+        DomainTag.PACKAGE,
+        DomainTag.RELEASE,
+        EffectTag.WRITE,
+        EffectTag.LONG_RUNNING,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__release__packages(
+    context: ExecutionContext,
+    app_workdir: FrameworkPackageSuiteWorkdir,
+    force: bool = False,
+    skip_test: bool = False,
+    jobs: int = 1,
+) -> None:
+    app_workdir.packages_release(force=force, skip_test=skip_test, jobs=jobs)
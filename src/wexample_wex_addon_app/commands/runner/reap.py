@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_cli.const.tags import AudienceTag, EffectTag, ScopeTag
+from wexample_cli.decorator.command import command
+from wexample_cli.decorator.middleware import middleware
+from wexample_wex_core.const.globals import COMMAND_TYPE_ADDON
+
+from wexample_wex_addon_app.const.tags import DomainTag
+from wexample_wex_addon_app.middleware.app_middleware import AppMiddleware
+
+if TYPE_CHECKING:
+    from wexample_app.response.abstract_response import AbstractResponse
+    from wexample_cli.context.execution_context import ExecutionContext
+
+    from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
+
+
+@middleware(middleware=AppMiddleware)
+@command(
+    type=COMMAND_TYPE_ADDON,
+    description="Remove the pooled runner containers idle for longer than their TTL",
+    tags=[
+        DomainTag.CONTAINER,
+        DomainTag.DOCKER,
+        EffectTag.DELETE,
+        EffectTag.IDEMPOTENT,
+        EffectTag.SUBPROCESS_SPAWN,
+        AudienceTag.AGENT_SAFE,
+        ScopeTag.APP,
+        ScopeTag.LOCAL,
+    ],
+)
+def app__runner__reap(
+    context: ExecutionContext,
+    app_workdir: ManagedWorkdir,
+) -> AbstractResponse:
+    from wexample_app.response.success_response import SuccessResponse
+
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+    state_path = RunnerPool.get_state_path(app_workdir.get_path())
+    # Containers in use by a live process are kept, whatever their age.
+    reaped = RunnerPool(state_path=state_path).reap() if state_path.exists() else []
+
+    if not reaped:
+        return SuccessResponse(
+            kernel=context.kernel, message="No idle runner container."
+        )
+    return SuccessResponse(
+        kernel=context.kernel,
+        message=f"Removed {len(reaped)} idle runner container(s).",
+    )
@@ -29,6 +29,16 @@ if TYPE_CHECKING:
     default=False,
     description="Force reinstallation of all packages",
 )
+@option(
+    name="jobs",
+    type=int,
+    required=False,
+    default=1,
+    description=(
+        "On a suite, number of packages installed in parallel, each once its "
+        "dependencies are installed"
+    ),
+)
 @middleware(middleware=AppMiddleware)
 @command(
     type=COMMAND_TYPE_ADDON,
@@ -47,5 +57,13 @@ def app__setup__install(
     app_workdir: ManagedWorkdir,
     env: str | None = None,
     force: bool = False,
+    jobs: int = 1,
 ) -> None:
-    app_workdir.setup_install(env=env, force=force)
+    from wexample_wex_addon_app.workdir.framework_packages_suite_workdir import (
+        FrameworkPackageSuiteWorkdir,
+    )
+
+    if isinstance(app_workdir, FrameworkPackageSuiteWorkdir):
+        app_workdir.setup_install(env=env, force=force, jobs=jobs)
+    else:
+        app_workdir.setup_install(env=env, force=force)
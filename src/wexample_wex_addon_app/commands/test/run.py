@@ -22,9 +22,32 @@ if TYPE_CHECKING:
     default="html",
     description="The output format of the report",
 )
+@option(
+    name="jobs",
+    type=int,
+    required=False,
+    default=1,
+    description=(
+        "On a suite, number of packages tested in parallel, each once its "
+        "dependencies are tested"
+    ),
+)
+@option(
+    name="affected",
+    type=str,
+    required=False,
+    default=None,
+    description=(
+        "On a suite, test only packages changed since this git ref, "
+        "and the packages depending on them"
+    ),
+)
 @command(
     type=COMMAND_TYPE_ADDON,
-    description="Bump version for one or all package of the suite.",
+    description=(
+        "Run the tests of the app, or of every package of a suite, "
+        "reporting all failures at the end."
+    ),
     tags=[
         DomainTag.APP_LIFECYCLE,
         DomainTag.TEST,
@@ -35,8 +58,19 @@ if TYPE_CHECKING:
     ],
 )
 def app__test__run(
-    context: ExecutionContext, app_workdir: AppMiddleware, format: str | None = None
+    context: ExecutionContext,
+    app_workdir: AppMiddleware,
+    format: str | None = None,
+    jobs: int = 1,
+    affected: str | None = None,
 ) -> str | None:
+    from wexample_wex_addon_app.workdir.framework_packages_suite_workdir import (
+        FrameworkPackageSuiteWorkdir,
+    )
+
     if not app_workdir.has_tests():
         return "No tests found."
-    app_workdir.test_run(format=format)
+    if isinstance(app_workdir, FrameworkPackageSuiteWorkdir):
+        app_workdir.test_run(format=format, jobs=jobs, affected_since=affected)
+    else:
+        app_workdir.test_run(format=format)
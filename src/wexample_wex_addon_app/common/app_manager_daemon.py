@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from wexample_helpers.classes.shell_result import ShellResult
+
+
+@base_class
+class AppManagerDaemon(BaseClass):
+    """Long-lived app-manager serving command requests over a unix socket.
+
+    The daemon imports the kernel and addons once, then forks a child per
+    request: the child runs the command with the client's stdin, stdout and
+    stderr (passed as file descriptors), so callers see exactly what a fresh
+    `app-manager --subprocess` process would produce, without paying the
+    interpreter startup and imports again.
+
+    Using the daemon is opt-in: clients only talk to it while its socket file
+    exists. When code loaded by the daemon, the installed packages or the app
+    config change, it refuses the request and exits; the client then runs the
+    command the usual way and respawns a fresh daemon for the next calls.
+
+    Only the user running the daemon may connect to it: requests carry the
+    command line, environment and directory it runs them with.
+    """
+
+    app_path: Path = public_field(description="Root of the app served")
+
+    def get_lock_path(self) -> Path:
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.const.path import APP_FILE_APP_MANAGER_LOCK
+
+        return self.app_path / APP_PATH_TMP / APP_FILE_APP_MANAGER_LOCK
+
+    def get_socket_path(self) -> Path:
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.const.path import APP_FILE_APP_MANAGER_SOCKET
+
+        return self.app_path / APP_PATH_TMP / APP_FILE_APP_MANAGER_SOCKET
+
+    def is_enabled(self) -> bool:
+        return self.get_socket_path().is_socket()
+
+    def request(
+        self,
+        argv: list[str],
+        cwd: Path | None = None,
+        inherit_stdio: bool = True,
+        env: dict[str, str] | None = None,
+    ) -> ShellResult | None:
+        """Run an app-manager command line through the daemon.
+
+        The command gets the environment of this process, updated with `env`.
+        Returns None when the daemon is not enabled or cannot take the
+        request, in which case the caller must run the command itself. Raises
+        ShellCommandFailedException on a non-zero exit code, like `shell_run`.
+        """
+        import threading
+        import time
+
+        from wexample_helpers.classes.shell_result import ShellResult
+
+        if not self.is_enabled():
+            return None
+
+        socket_path = self.get_socket_path()
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            inode = socket_path.stat().st_ino
+            client.connect(str(socket_path))
+        except ConnectionRefusedError:
+            # Left by a daemon that died: removed, so that the next calls do
+            # not try it again, unless a fresh daemon took the path meanwhile.
+            client.close()
+            if _is_own_socket(socket_path, inode):
+                socket_path.unlink(missing_ok=True)
+                self._restart()
+            return None
+        except OSError:
+            # Served by another user, or gone: run without it.
+            client.close()
+            return None
+
+        cwd = Path(cwd or self.app_path)
+        start = time.monotonic()
+        outputs: dict[int, bytes] = {}
+        readers: list[threading.Thread] = []
+
+        with client:
+            read_fds: list[int] = []
+            if inherit_stdio:
+                fds = [0, 1, 2]
+                local_fds: list[int] = []
+            else:
+                fds = [os.open(os.devnull, os.O_RDONLY)]
+                local_fds = list(fds)
+                for target in (1, 2):
+                    read_fd, write_fd = os.pipe()
+                    fds.append(write_fd)
+                    local_fds.append(write_fd)
+                    read_fds.append(read_fd)
+                    readers.append(
+                        threading.Thread(
+                            target=_read_all, args=(read_fd, outputs, target)
+                        )
+                    )
+
+            payload = {
+                "argv": argv,
+                "cwd": str(cwd),
+                "env": {**os.environ, **(env or {})},
+            }
+            try:
+                socket.send_fds(client, [json.dumps(payload).encode() + b"\n"], fds)
+            except OSError:
+                # The readers never start: their pipe ends are ours to close.
+                for fd in read_fds:
+                    os.close(fd)
+                return None
+            finally:
+                for fd in local_fds:
+                    os.close(fd)
+
+            for reader in readers:
+                reader.start()
+            response = _read_line(client)
+            for reader in readers:
+                reader.join()
+
+        if response is None:
+            raise RuntimeError("app-manager daemon closed the connection")
+        if response.get("refused"):
+            return None
+        if response.get("stale"):
+            self._restart()
+            return None
+
+        end = time.monotonic()
+        stdout = outputs.get(1, b"").decode(errors="replace") if readers else None
+        stderr = outputs.get(2, b"").decode(errors="replace") if readers else None
+        returncode = int(response["returncode"])
+
+        if returncode != 0:
+            from wexample_helpers.exception.shell_command_failed_exception import (
+                ShellCommandFailedException,
+            )
+
+            raise ShellCommandFailedException(
+                cmd=argv, returncode=returncode, stderr=stderr, stdout=stdout
+            )
+
+        return ShellResult(
+            args=argv,
+            returncode=returncode,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            duration=end - start,
+            start_time=start,
+            end_time=end,
+        )
+
+    def serve(
+        self,
+        run_argv: Callable[[list[str]], int],
+        idle_timeout: float = 0,
+    ) -> None:
+        """Accept requests until stopped, stale or idle for `idle_timeout` seconds.
+
+        `run_argv` executes a command line in the forked child and returns its
+        exit code. A timeout of 0 disables the idle shutdown.
+        """
+        import fcntl
+        import sys
+        import time
+
+        socket_path = self.get_socket_path()
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        lock = self.get_lock_path().open("w")
+        if not _acquire_lock(lock):
+            # Another daemon already serves this app.
+            lock.close()
+            return
+
+        snapshot = _snapshot(self.app_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        keep_socket = False
+        try:
+            socket_path.unlink(missing_ok=True)
+            listener.bind(str(socket_path))
+            # Before listen(): no connection is accepted with a wider mode.
+            socket_path.chmod(0o600)
+            listener.listen(64)
+            listener.settimeout(1)
+            inode = socket_path.stat().st_ino
+            last_request = time.monotonic()
+
+            while True:
+                _reap_children()
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    if not _is_own_socket(socket_path, inode):
+                        # Stopped, or replaced by another daemon.
+                        keep_socket = True
+                        break
+                    if idle_timeout and time.monotonic() - last_request > idle_timeout:
+                        break
+                    continue
+
+                last_request = time.monotonic()
+                with conn:
+                    conn.settimeout(None)
+                    if not _is_same_user(conn):
+                        conn.sendall(b'{"refused": true}\n')
+                        continue
+
+                    request, fds = _receive_request(conn)
+                    if request is None:
+                        continue
+
+                    if _is_stale(snapshot):
+                        for fd in fds:
+                            os.close(fd)
+                        conn.sendall(b'{"stale": true}\n')
+                        keep_socket = True
+                        break
+
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    if os.fork() == 0:
+                        # The command may outlive this daemon: it must not
+                        # keep the lock from the next one.
+                        listener.close()
+                        lock.close()
+                        os._exit(_run_child(conn, request, fds, run_argv))
+
+                    for fd in fds:
+                        os.close(fd)
+        finally:
+            listener.close()
+            # A stale daemon leaves the socket in place: the client sees it
+            # and starts a fresh daemon, which takes over the same path.
+            if not keep_socket:
+                socket_path.unlink(missing_ok=True)
+            fcntl.flock(lock, fcntl.LOCK_UN)
+            lock.close()
+
+    def spawn(self) -> None:
+        """Start a daemon for this app in the background."""
+        import subprocess
+
+        from wexample_app.const.globals import APP_PATH_BIN_APP_MANAGER
+
+        subprocess.Popen(
+            [
+                str(self.app_path / APP_PATH_BIN_APP_MANAGER),
+                "--subprocess",
+                "app::daemon/serve",
+            ],
+            cwd=self.app_path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def stop(self) -> bool:
+        """Disable the daemon; a running one exits within a second."""
+        socket_path = self.get_socket_path()
+        if not socket_path.exists():
+            return False
+        socket_path.unlink()
+        return True
+
+    def _restart(self) -> None:
+        # The current call falls back to a regular process anyway: failing to
+        # start the next daemon must not fail it.
+        try:
+            self.spawn()
+        except OSError:
+            pass
+
+
+def _acquire_lock(lock) -> bool:
+    import fcntl
+    import time
+
+    # A stale daemon may still be shutting down: give it a moment.
+    for _ in range(50):
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            time.sleep(0.1)
+    return False
+
+
+def _is_own_socket(socket_path: Path, inode: int) -> bool:
+    try:
+        return socket_path.stat().st_ino == inode
+    except OSError:
+        return False
+
+
+def _is_same_user(conn: socket.socket) -> bool:
+    import struct
+
+    if not hasattr(socket, "SO_PEERCRED"):
+        # Not available there: the socket mode alone keeps other users out.
+        return True
+    credentials = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid == os.getuid()
+
+
+def _is_stale(snapshot: dict[str, int | None]) -> bool:
+    for path, mtime_ns in snapshot.items():
+        try:
+            current = os.stat(path).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime_ns:
+            return True
+    return False
+
+
+def _read_all(fd: int, outputs: dict[int, bytes], key: int) -> None:
+    chunks = []
+    with os.fdopen(fd, "rb") as stream:
+        while chunk := stream.read(65536):
+            chunks.append(chunk)
+    outputs[key] = b"".join(chunks)
+
+
+def _read_line(conn: socket.socket, data: bytes = b"") -> dict | None:
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data)
+
+
+def _reap_children() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _receive_request(conn: socket.socket) -> tuple[dict | None, list[int]]:
+    data, fds, _, _ = socket.recv_fds(conn, 1024 * 1024, 3)
+    try:
+        request = _read_line(conn, data)
+    except ValueError:
+        request = None
+    if request is None or len(fds) != 3:
+        for fd in fds:
+            os.close(fd)
+        return None, []
+    return request, fds
+
+
+def _run_child(
+    conn: socket.socket,
+    request: dict,
+    fds: list[int],
+    run_argv: Callable[[list[str]], int],
+) -> int:
+    import sys
+
+    returncode = 1
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        returncode = run_argv(request["argv"])
+    except BaseException as e:
+        returncode = e.code if isinstance(e, SystemExit) else 1
+        if not isinstance(returncode, int):
+            returncode = 0 if returncode is None else 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            conn.sendall(json.dumps({"returncode": returncode}).encode() + b"\n")
+        except OSError:
+            pass
+    return returncode
+
+
+def _snapshot(app_path: Path) -> dict[str, int | None]:
+    """Modification times of everything a request relies on being unchanged.
+
+    Covers the source of every module loaded by the daemon, the directories
+    packages get installed into and the app config files.
+    """
+    import site
+    import sys
+
+    from wexample_app.const.globals import (
+        APP_FILE_APP_CONFIG,
+        APP_PATH_LOCAL_ENV,
+        WORKDIR_SETUP_DIR,
+    )
+
+    paths = {
+        module_file
+        for module in list(sys.modules.values())
+        if (module_file := getattr(module, "__file__", None))
+    }
+    paths.update(site.getsitepackages())
+    paths.add(str(app_path / WORKDIR_SETUP_DIR / APP_FILE_APP_CONFIG))
+    paths.add(str(app_path / APP_PATH_LOCAL_ENV))
+
+    snapshot: dict[str, int | None] = {}
+    for path in paths:
+        try:
+            snapshot[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            snapshot[path] = None
+    return snapshot
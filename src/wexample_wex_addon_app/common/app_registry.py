@@ -58,6 +58,26 @@ def _build_default_file() -> JsonFile:
     return JsonFile.create_from_path(path=_REGISTRY_PATH, configure=False)
 
 
+def _is_app_running(
+    app_path: str, running_projects: set[str], running_names: set[str]
+) -> bool:
+    from wexample_wex_addon_app.item.file.docker_compose_yaml_file import (
+        DockerComposeYamlFile,
+    )
+
+    tmp_dir = Path(app_path) / WORKDIR_SETUP_DIR / APP_DIR_NAME_TMP
+    runtime_compose = tmp_dir / "docker-compose.runtime.yml"
+    if not runtime_compose.exists():
+        return False
+
+    compose_file = DockerComposeYamlFile.create_from_path(
+        path=runtime_compose, configure=False
+    )
+    if compose_file.read_project_name() in running_projects:
+        return True
+    return any(name in running_names for name in compose_file.read_container_names())
+
+
 @base_class
 class AppsRegistry(
     WithFileLockMixin,
@@ -121,30 +141,40 @@ class AppsRegistry(
             self._items.update(data)
 
     def purge_stopped(self) -> None:
-        """Remove entries whose containers are no longer running."""
-        import subprocess
-
-        with self.file_lock():
-            self.load()
-            active: dict[str, dict] = {}
-
-            for app_path, entry in self._items.items():
-                tmp_dir = Path(app_path) / WORKDIR_SETUP_DIR / APP_DIR_NAME_TMP
-                runtime_compose = tmp_dir / "docker-compose.runtime.yml"
-                docker_env = tmp_dir / "docker.env"
-                if not runtime_compose.exists():
-                    continue
+        """Remove entries whose containers are no longer running.
+
+        Container states come from a single `docker ps` call, joined in memory
+        against each app's runtime compose project. The file lock is only held
+        for the final rewrite, so app starts are not blocked while docker answers.
+        """
+        from wexample_wex_addon_app.helper.docker import (
+            docker_list_running_containers,
+        )
 
-                cmd = ["docker", "compose"]
-                if docker_env.exists():
-                    cmd += ["--env-file", str(docker_env)]
-                cmd += ["-f", str(runtime_compose), "ps", "-q"]
+        self.load()
+        if not self._items:
+            return
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    active[app_path] = entry
+        running = docker_list_running_containers()
+        running_projects = {c["project"] for c in running if c["project"]}
+        running_names = {c["name"] for c in running}
+
+        stopped = [
+            app_path
+            for app_path in self._items
+            if not _is_app_running(
+                app_path=app_path,
+                running_projects=running_projects,
+                running_names=running_names,
+            )
+        ]
+        if not stopped:
+            return
 
-            self._items = active
+        with self.file_lock():
+            self.load()
+            for app_path in stopped:
+                self._items.pop(app_path, None)
             self.save()
 
     def remove_app(self, app_workdir: ManagedWorkdir) -> None:
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate.item.file.json_file import JsonFile
+    from wexample_wex_core.const.registries import RegistryAddonData
+    from wexample_wex_core.resolver.abstract_command_resolver import (
+        AbstractCommandResolver,
+    )
+
+# Bump when the shape of the indexed registry data changes.
+COMMAND_INDEX_VERSION: int = 1
+
+
+@base_class
+class CommandIndex(BaseClass):
+    """Registry data of command directories, keyed by their files stats.
+
+    Scanning a `commands/` directory imports every command module to read its
+    metadata (description, options, tags...). The index keeps the result of
+    each scan along with the mtime and size of every command file, so the next
+    scan only lists the directory and stats files: modules are imported again
+    only when a command file is added, removed or modified. The command about
+    to run is still imported by the resolver, from its path.
+    """
+
+    path: Path = public_field(description="JSON file holding the index")
+    _changed: bool = private_field(
+        default=False, description="Whether the index must be written back"
+    )
+    _entries: dict | None = private_field(
+        default=None, description="Loaded entries, keyed by commands directory"
+    )
+    _scanned: set[str] = private_field(
+        factory=set, description="Commands directories scanned since loaded"
+    )
+
+    def save(self) -> None:
+        """Write the index back if a scan changed it.
+
+        Entries of directories not scanned since loading are dropped, so a
+        removed app or service does not linger in the index.
+        """
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        if not self._changed:
+            return
+
+        entries = {
+            key: entry
+            for key, entry in self._load().items()
+            if key in self._scanned
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._get_file().write_parsed(
+                {"version": COMMAND_INDEX_VERSION, "entries": entries}
+            )
+            file_chown_as_real_user_if_elevated(self.path)
+        except OSError:
+            # A read-only tmp dir only costs the next startup a full scan.
+            return
+        self._changed = False
+
+    def scan(
+        self,
+        resolver: AbstractCommandResolver,
+        commands_base: Path,
+        addon_name: str,
+    ) -> RegistryAddonData:
+        """Return the registry data of `commands_base`, importing modules only
+        when its command files changed since the indexed scan."""
+        import copy
+
+        key = str(commands_base)
+        files = _command_files(commands_base)
+        entries = self._load()
+        entry = entries.get(key)
+        self._scanned.add(key)
+
+        if entry and entry.get("files") == files:
+            data = copy.deepcopy(entry["data"])
+            # Tests live outside the indexed files: look them up again.
+            tests_base = commands_base.parent / "tests"
+            for command_data in data.values():
+                test_path = tests_base / Path(command_data["path"]).relative_to(
+                    commands_base
+                ).with_suffix(".py")
+                command_data["test"] = str(test_path) if test_path.exists() else None
+            return data
+
+        data = resolver._scan_commands_dir(commands_base, addon_name)
+        entries[key] = {"files": files, "data": copy.deepcopy(data)}
+        self._changed = True
+        return data
+
+    def _get_file(self) -> JsonFile:
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        return JsonFile.create_from_path(path=self.path, configure=False)
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                data = self._get_file().read_parsed() if self.path.exists() else {}
+            except (OSError, ValueError):
+                data = {}
+            data = data or {}
+            self._entries = (
+                data.get("entries") or {}
+                if data.get("version") == COMMAND_INDEX_VERSION
+                else {}
+            )
+        return self._entries
+
+
+def _command_files(commands_base: Path) -> dict[str, list[int]]:
+    """Stats of the files `_scan_commands_dir` reads, without importing them."""
+    files: dict[str, list[int]] = {}
+    try:
+        groups = sorted(os.scandir(commands_base), key=lambda e: e.name)
+    except OSError:
+        return files
+
+    for group in groups:
+        if group.name.startswith("_") or not group.is_dir():
+            continue
+        for entry in sorted(os.scandir(group.path), key=lambda e: e.name):
+            if entry.name.startswith("_") or not entry.name.endswith((".py", ".yml")):
+                continue
+            stat = entry.stat()
+            files[f"{group.name}/{entry.name}"] = [stat.st_mtime_ns, stat.st_size]
+    return files
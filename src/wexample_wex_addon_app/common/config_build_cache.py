@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from wexample_filestate.item.file.json_file import JsonFile
+
+
+@base_class
+class ConfigBuildCache(BaseClass):
+    """Input and output fingerprints of each `config/build` step.
+
+    Also used by `image/build --cached`, one step per image and no outputs.
+    A step is reusable when none of its inputs changed content since it last
+    ran and its outputs are still the exact files it wrote. Outputs of a step
+    are usually inputs of the next one, so a rebuilt step only invalidates
+    its followers when it actually produced something different.
+    """
+
+    path: Path = public_field(description="JSON file holding the steps state")
+    _steps: dict | None = private_field(
+        default=None, description="Loaded steps state, keyed by step name"
+    )
+
+    def clear(self) -> None:
+        self._steps = {}
+        if self.path.exists():
+            self.path.unlink()
+
+    def is_fresh(
+        self,
+        step: str,
+        inputs: Iterable[Path],
+        outputs: Iterable[Path],
+        extra: Iterable[str] = (),
+    ) -> bool:
+        from wexample_wex_addon_app.helper.fingerprint import (
+            fingerprint_digest,
+            fingerprint_files,
+        )
+
+        state = self._load().get(step)
+        if not state:
+            return False
+
+        recorded_inputs = state.get("inputs") or {}
+        current_inputs = fingerprint_files(inputs, previous=recorded_inputs)
+        if set(current_inputs) != set(recorded_inputs):
+            return False
+        if fingerprint_digest(current_inputs, *extra) != state.get("digest"):
+            return False
+
+        recorded_outputs = state.get("outputs") or {}
+        current_outputs = fingerprint_files(outputs, previous=recorded_outputs)
+        if current_outputs.keys() != recorded_outputs.keys():
+            return False
+        return all(
+            current_outputs[path] is not None
+            and recorded_outputs[path] is not None
+            and current_outputs[path]["sha256"] == recorded_outputs[path]["sha256"]
+            for path in current_outputs
+        )
+
+    def record(
+        self,
+        step: str,
+        inputs: Iterable[Path],
+        outputs: Iterable[Path],
+        extra: Iterable[str] = (),
+    ) -> None:
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        from wexample_wex_addon_app.helper.fingerprint import (
+            fingerprint_digest,
+            fingerprint_files,
+        )
+
+        fingerprints = fingerprint_files(inputs)
+        steps = self._load()
+        steps[step] = {
+            "digest": fingerprint_digest(fingerprints, *extra),
+            "inputs": fingerprints,
+            "outputs": fingerprint_files(outputs),
+        }
+        self._get_file().write_parsed({"steps": steps})
+        file_chown_as_real_user_if_elevated(self.path)
+
+    def _get_file(self) -> JsonFile:
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        return JsonFile.create_from_path(path=self.path, configure=False)
+
+    def _load(self) -> dict:
+        if self._steps is None:
+            data = self._get_file().read_parsed() if self.path.exists() else {}
+            self._steps = (data or {}).get("steps") or {}
+        return self._steps
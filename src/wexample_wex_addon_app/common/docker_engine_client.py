@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import http.client
+import socket
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+DOCKER_ENGINE_SOCKET_PATH: str = "/var/run/docker.sock"
+# Idle keep-alive connections kept per client.
+DOCKER_ENGINE_POOL_SIZE: int = 4
+# `mode` bit flagging a directory in the archive path stat (Go's os.ModeDir).
+_MODE_DIR = 1 << 31
+
+
+@base_class
+class DockerEngineClient(BaseClass):
+    """Minimal Docker Engine API client over the daemon unix socket.
+
+    Talking to the daemon in-process avoids the startup cost of the `docker`
+    CLI, paid on every call. Requests reuse pooled keep-alive connections.
+
+    Transport failures (daemon down, socket not accessible) raise OSError,
+    so callers can fall back to the CLI. Error answers of the daemon raise
+    RuntimeError with its message, and so does a transport failure once a
+    command was sent to a container: running it again could run it twice.
+    """
+
+    socket_path: str = public_field(
+        default=DOCKER_ENGINE_SOCKET_PATH, description="Unix socket of the daemon"
+    )
+    timeout: float = public_field(
+        default=60,
+        description="Socket timeout of each request, in seconds, except the "
+        "ones waiting for a command to end",
+    )
+    _idle: list[http.client.HTTPConnection] = private_field(
+        factory=list, description="Keep-alive connections ready for a request"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the idle connections"
+    )
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def container_archive_put(
+        self, container: str, local_src: Path, container_dest: str
+    ) -> None:
+        """Copy a local file or dir into a container, like `docker cp`.
+
+        As with the CLI, a source lands inside `container_dest` when it is an
+        existing directory, and is renamed to it otherwise.
+        """
+        import io
+        import posixpath
+        import tarfile
+
+        target_dir = container_dest
+        arcname = local_src.name
+        if not container_dest.endswith("/") and not self._is_container_dir(
+            container, container_dest
+        ):
+            target_dir = posixpath.dirname(container_dest.rstrip("/")) or "/"
+            arcname = posixpath.basename(container_dest.rstrip("/"))
+
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            archive.add(str(local_src), arcname=arcname)
+
+        self.request_json(
+            "PUT",
+            f"/containers/{_quote(container)}/archive",
+            query={"path": target_dir},
+            body=buffer.getvalue(),
+            content_type="application/x-tar",
+        )
+
+    def container_exec(
+        self, container: str, command: list[str], user: str | None = None
+    ) -> tuple[int, str, str]:
+        """Run a command in a running container, return (exit code, stdout, stderr).
+
+        Waits for the command without timeout. Once the command is started,
+        transport failures raise RuntimeError rather than OSError.
+        """
+        created = self.request_json(
+            "POST",
+            f"/containers/{_quote(container)}/exec",
+            body={
+                "AttachStdout": True,
+                "AttachStderr": True,
+                "Cmd": command,
+                "User": user or "",
+            },
+        )
+        exec_id = created["Id"]
+
+        try:
+            _, stream = self.request(
+                "POST",
+                f"/exec/{exec_id}/start",
+                body={"Detach": False, "Tty": False},
+                wait=True,
+            )
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Raised by connect(): the command was not sent.
+            raise
+        except OSError as e:
+            raise RuntimeError(
+                f"Docker Engine API lost the exec of {command!r} in {container}: {e}"
+            ) from e
+        stdout, stderr = _demultiplex(stream)
+
+        inspected = self.request_json("GET", f"/exec/{exec_id}/json")
+        return int(inspected.get("ExitCode") or 0), stdout, stderr
+
+    def container_inspect(self, container: str) -> dict[str, Any] | None:
+        """Same data as `docker inspect`, None when the container does not exist."""
+        return self.request_json(
+            "GET", f"/containers/{_quote(container)}/json", missing_ok=True
+        )
+
+    def container_list(self, include_stopped: bool = False) -> list[dict[str, Any]]:
+        return self.request_json(
+            "GET", "/containers/json", query={"all": "1" if include_stopped else "0"}
+        )
+
+    def container_remove(self, container: str) -> None:
+        self.request_json("DELETE", f"/containers/{_quote(container)}")
+
+    def container_stop(self, container: str) -> None:
+        # 304: the container was already stopped.
+        self.request_json("POST", f"/containers/{_quote(container)}/stop")
+
+    def events(
+        self, since: float, until: float, filters: dict[str, list[str]]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield events between two timestamps, as the daemon sends them.
+
+        The stream ends once `until` has passed: bounded windows keep the
+        connection reusable, unlike an open-ended stream.
+        """
+        import json
+        from urllib.parse import urlencode
+
+        query = urlencode(
+            {
+                "since": f"{since:.9f}",
+                "until": f"{until:.9f}",
+                "filters": json.dumps(filters),
+            }
+        )
+        connection = self._acquire()
+        try:
+            connection.request("GET", f"/events?{query}", headers={"Host": "docker"})
+            response = connection.getresponse()
+            if response.status >= 400:
+                response.read()
+                raise RuntimeError(
+                    f"Docker Engine API GET /events failed ({response.status})"
+                )
+            for line in iter(response.readline, b""):
+                if line.strip():
+                    yield json.loads(line)
+        except http.client.HTTPException as e:
+            connection.close()
+            raise ConnectionError(f"Docker Engine API GET /events: {e}") from e
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+
+    def image_inspect(self, image: str) -> dict[str, Any] | None:
+        return self.request_json(
+            "GET", f"/images/{_quote(image)}/json", missing_ok=True
+        )
+
+    def image_list(self) -> list[dict[str, Any]]:
+        return self.request_json("GET", "/images/json")
+
+    def image_remove(self, image: str) -> None:
+        self.request_json("DELETE", f"/images/{_quote(image)}")
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str] | None = None,
+        body: dict | list | bytes | None = None,
+        content_type: str = "application/json",
+        wait: bool = False,
+    ) -> tuple[int, bytes]:
+        """Send one request, return the status and the raw body.
+
+        With `wait`, the answer is awaited without timeout, for requests
+        lasting as long as a command does. Such a request goes over a new
+        connection and is never sent twice.
+        """
+        import json
+        from urllib.parse import urlencode
+
+        url = f"{path}?{urlencode(query)}" if query else path
+        headers = {"Host": "docker"}
+        payload = None
+        if body is not None:
+            payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+            headers["Content-Type"] = content_type
+
+        connection = self._acquire(fresh=wait)
+        reused = connection.sock is not None
+        try:
+            try:
+                status, data, keep = _send(connection, method, url, payload, headers)
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                # The daemon may have closed an idle connection: retry once.
+                # Not after a timeout, the daemon may be handling the request.
+                if not reused or isinstance(e, TimeoutError):
+                    raise
+                status, data, keep = _send(connection, method, url, payload, headers)
+        except http.client.HTTPException as e:
+            connection.close()
+            raise ConnectionError(f"Docker Engine API {method} {path}: {e}") from e
+        except OSError:
+            connection.close()
+            raise
+
+        if keep:
+            if wait:
+                connection.timeout = self.timeout
+                connection.sock.settimeout(self.timeout)
+            self._release(connection)
+        else:
+            connection.close()
+        return status, data
+
+    def request_json(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str] | None = None,
+        body: dict | list | bytes | None = None,
+        content_type: str = "application/json",
+        missing_ok: bool = False,
+    ) -> Any:
+        """Send one request, return its decoded JSON body.
+
+        Raises RuntimeError on error statuses; a 404 returns None instead
+        when `missing_ok` is set.
+        """
+        import json
+
+        status, data = self.request(method, path, query, body, content_type)
+        if status == 404 and missing_ok:
+            return None
+        if status >= 400:
+            try:
+                message = json.loads(data).get("message", "")
+            except (AttributeError, ValueError):
+                message = data.decode(errors="replace")
+            raise RuntimeError(
+                f"Docker Engine API {method} {path} failed ({status}): {message}"
+            )
+        return json.loads(data) if data.strip() else None
+
+    def _acquire(self, fresh: bool = False) -> http.client.HTTPConnection:
+        # A fresh connection waits for its answer without timeout.
+        if fresh:
+            return _UnixHTTPConnection(self.socket_path, timeout=None)
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+
+    def _is_container_dir(self, container: str, path: str) -> bool:
+        import base64
+        import json
+        from urllib.parse import urlencode
+
+        connection = self._acquire()
+        try:
+            connection.request(
+                "HEAD",
+                f"/containers/{_quote(container)}/archive?{urlencode({'path': path})}",
+                headers={"Host": "docker"},
+            )
+            response = connection.getresponse()
+            response.read()
+            stat = response.getheader("X-Docker-Container-Path-Stat")
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+        self._release(connection)
+
+        if response.status != 200 or not stat:
+            return False
+        return bool(json.loads(base64.b64decode(stat)).get("mode", 0) & _MODE_DIR)
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < DOCKER_ENGINE_POOL_SIZE:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float | None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _demultiplex(stream: bytes) -> tuple[str, str]:
+    """Split an attached, non-TTY stream into stdout and stderr.
+
+    Each frame starts with an 8 bytes header: the stream type, three
+    padding bytes, then the big-endian payload size.
+    """
+    outputs: dict[int, list[bytes]] = {1: [], 2: []}
+    position = 0
+    while position + 8 <= len(stream):
+        kind = stream[position]
+        size = int.from_bytes(stream[position + 4 : position + 8], "big")
+        position += 8
+        outputs.setdefault(kind, []).append(stream[position : position + size])
+        position += size
+
+    return (
+        b"".join(outputs[1]).decode(errors="replace"),
+        b"".join(outputs[2]).decode(errors="replace"),
+    )
+
+
+def _quote(value: str) -> str:
+    from urllib.parse import quote
+
+    return quote(value, safe="/:@")
+
+
+def _send(
+    connection: http.client.HTTPConnection,
+    method: str,
+    url: str,
+    payload: bytes | None,
+    headers: dict[str, str],
+) -> tuple[int, bytes, bool]:
+    connection.request(method, url, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, data, not response.will_close
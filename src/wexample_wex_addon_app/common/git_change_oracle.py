@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class GitChangeOracle(BaseClass):
+    """Publication tags and changes since them, for every package of a suite.
+
+    Asking git per package and per critical directory spawns hundreds of
+    processes on a large suite. The oracle lists the `*/v*` tags of each
+    repository once, then runs a single diff per distinct tag and answers
+    every path question about it from memory.
+
+    Answers are a snapshot: use one oracle for a planning pass, not across
+    steps that commit, tag or write files.
+    """
+
+    _changes: dict[tuple[str, str], frozenset[str] | None] = private_field(
+        factory=dict,
+        description="Paths changed since each (repository, tag), None if unknown",
+    )
+    _roots: dict[str, Path | None] = private_field(
+        factory=dict, description="Repository root of each asked path"
+    )
+    _tags: dict[str, list[str]] = private_field(
+        factory=dict, description="Publication tags of each repository, sorted"
+    )
+
+    def get_changed_paths(self, ref: str, path: Path) -> list[Path] | None:
+        """Files of the repository holding `path` that differ from `ref`.
+
+        Paths are absolute. None when `path` is outside a git repository or
+        `ref` is unknown there.
+        """
+        root = self.get_repository_root(path)
+        if root is None:
+            return None
+        changed = self._get_changed_paths(root, ref)
+        if changed is None:
+            return None
+        return [root / changed_path for changed_path in sorted(changed)]
+
+    def get_last_tag(self, path: Path, package_name: str) -> str | None:
+        """Return the last "<package_name>/v*" tag, like `git_last_tag_for_prefix`."""
+        root = self.get_repository_root(path)
+        if root is None:
+            from wexample_helpers_git.helper.git import git_last_tag_for_prefix
+
+            return git_last_tag_for_prefix(
+                f"{package_name}/v*", cwd=path, inherit_stdio=False
+            )
+
+        prefix = f"{package_name}/v"
+        for tag in reversed(self._get_tags(root)):
+            if tag.startswith(prefix):
+                return tag
+        return None
+
+    def get_repository_root(self, path: Path) -> Path | None:
+        """Closest directory holding `path` with a `.git` entry, if any."""
+        key = str(path)
+        if key not in self._roots:
+            root = None
+            current = Path(path).resolve()
+            for candidate in (current, *current.parents):
+                if (candidate / ".git").exists():
+                    root = candidate
+                    break
+            self._roots[key] = root
+        return self._roots[key]
+
+    def has_changes_since(self, tag: str, path: Path, pathspec: str = ".") -> bool:
+        """Whether `pathspec`, relative to `path`, differs from `tag`.
+
+        Same answer as `git_has_changes_since_tag`: the working tree is
+        compared, so uncommitted changes to tracked files count.
+        """
+        root = self.get_repository_root(path)
+        if root is None:
+            from wexample_helpers_git.helper.git import git_has_changes_since_tag
+
+            return git_has_changes_since_tag(tag, pathspec, cwd=path)
+
+        changed = self._get_changed_paths(root, tag)
+        if changed is None:
+            return True
+
+        prefix = (Path(path).resolve() / pathspec).resolve().relative_to(root)
+        prefix = "" if str(prefix) == "." else prefix.as_posix()
+        if not prefix:
+            return bool(changed)
+
+        return any(
+            changed_path == prefix or changed_path.startswith(f"{prefix}/")
+            for changed_path in changed
+        )
+
+    def _get_changed_paths(self, root: Path, tag: str) -> frozenset[str] | None:
+        from wexample_helpers.helper.shell import shell_run
+
+        key = (str(root), tag)
+        if key not in self._changes:
+            result = shell_run(
+                ["git", "diff", "--name-only", "--no-renames", "-z", tag, "--"],
+                cwd=root,
+                inherit_stdio=False,
+                check=False,
+            )
+            # Unknown tag or broken repository: consider everything changed,
+            # as the per-package check does.
+            self._changes[key] = (
+                frozenset(p for p in result.stdout.split("\0") if p)
+                if result.returncode == 0
+                else None
+            )
+        return self._changes[key]
+
+    def _get_tags(self, root: Path) -> list[str]:
+        from wexample_helpers.helper.shell import shell_run
+
+        key = str(root)
+        if key not in self._tags:
+            # Same ordering as git_last_tag_for_prefix.
+            output = shell_run(
+                ["bash", "-lc", "git tag --list '*/v*' | sort -V"],
+                cwd=root,
+                inherit_stdio=False,
+            ).stdout
+            self._tags[key] = [tag for tag in output.splitlines() if tag.strip()]
+        return self._tags[key]
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from wexample_filestate.item.file.json_file import JsonFile
+
+# Bump when the shape of the cached graph changes.
+PACKAGE_IMPACT_GRAPH_VERSION: int = 2
+# Files of a package that may declare its name or its dependencies.
+PACKAGE_IMPACT_GRAPH_MANIFESTS: tuple[str, ...] = (
+    "composer.json",
+    "package.json",
+    "pyproject.toml",
+    ".wex/config.yml",
+)
+
+
+@base_class
+class PackageImpactGraph(BaseClass):
+    """Local dependencies between the packages of a suite, in both directions.
+
+    Built from `build_dependencies_map()`: direct dependents and the
+    transitive closures of both directions are computed once, on the first
+    question, so every question ("what depends on this", "what does a change
+    here impact") is a lookup. `load_or_build` keeps the graph on disk, keyed
+    by the content of every package manifest, so a suite whose manifests did
+    not change does not read its packages' dependencies again.
+    """
+
+    dependencies: dict[str, list[str]] = public_field(
+        description="Local dependencies of each package, by package name"
+    )
+    paths: dict[str, str] = public_field(description="Directory of each package")
+    _dependencies_closure: dict[str, set[str]] | None = private_field(
+        default=None, description="Packages each package reaches, itself included"
+    )
+    _dependents: dict[str, list[str]] | None = private_field(
+        default=None, description="Packages depending directly on each package"
+    )
+    _dependents_closure: dict[str, set[str]] | None = private_field(
+        default=None, description="Packages reaching each package, itself included"
+    )
+    _paths_by_length: list[tuple[str, str]] | None = private_field(
+        default=None, description="(path, package) pairs, deepest paths first"
+    )
+
+    @classmethod
+    def load_or_build(
+        cls,
+        cache_path: Path,
+        package_paths: Iterable[Path],
+        build: Callable[[], tuple[dict[str, list[str]], dict[str, str]]],
+    ) -> PackageImpactGraph:
+        """Load the cached graph, or `build()` (dependencies, paths) and cache it.
+
+        The cache is valid while the manifests of `package_paths` keep their
+        content and no package directory is added or removed.
+        """
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        from wexample_wex_addon_app.helper.fingerprint import (
+            fingerprint_digest,
+            fingerprint_files,
+        )
+
+        cache_file = _get_cache_file(cache_path)
+        try:
+            cached = cache_file.read_parsed() if cache_path.exists() else {}
+        except (OSError, ValueError):
+            cached = {}
+        cached = cached or {}
+        if cached.get("version") != PACKAGE_IMPACT_GRAPH_VERSION:
+            cached = {}
+
+        manifests = [
+            package_path / manifest
+            for package_path in sorted(package_paths)
+            for manifest in PACKAGE_IMPACT_GRAPH_MANIFESTS
+        ]
+        files = fingerprint_files(manifests, previous=cached.get("files"))
+        digest = fingerprint_digest(files)
+
+        if cached.get("digest") == digest:
+            return cls(dependencies=cached["dependencies"], paths=cached["paths"])
+
+        dependencies, paths = build()
+        graph = cls(dependencies=dependencies, paths=paths)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_parsed(
+                {
+                    "version": PACKAGE_IMPACT_GRAPH_VERSION,
+                    "digest": digest,
+                    "files": files,
+                    "dependencies": dependencies,
+                    "paths": paths,
+                }
+            )
+            file_chown_as_real_user_if_elevated(cache_path)
+        except OSError:
+            # A read-only tmp dir only costs the next run a rebuild.
+            pass
+        return graph
+
+    def get_dependencies(
+        self, package_name: str, transitive: bool = False
+    ) -> list[str]:
+        if not transitive:
+            return list(self.dependencies.get(package_name, []))
+        self._prepare()
+        closure = self._dependencies_closure.get(package_name, set())
+        return sorted(closure - {package_name})
+
+    def get_dependents(self, package_name: str, transitive: bool = False) -> list[str]:
+        self._prepare()
+        if not transitive:
+            return list(self._dependents.get(package_name, []))
+        closure = self._dependents_closure.get(package_name, set())
+        return sorted(closure - {package_name})
+
+    def get_impacted(self, package_names: Iterable[str]) -> set[str]:
+        """The given packages and every package depending on them, transitively."""
+        self._prepare()
+        impacted: set[str] = set()
+        for package_name in package_names:
+            impacted |= self._dependents_closure.get(package_name, set())
+        return impacted
+
+    def get_impacted_by_paths(self, paths: Iterable[Path | str]) -> set[str]:
+        """Packages impacted by changes to files, see `get_impacted`.
+
+        Paths outside every package impact nothing.
+        """
+        changed = {self.get_package_of_path(path) for path in paths}
+        changed.discard(None)
+        return self.get_impacted(changed)
+
+    def get_package_of_path(self, path: Path | str) -> str | None:
+        """Name of the package holding a path, the deepest one when nested."""
+        self._prepare()
+        path_str = str(Path(path))
+        for package_path, package_name in self._paths_by_length:
+            if path_str == package_path or path_str.startswith(f"{package_path}/"):
+                return package_name
+        return None
+
+    def get_reach(self) -> dict[str, set[str]]:
+        """Packages each package reaches through its dependencies, itself included.
+
+        Same result as `dependency_graph_closure(dependencies)`.
+        """
+        self._prepare()
+        return {
+            name: set(closure) for name, closure in self._dependencies_closure.items()
+        }
+
+    def _prepare(self) -> None:
+        from wexample_wex_addon_app.helper.dependency_graph import (
+            dependency_graph_closure,
+            dependency_graph_reverse,
+        )
+
+        if self._dependents is not None:
+            return
+
+        self._dependencies_closure = dependency_graph_closure(self.dependencies)
+        self._dependents_closure = dependency_graph_closure(
+            dependency_graph_reverse(self.dependencies)
+        )
+        self._paths_by_length = sorted(
+            ((str(Path(path)), name) for name, path in self.paths.items()),
+            key=lambda item: -len(item[0]),
+        )
+        # Set last: it marks the graph as prepared for concurrent readers.
+        self._dependents = dependency_graph_reverse(self.dependencies)
+
+
+def _get_cache_file(path: Path) -> JsonFile:
+    from wexample_filestate.item.file.json_file import JsonFile
+
+    return JsonFile.create_from_path(path=path, configure=False)
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Iterator, Mapping
+
+PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR: str = "WEX_PIPELINE_POLLER_SOCKET"
+
+
+@base_class
+class PipelinePollerSession(BaseClass):
+    """Poll CI API endpoints of many waiters in one shared round.
+
+    Every waiter registers a JSON endpoint with `wait`. One asyncio loop,
+    running in a background thread, fetches all registered endpoints together
+    with `pipeline_poller_fetch_round`: pooled keep-alive connections, ETag
+    revalidation, and one delay shared by every endpoint, reset when a payload
+    changed and backed off otherwise. Each waiter is handed the payloads of
+    its endpoint as they change, and reports a status shown in a single
+    progress view through `on_progress`.
+
+    `serve` opens the session to other processes through `socket_path`:
+    a session built with the same `socket_path` in another process sends its
+    waits there, and falls back to polling on its own while nobody serves it.
+    A release running packages in parallel serves one session to all of them,
+    advertised through the PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR variable.
+    """
+
+    interval: float = public_field(
+        default=5, description="Delay between rounds after a change, in seconds"
+    )
+    max_interval: float = public_field(
+        default=20, description="Longest delay between rounds, in seconds"
+    )
+    on_progress: Callable[[dict[str, str], int], None] | None = public_field(
+        default=None,
+        description="Called with the status of every pending wait and the "
+        "seconds elapsed since the session started, when a status changes",
+    )
+    pool_size: int = public_field(
+        default=4, description="Keep-alive connections kept per API server"
+    )
+    request_timeout: float = public_field(
+        default=30, description="Longest time a single request may take, in seconds"
+    )
+    socket_path: Path | None = public_field(
+        default=None, description="Unix socket the session is served on"
+    )
+    _listener: socket.socket | None = private_field(
+        default=None, description="Socket accepting waits of other processes"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the statuses and the loop start"
+    )
+    _loop: asyncio.AbstractEventLoop | None = private_field(
+        default=None, description="Event loop polling the endpoints"
+    )
+    _started: float | None = private_field(
+        default=None, description="Monotonic time of the first wait"
+    )
+    _statuses: dict[str, str] = private_field(
+        factory=dict, description="Last status reported by each pending wait"
+    )
+    _targets: dict[str, tuple] = private_field(
+        factory=dict,
+        description="Endpoint and inbox of each pending wait, owned by the loop",
+    )
+    _task: asyncio.Task | None = private_field(
+        default=None, description="Polling task of the loop"
+    )
+    _threads: list[threading.Thread] = private_field(
+        factory=list, description="Loop and listener threads"
+    )
+    _wake: asyncio.Event | None = private_field(
+        default=None, description="Set to poll at once when a wait registers"
+    )
+
+    def close(self) -> None:
+        """Stop serving and polling; pending waits get no further payload."""
+        import asyncio
+        import contextlib
+
+        if self._listener is not None:
+            # Wakes up the thread blocked in accept().
+            with contextlib.suppress(OSError):
+                self._listener.shutdown(socket.SHUT_RDWR)
+            self._listener.close()
+            self._listener = None
+            if self.socket_path is not None:
+                self.socket_path.unlink(missing_ok=True)
+
+        if self._loop is not None:
+
+            async def _cancel() -> None:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+
+            asyncio.run_coroutine_threadsafe(_cancel(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def serve(self) -> None:
+        """Accept the waits of other processes on `socket_path`, in background."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.socket_path))
+        # Waits carry the API token of their remote.
+        self.socket_path.chmod(0o600)
+        listener.listen()
+        self._listener = listener
+
+        thread = threading.Thread(target=self._accept, args=(listener,), daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def wait(
+        self,
+        key: str,
+        base_url: str,
+        path: str,
+        describe: Callable[[Any], tuple[str, bool]],
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 600,
+    ) -> Any:
+        """Poll `path` of `base_url` until `describe` tells its payload is done.
+
+        `describe` receives each new payload and returns the status to show
+        for `key` and whether the wait is over. Returns the last payload.
+        Raises TimeoutError once `timeout` seconds passed, and
+        PipelinePollException when the endpoint answers a redirect or a
+        non-retryable client error.
+        """
+        import contextlib
+
+        if self.socket_path is not None and self._listener is None:
+            client = self._connect()
+            if client is not None:
+                with client:
+                    return self._wait_remote(
+                        client, key, base_url, path, describe, headers, timeout
+                    )
+
+        with contextlib.closing(
+            self._watch(key, base_url, path, headers, timeout)
+        ) as payloads:
+            for payload in payloads:
+                status, done = describe(payload)
+                self._report(key, status)
+                if done:
+                    return payload
+
+    def _accept(self, listener: socket.socket) -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_wait, args=(conn,), daemon=True).start()
+
+    def _add_target(self, key: str, target: tuple) -> None:
+        self._targets[key] = target
+        self._wake.set()
+
+    def _connect(self) -> socket.socket | None:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(str(self.socket_path))
+        except OSError:
+            client.close()
+            return None
+        return client
+
+    def _remove_target(self, key: str, inbox) -> None:
+        if key in self._targets and self._targets[key][1] is inbox:
+            del self._targets[key]
+
+    def _report(self, key: str, status: str) -> None:
+        import time
+
+        with self._lock:
+            if self._statuses.get(key) == status:
+                return
+            self._statuses[key] = status
+            if self._started is None:
+                self._started = time.monotonic()
+            if self.on_progress is not None:
+                self.on_progress(
+                    dict(self._statuses), int(time.monotonic() - self._started)
+                )
+
+    async def _run(self) -> None:
+        import asyncio
+        import contextlib
+
+        from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+            PipelinePollException,
+        )
+        from wexample_wex_addon_app.helper.pipeline_poller import (
+            PIPELINE_POLLER_BACKOFF_FACTOR,
+            pipeline_poller_close,
+            pipeline_poller_fetch_round,
+        )
+
+        pools: dict[tuple[str, int, bool], asyncio.Queue] = {}
+        etags: dict[str, str] = {}
+        payloads: dict[str, Any] = {}
+        delay = self.interval
+
+        try:
+            while True:
+                self._wake.clear()
+                targets = dict(self._targets)
+                # Forget what the waits gone left behind: a new wait on the
+                # same key must get its first payload.
+                for key in set(payloads) - set(targets):
+                    del payloads[key]
+                    etags.pop(key, None)
+
+                changed = False
+                failed = False
+                retry_after = 0.0
+                if targets:
+                    results, retry_after = await pipeline_poller_fetch_round(
+                        pools,
+                        {key: target[0] for key, target in targets.items()},
+                        etags,
+                        pool_size=self.pool_size,
+                        timeout=self.request_timeout,
+                    )
+                    for key, result in results.items():
+                        inbox = targets[key][1]
+                        if isinstance(result, PipelinePollException):
+                            self._remove_target(key, inbox)
+                            inbox.put(result)
+                        elif isinstance(result, Exception):
+                            failed = True
+                        elif result is not None and result != payloads.get(key):
+                            payloads[key] = result
+                            changed = True
+                            inbox.put(result)
+
+                if changed and not failed:
+                    delay = self.interval
+                else:
+                    delay = min(
+                        delay * PIPELINE_POLLER_BACKOFF_FACTOR, self.max_interval
+                    )
+                delay = max(delay, min(retry_after, self.max_interval))
+
+                # A new wait is polled at once, and resets the delay.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wake.wait(), None if not self._targets else delay
+                    )
+                    delay = self.interval
+        finally:
+            await pipeline_poller_close(pools)
+
+    def _serve_wait(self, conn: socket.socket) -> None:
+        from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+            PipelinePollException,
+        )
+
+        with conn:
+            reader = conn.makefile("rb")
+            request = _read_message(reader)
+            if request is None:
+                return
+
+            def describe(payload: Any) -> tuple[str, bool]:
+                _send_message(conn, {"payload": payload})
+                reply = _read_message(reader)
+                if reply is None:
+                    raise ConnectionError("Pipeline waiter went away")
+                return reply["status"], reply["done"]
+
+            try:
+                self.wait(
+                    key=request["key"],
+                    base_url=request["base_url"],
+                    path=request["path"],
+                    describe=describe,
+                    headers=request["headers"],
+                    timeout=request["timeout"],
+                )
+            except TimeoutError as e:
+                _send_message(conn, {"error": "timeout", "message": str(e)})
+            except PipelinePollException as e:
+                _send_message(conn, {"error": "status", "status": e.status})
+            except OSError:
+                return
+
+    def _start(self) -> None:
+        import asyncio
+
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._run())
+            thread = threading.Thread(target=loop.run_forever, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            self._loop = loop
+
+    def _wait_remote(
+        self,
+        client: socket.socket,
+        key: str,
+        base_url: str,
+        path: str,
+        describe: Callable[[Any], tuple[str, bool]],
+        headers: Mapping[str, str] | None,
+        timeout: float,
+    ) -> Any:
+        from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+            PipelinePollException,
+        )
+
+        # The serving session enforces `timeout`: only guard against its loss.
+        client.settimeout(timeout + self.max_interval + self.request_timeout)
+        _send_message(
+            client,
+            {
+                "key": key,
+                "base_url": base_url,
+                "path": path,
+                "headers": dict(headers or {}),
+                "timeout": timeout,
+            },
+        )
+
+        reader = client.makefile("rb")
+        while True:
+            message = _read_message(reader)
+            if message is None:
+                raise ConnectionError("Pipeline poller session closed")
+            if message.get("error") == "timeout":
+                raise TimeoutError(message["message"])
+            if message.get("error") == "status":
+                raise PipelinePollException(status=message["status"], target=key)
+
+            status, done = describe(message["payload"])
+            _send_message(client, {"status": status, "done": done})
+            if done:
+                return message["payload"]
+
+    def _watch(
+        self,
+        key: str,
+        base_url: str,
+        path: str,
+        headers: Mapping[str, str] | None,
+        timeout: float,
+    ) -> Iterator[Any]:
+        import queue
+        import time
+
+        self._start()
+        inbox: queue.Queue = queue.Queue()
+        target = ((base_url, path, dict(headers or {})), inbox)
+        self._loop.call_soon_threadsafe(self._add_target, key, target)
+        deadline = time.monotonic() + timeout
+
+        try:
+            while True:
+                try:
+                    item = inbox.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"{key} still pending after {timeout}s"
+                    ) from None
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._remove_target, key, inbox)
+            with self._lock:
+                self._statuses.pop(key, None)
+
+
+def _read_message(reader) -> dict | None:
+    line = reader.readline()
+    return json.loads(line) if line else None
+
+
+def _send_message(conn: socket.socket, message: dict) -> None:
+    conn.sendall(json.dumps(message).encode() + b"\n")
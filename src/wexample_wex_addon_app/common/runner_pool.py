@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from wexample_filestate.item.file.json_file import JsonFile
+    from wexample_runner.runner.docker_runner import DockerRunner
+
+# Prefix of the containers started by a pool.
+RUNNER_POOL_CONTAINER_PREFIX: str = "wex-runner-pool"
+# Seconds a pooled container stays up unused, when no TTL is configured.
+RUNNER_POOL_IDLE_TTL: int = 600
+
+
+@base_class
+class RunnerPool(BaseClass):
+    """Runner containers kept warm between commands and between processes.
+
+    A pooled container is keyed by the digest of its image and its mounts,
+    so every runner asking for the same image over the same paths shares
+    it. It is started on first use and never removed at process exit: the
+    state file records when each container was last used and its TTL. Any
+    pool using that state file removes the ones idle for longer than their
+    TTL when it acquires a container or ends a command, and the
+    `app::runner/reap` command removes them on demand.
+
+    Commands run within `use()`, which leases the container in the state
+    file: a container leased by a live process is never removed, however
+    long the command runs, and counts as used when its last lease ends.
+
+    Within a process, an acquired container is trusted without asking the
+    daemon again; `forget()` it when a command finds it gone.
+    """
+
+    _shared: ClassVar[dict[str, RunnerPool]] = {}
+
+    idle_ttl: float = public_field(
+        default=RUNNER_POOL_IDLE_TTL,
+        description="Seconds an unused container stays up",
+    )
+    state_path: Path = public_field(
+        description="JSON file recording the containers of the pool"
+    )
+    _acquired: dict[str, DockerRunner] = private_field(
+        factory=dict, description="Pooled runner, by container name of the runner"
+    )
+    _leases: dict[str, int] = private_field(
+        factory=dict,
+        description="Commands of this process running, by pooled container",
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the acquired runners and leases"
+    )
+
+    @classmethod
+    def get_state_path(cls, app_path: Path) -> Path:
+        """State file of the pool of the app at `app_path`."""
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.const.path import APP_FILE_RUNNER_POOL
+
+        return Path(app_path) / APP_PATH_TMP / APP_FILE_RUNNER_POOL
+
+    @classmethod
+    def shared(cls, state_path: Path, idle_ttl: float) -> RunnerPool:
+        """Pool of the given state file, shared by the whole process."""
+        key = str(state_path)
+        pool = cls._shared.get(key)
+        if pool is None or pool.idle_ttl != idle_ttl:
+            pool = cls(state_path=state_path, idle_ttl=idle_ttl)
+            cls._shared[key] = pool
+        return pool
+
+    def acquire(self, runner: DockerRunner) -> DockerRunner:
+        """Return a runner executing in the warm container matching `runner`.
+
+        Builds the image when needed and starts the container when it is
+        missing or stopped. Run commands within `use()` instead, so that the
+        container is not removed under them.
+        """
+        import time
+
+        key = runner.container_name
+        with self._lock:
+            pooled = self._acquired.get(key)
+            if pooled is not None:
+                return pooled
+
+            now = time.time()
+            runner.build()
+            pooled = _clone_runner(
+                runner, self.get_container_name(runner.image_name, runner.volumes)
+            )
+            with _lock_state(self.state_path) as state:
+                self._reap(state, now, keep=pooled.container_name)
+                _start_container(pooled)
+                state[pooled.container_name] = {
+                    **state.get(pooled.container_name, {}),
+                    "idle_ttl": self.idle_ttl,
+                    "image": pooled.image_name,
+                    "last_used": now,
+                    "volumes": pooled.volumes,
+                }
+            self._acquired[key] = pooled
+            return pooled
+
+    def forget(self, runner: DockerRunner) -> None:
+        """Drop the in-process knowledge of the container of `runner`."""
+        with self._lock:
+            self._acquired.pop(runner.container_name, None)
+
+    def get_container_name(self, image_name: str, volumes: dict[str, str]) -> str:
+        import hashlib
+        import json
+
+        from wexample_wex_addon_app.helper.docker import docker_image_id
+
+        # The digest rather than the name: a rebuilt image gets a container
+        # of its own, the previous one is left to expire.
+        image_id = docker_image_id(image_name) or image_name
+        key = json.dumps([image_id, sorted(volumes.items())])
+        return (
+            f"{RUNNER_POOL_CONTAINER_PREFIX}-"
+            f"{hashlib.sha256(key.encode()).hexdigest()[:12]}"
+        )
+
+    def reap(self) -> list[str]:
+        """Remove the containers idle for longer than their TTL, return their names."""
+        import time
+
+        with self._lock, _lock_state(self.state_path) as state:
+            return self._reap(state, time.time())
+
+    @contextmanager
+    def use(self, runner: DockerRunner) -> Iterator[DockerRunner]:
+        """Acquire the container matching `runner`, leased while in the block."""
+        pooled = self.acquire(runner)
+        container_name = pooled.container_name
+        with self._lock:
+            self._leases[container_name] = self._leases.get(container_name, 0) + 1
+            if self._leases[container_name] == 1:
+                self._update_lease(container_name, leased=True)
+
+        try:
+            yield pooled
+        finally:
+            with self._lock:
+                self._leases[container_name] -= 1
+                if not self._leases[container_name]:
+                    del self._leases[container_name]
+                    self._update_lease(container_name, leased=False)
+
+    def _reap(
+        self, state: dict[str, Any], now: float, keep: str | None = None
+    ) -> list[str]:
+        reaped = []
+        for container_name, entry in list(state.items()):
+            if container_name == keep or _is_leased(entry):
+                continue
+            idle_ttl = float(entry.get("idle_ttl", self.idle_ttl))
+            if now - float(entry.get("last_used") or 0) <= idle_ttl:
+                continue
+            _remove_container(container_name)
+            del state[container_name]
+            reaped.append(container_name)
+
+        if reaped:
+            reaped_names = set(reaped)
+            self._acquired = {
+                key: pooled
+                for key, pooled in self._acquired.items()
+                if pooled.container_name not in reaped_names
+            }
+        return reaped
+
+    def _update_lease(self, container_name: str, leased: bool) -> None:
+        import os
+        import time
+
+        now = time.time()
+        pid = os.getpid()
+        with _lock_state(self.state_path) as state:
+            if not leased:
+                # Nothing else would remove the containers of a pool once
+                # no more commands use it.
+                self._reap(state, now, keep=container_name)
+            entry = state.get(container_name)
+            if entry is None:
+                return
+            leases = [lease for lease in entry.get("leases") or [] if lease != pid]
+            if leased:
+                leases.append(pid)
+            entry["leases"] = leases
+            entry["last_used"] = now
+
+
+def _clone_runner(runner: DockerRunner, container_name: str) -> DockerRunner:
+    from wexample_runner.runner.docker_runner import DockerRunner
+
+    return DockerRunner(
+        image_name=runner.image_name,
+        dockerfile_path=runner.dockerfile_path,
+        volumes=runner.volumes,
+        env=runner.env,
+        container_name=container_name,
+        workdir=runner.workdir,
+        user=runner.user,
+        command=runner.command,
+    )
+
+
+def _get_state_file(path: Path) -> JsonFile:
+    from wexample_filestate.item.file.json_file import JsonFile
+
+    return JsonFile.create_from_path(path=path, configure=False)
+
+
+def _is_leased(entry: dict[str, Any]) -> bool:
+    import os
+
+    # Leases of processes that died without releasing them do not count.
+    for pid in entry.get("leases") or []:
+        if not isinstance(pid, int) or pid <= 0:
+            continue
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            continue
+        except OSError:
+            # Alive, but owned by another user.
+            pass
+        return True
+    return False
+
+
+@contextmanager
+def _lock_state(state_path: Path) -> Iterator[dict[str, Any]]:
+    # Yields the state under an exclusive lock, written back on a clean exit.
+    import fcntl
+
+    from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = state_path.with_name(f"{state_path.name}.lock")
+    with lock_path.open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        state_file = _get_state_file(state_path)
+        try:
+            state = state_file.read_parsed() if state_path.exists() else {}
+        except (OSError, ValueError):
+            state = {}
+        state = state if isinstance(state, dict) else {}
+
+        yield state
+
+        state_file.write_parsed(state)
+        file_chown_as_real_user_if_elevated(state_path)
+
+
+def _remove_container(container_name: str) -> None:
+    from wexample_helpers.helper.shell import shell_run
+
+    # Forced: the container idles on a command that may ignore the stop
+    # signal, and would hold the removal for docker's grace period.
+    shell_run(cmd=["docker", "rm", "-f", container_name], capture=True, check=False)
+
+
+def _start_container(runner: DockerRunner) -> None:
+    from wexample_helpers.helper.docker import (
+        docker_run_container,
+        docker_start_container,
+    )
+    from wexample_helpers.helper.user import user_get_real_gid, user_get_real_uid
+
+    from wexample_wex_addon_app.helper.docker import docker_inspect_containers
+
+    container = docker_inspect_containers([runner.container_name]).get(
+        runner.container_name
+    )
+    if container is None:
+        # No atexit removal, unlike DockerRunner.start(): the container
+        # outlives this process until it expires.
+        docker_run_container(
+            runner.container_name,
+            runner.image_name,
+            volumes=runner.volumes,
+            user=f"{user_get_real_uid()}:{user_get_real_gid()}",
+            command=runner.command,
+        )
+    elif not (container.get("State") or {}).get("Running"):
+        docker_start_container(runner.container_name)
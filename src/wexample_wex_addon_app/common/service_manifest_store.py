@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from wexample_filestate.item.file.json_file import JsonFile
+
+# Bump when the snapshot layout changes.
+SERVICE_MANIFEST_STORE_VERSION: int = 1
+
+
+@base_class
+class ServiceManifestStore(BaseClass):
+    """Service dirs and `service.yml` manifests of every addon, loaded once.
+
+    The first lookup lists the `services/` dir of each addon and parses every
+    manifest; later lookups (dir, raw or merged manifest, inheritance chain,
+    services by tag) are answered from memory. The parsed manifests are also
+    kept in a snapshot file, reused by the next process as long as the stats
+    of the services dirs and manifests did not change, so YAML is only parsed
+    again after an edit.
+    """
+
+    services_paths: list[Path] = public_field(
+        description="The `services/` dir of each addon, first one wins"
+    )
+    snapshot_path: Path | None = public_field(
+        default=None, description="JSON file keeping parsed manifests across runs"
+    )
+    _chains: dict[str, list[str]] = private_field(
+        factory=dict, description="Inheritance chains, keyed by service name"
+    )
+    _manifests: dict[str, dict[str, Any]] = private_field(
+        factory=dict, description="Merged manifests, keyed by service name"
+    )
+    _services: list[list] | None = private_field(
+        default=None,
+        description="[name, dir, raw manifest] of each service dir, in scan order",
+    )
+    _services_by_name: dict[str, list] | None = private_field(
+        default=None, description="Entry of `_services` found first for each name"
+    )
+    _tags: dict[str, list[str]] | None = private_field(
+        default=None, description="Service names declaring each tag"
+    )
+
+    def find_service_dir(self, service_name: str) -> Path | None:
+        service = self._get_services_by_name().get(service_name)
+        return Path(service[1]) if service else None
+
+    def find_services_by_tag(self, tag: str) -> list[str]:
+        if self._tags is None:
+            tags: dict[str, list[str]] = {}
+            for name, _, _ in self._load():
+                for service_tag in self.get_manifest(name).get("tags") or []:
+                    tags.setdefault(service_tag, []).append(name)
+            self._tags = tags
+        return list(self._tags.get(tag, []))
+
+    def get_inheritance_chain(self, service_name: str) -> list[str]:
+        if service_name in self._chains:
+            return list(self._chains[service_name])
+
+        chain: list[str] = []
+        current = service_name
+        visiting: set[str] = set()
+
+        while current:
+            if current in visiting:
+                raise ValueError(
+                    f"Cyclic service inheritance detected: {' -> '.join(chain + [current])}"
+                )
+
+            visiting.add(current)
+            chain.append(current)
+            parent = self.get_manifest_raw(current).get("extends")
+            current = str(parent) if parent else ""
+
+        chain.reverse()
+        self._chains[service_name] = chain
+        return list(chain)
+
+    def get_manifest(self, service_name: str) -> dict[str, Any]:
+        """Manifest merged along the inheritance chain. Do not mutate it."""
+        from wexample_helpers.helper.dict import dict_merge
+
+        if service_name in self._manifests:
+            return self._manifests[service_name]
+
+        merged: dict[str, Any] = {}
+        list_keys = {"tags", "dependencies"}
+
+        for inherited_service_name in self.get_inheritance_chain(service_name):
+            raw_manifest = self.get_manifest_raw(inherited_service_name)
+            merged = dict_merge(merged, raw_manifest)
+
+            for key in list_keys:
+                seen: dict[Any, None] = {}
+                for source in (merged, raw_manifest):
+                    for v in source.get(key, []) or []:
+                        seen[v] = None
+                if seen:
+                    merged[key] = list(seen)
+
+        merged.pop("extends", None)
+        self._manifests[service_name] = merged
+        return merged
+
+    def get_manifest_raw(self, service_name: str) -> dict[str, Any]:
+        """Parsed `service.yml` of the service. Do not mutate it."""
+        service = self._get_services_by_name().get(service_name)
+        return service[2] if service else {}
+
+    def _get_file(self) -> JsonFile:
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        return JsonFile.create_from_path(path=self.snapshot_path, configure=False)
+
+    def _get_services_by_name(self) -> dict[str, list]:
+        if self._services_by_name is None:
+            by_name: dict[str, list] = {}
+            for service in self._load():
+                by_name.setdefault(service[0], service)
+            self._services_by_name = by_name
+        return self._services_by_name
+
+    def _load(self) -> list[list]:
+        if self._services is not None:
+            return self._services
+
+        services_paths = [str(path) for path in self.services_paths]
+        snapshot = self._read_snapshot()
+        if (
+            snapshot
+            and snapshot.get("services_paths") == services_paths
+            and _stats_match(snapshot.get("stats") or {})
+        ):
+            self._services = snapshot.get("services") or []
+            return self._services
+
+        self._services = self._scan()
+        self._write_snapshot(services_paths)
+        return self._services
+
+    def _read_snapshot(self) -> dict | None:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return None
+        try:
+            data = self._get_file().read_parsed() or {}
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != SERVICE_MANIFEST_STORE_VERSION:
+            return None
+        return data
+
+    def _scan(self) -> list[list]:
+        from wexample_helpers_yaml.helper.yaml_helpers import yaml_read
+
+        services: list[list] = []
+        for services_path in self.services_paths:
+            if not services_path.is_dir():
+                continue
+
+            for service_dir in sorted(services_path.iterdir()):
+                if not service_dir.is_dir():
+                    continue
+
+                manifest = (
+                    yaml_read(file_path=str(service_dir / "service.yml"), default={})
+                    or {}
+                )
+                services.append([service_dir.name, str(service_dir), manifest])
+        return services
+
+    def _write_snapshot(self, services_paths: list[str]) -> None:
+        import json
+
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        if self.snapshot_path is None:
+            return
+
+        # Manifests using YAML-only types (dates, non-string keys...) would
+        # not read back identical: keep parsing those from YAML.
+        try:
+            if json.loads(json.dumps(self._services)) != self._services:
+                return
+        except (TypeError, ValueError):
+            return
+
+        stats: dict[str, list[int] | None] = {}
+        for services_path in services_paths:
+            stats[services_path] = _stat(services_path)
+        for _, service_dir, _ in self._services:
+            stats[service_dir] = _stat(service_dir)
+            manifest_path = os.path.join(service_dir, "service.yml")
+            stats[manifest_path] = _stat(manifest_path)
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            self._get_file().write_parsed(
+                {
+                    "version": SERVICE_MANIFEST_STORE_VERSION,
+                    "services_paths": services_paths,
+                    "stats": stats,
+                    "services": self._services,
+                }
+            )
+            file_chown_as_real_user_if_elevated(self.snapshot_path)
+        except OSError:
+            # Without a snapshot, the next process parses the manifests again.
+            pass
+
+
+def _stat(path: str) -> list[int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _stats_match(stats: dict[str, list[int] | None]) -> bool:
+    # A dir mtime changes when an entry is added or removed in it, which
+    # covers new services and new or deleted manifests.
+    return all(_stat(path) == recorded for path, recorded in stats.items())
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Length of each docker events request, in seconds.
+SERVICE_READINESS_EVENTS_WINDOW: float = 1.0
+
+
+@base_class
+class ServiceReadinessWaiter(BaseClass):
+    """Run the ready checks of services until all of them pass.
+
+    Checks of different services due together run concurrently, so they
+    must not share the kernel: app/start runs each hook in a manager
+    process of its own. A service that is not ready is checked again as
+    soon as its container starts or reports a health status, from docker
+    events, and otherwise after a fallback delay: `health_recheck_interval`
+    while its container health check has not passed yet, when set, and
+    `recheck_interval` in every other case (including when events are not
+    available).
+
+    `poll` matches the `io.pending` callback contract and never blocks more
+    than `tick` seconds, so the progress view keeps refreshing.
+    """
+
+    checks: dict[str, Callable[[], Any]] = public_field(
+        description="Ready check of each service, truthy once ready"
+    )
+    containers: dict[str, str] = public_field(
+        factory=dict, description="Container watched for each service"
+    )
+    health_recheck_interval: float | None = public_field(
+        default=None,
+        description="Fallback delay while a container is not healthy yet, if set",
+    )
+    recheck_interval: float = public_field(
+        default=2.0, description="Fallback delay for the other services"
+    )
+    tick: float = public_field(
+        default=0.5, description="Longest time `poll` blocks, in seconds"
+    )
+    _awaiting_health: set[str] = private_field(
+        factory=set, description="Services whose container is not healthy yet"
+    )
+    _due: dict[str, float] = private_field(
+        factory=dict, description="When each pending service is checked next"
+    )
+    _events_live: bool = private_field(
+        default=False, description="Whether docker events are being watched"
+    )
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the due times"
+    )
+    _pending: list[str] | None = private_field(
+        default=None, description="Services not ready yet, None before the start"
+    )
+    _stop: threading.Event = private_field(
+        factory=threading.Event, description="Ends the events watcher"
+    )
+    _wake: threading.Event = private_field(
+        factory=threading.Event, description="Set when a check became due early"
+    )
+    _watcher: threading.Thread | None = private_field(
+        default=None, description="Thread reading docker events"
+    )
+
+    def close(self) -> None:
+        # The watcher ends with its current events window; waiting for it
+        # would only delay the caller.
+        self._stop.set()
+        self._watcher = None
+
+    def poll(self) -> tuple[bool, list[str]]:
+        """Run the checks that are due, return (all ready, status lines)."""
+        import time
+
+        if self._pending is None:
+            self._start()
+
+        due = self._take_due(time.monotonic())
+        if not due:
+            with self._lock:
+                next_due = min(self._due.values(), default=time.monotonic())
+            self._wake.wait(max(0.0, min(self.tick, next_due - time.monotonic())))
+            self._wake.clear()
+            due = self._take_due(time.monotonic())
+
+        if due:
+            results = self._run_checks(due)
+            now = time.monotonic()
+            with self._lock:
+                for service_name in due:
+                    if results[service_name]:
+                        self._pending.remove(service_name)
+                        self._due.pop(service_name, None)
+                    else:
+                        self._due[service_name] = now + self._get_interval(
+                            service_name
+                        )
+
+        if not self._pending:
+            self.close()
+            return True, []
+
+        return False, [
+            f"{service_name} is not ready yet..." for service_name in self._pending
+        ]
+
+    def _get_interval(self, service_name: str) -> float:
+        if (
+            self.health_recheck_interval is not None
+            and self._events_live
+            and service_name in self._awaiting_health
+        ):
+            return self.health_recheck_interval
+        return self.recheck_interval
+
+    def _run_checks(self, service_names: list[str]) -> dict[str, bool]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        if len(service_names) == 1:
+            return {service_names[0]: bool(self.checks[service_names[0]]())}
+
+        with ThreadPoolExecutor(max_workers=len(service_names)) as executor:
+            futures = {
+                service_name: executor.submit(self.checks[service_name])
+                for service_name in service_names
+            }
+            return {
+                service_name: bool(future.result())
+                for service_name, future in futures.items()
+            }
+
+    def _start(self) -> None:
+        import time
+
+        from wexample_wex_addon_app.helper.docker import (
+            docker_engine_client,
+            docker_inspect_containers,
+        )
+
+        self._pending = list(self.checks)
+        self._due = dict.fromkeys(self._pending, 0.0)
+
+        watched = {
+            service_name: container
+            for service_name, container in self.containers.items()
+            if service_name in self.checks
+        }
+        if not watched or docker_engine_client() is None:
+            return
+
+        inspected = docker_inspect_containers(list(watched.values()))
+        for service_name, container in watched.items():
+            health = ((inspected.get(container) or {}).get("State") or {}).get(
+                "Health"
+            )
+            if health and health.get("Status") != "healthy":
+                self._awaiting_health.add(service_name)
+
+        self._events_live = True
+        self._watcher = threading.Thread(
+            target=self._watch_events,
+            args=(watched, time.time()),
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def _take_due(self, now: float) -> list[str]:
+        with self._lock:
+            return [
+                service_name
+                for service_name in self._pending
+                if self._due.get(service_name, now) <= now
+            ]
+
+    def _watch_events(self, watched: dict[str, str], since: float) -> None:
+        import time
+
+        from wexample_wex_addon_app.helper.docker import docker_container_events
+
+        services_by_container = {
+            container: service_name for service_name, container in watched.items()
+        }
+
+        def on_event(event: dict[str, str]) -> None:
+            service_name = services_by_container.get(event["name"])
+            action = event["action"]
+            if service_name is None:
+                return
+            if action == "health_status: healthy":
+                self._awaiting_health.discard(service_name)
+            elif action.startswith("health_status"):
+                self._awaiting_health.add(service_name)
+                return
+            elif action not in ("start", "restart", "unpause"):
+                return
+            with self._lock:
+                if service_name in self._due:
+                    self._due[service_name] = 0.0
+            self._wake.set()
+
+        while not self._stop.is_set():
+            until = time.time() + SERVICE_READINESS_EVENTS_WINDOW
+            if not docker_container_events(
+                list(watched.values()), since, until, on_event
+            ):
+                # No events: every service falls back to plain polling.
+                self._events_live = False
+                fallback = time.monotonic() + self.recheck_interval
+                with self._lock:
+                    for service_name, due in self._due.items():
+                        self._due[service_name] = min(due, fallback)
+                return
+            since = until
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import ClassVar
+
+from wexample_helpers.classes.base_class import BaseClass
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.classes.private_field import private_field
+from wexample_helpers.decorator.base_class import base_class
+
+WEBHOOK_TOKENS_FILE_NAME: str = "webhook_tokens.yml"
+
+
+@base_class
+class WebhookTokenIndex(BaseClass):
+    """Webhook tokens of every app under a base directory, kept in memory.
+
+    Apps live at `{apps_base_path}/{env}/{app_name}`. The route table lists
+    them once and is listed again only when a lookup misses and the base or
+    an env directory changed, so unknown or malformed routes never reach
+    the filesystem beyond a few stats. Each tokens file is parsed once, then
+    only checked with a stat per lookup: it is parsed again when its mtime,
+    size or inode changed, so edited or revoked tokens apply on the next
+    request.
+
+    Lookups are thread-safe, the webhook server handles requests in threads.
+    """
+
+    _shared: ClassVar[dict[str, WebhookTokenIndex]] = {}
+
+    apps_base_path: Path = public_field(description="Directory holding env dirs")
+    _lock: threading.Lock = private_field(
+        factory=threading.Lock, description="Guards the rebuilds"
+    )
+    _routes: dict[tuple[str, str], Path] = private_field(
+        factory=dict, description="App directory of each (env, app name)"
+    )
+    _routes_stamp: tuple | None = private_field(
+        default=None, description="Stats of the directories listed in the routes"
+    )
+    _tokens: dict[Path, tuple[tuple, dict[str, str]]] = private_field(
+        factory=dict, description="File stats and tokens of each tokens file"
+    )
+
+    @classmethod
+    def shared(cls, apps_base_path: Path | str) -> WebhookTokenIndex:
+        """Index of the given base directory, shared by the whole process."""
+        key = os.path.abspath(apps_base_path)
+        index = cls._shared.get(key)
+        if index is None:
+            index = cls._shared.setdefault(key, cls(apps_base_path=Path(key)))
+        return index
+
+    def get_app_path(self, env: str, app_name: str) -> Path | None:
+        """Directory of an existing app, None for unknown routes."""
+        app_path = self._routes.get((env, app_name))
+        if app_path is None and self._get_routes_stamp() != self._routes_stamp:
+            with self._lock:
+                self._build_routes()
+            app_path = self._routes.get((env, app_name))
+        return app_path
+
+    def get_token(self, env: str, app_name: str, command_str: str) -> str | None:
+        """Expected token of a command, None when the app defines none."""
+        from wexample_app.const.globals import WORKDIR_LOCAL_DIR_NAME, WORKDIR_SETUP_DIR
+
+        app_path = self.get_app_path(env, app_name)
+        if app_path is None:
+            return None
+
+        token_file = (
+            app_path / WORKDIR_SETUP_DIR / WORKDIR_LOCAL_DIR_NAME
+        ) / WEBHOOK_TOKENS_FILE_NAME
+        try:
+            stat = os.stat(token_file)
+        except OSError:
+            self._tokens.pop(token_file, None)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._tokens.get(token_file)
+        if cached is None or cached[0] != stamp:
+            with self._lock:
+                cached = (stamp, _read_tokens(token_file))
+                self._tokens[token_file] = cached
+
+        return cached[1].get(command_str)
+
+    def _build_routes(self) -> None:
+        stamp = self._get_routes_stamp()
+        routes: dict[tuple[str, str], Path] = {}
+        for env_entry in _scan_dirs(self.apps_base_path):
+            for app_entry in _scan_dirs(Path(env_entry.path)):
+                routes[(env_entry.name, app_entry.name)] = Path(app_entry.path)
+
+        self._routes = routes
+        self._routes_stamp = stamp
+
+    def _get_routes_stamp(self) -> tuple:
+        # Adding or removing an app changes the mtime of its env directory.
+        stamps = []
+        for path in [self.apps_base_path, *self._get_env_paths()]:
+            try:
+                stamps.append((str(path), os.stat(path).st_mtime_ns))
+            except OSError:
+                stamps.append((str(path), None))
+        return tuple(stamps)
+
+    def _get_env_paths(self) -> list[Path]:
+        return [Path(entry.path) for entry in _scan_dirs(self.apps_base_path)]
+
+
+def _read_tokens(token_file: Path) -> dict[str, str]:
+    from wexample_helpers_yaml.helper.yaml_helpers import yaml_read
+
+    content = yaml_read(file_path=str(token_file), default={}) or {}
+    return {
+        str(command): str(token)
+        for command, token in content.items()
+        if isinstance(token, (str, int)) and token != ""
+    }
+
+
+def _scan_dirs(path: Path) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            return sorted(
+                (
+                    entry
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ),
+                key=lambda entry: entry.name,
+            )
+    except OSError:
+        return []
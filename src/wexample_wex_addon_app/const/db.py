@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+DB_DUMP_COMPRESSION_GZIP: str = "gzip"
+DB_DUMP_COMPRESSION_NONE: str = "none"
+DB_DUMP_COMPRESSION_ZIP: str = "zip"
+DB_DUMP_COMPRESSION_ZSTD: str = "zstd"
+
+# File suffix appended after ".sql" for each compression.
+DB_DUMP_COMPRESSION_SUFFIXES: dict[str, str] = {
+    DB_DUMP_COMPRESSION_GZIP: ".gz",
+    DB_DUMP_COMPRESSION_NONE: "",
+    DB_DUMP_COMPRESSION_ZIP: ".zip",
+    DB_DUMP_COMPRESSION_ZSTD: ".zst",
+}
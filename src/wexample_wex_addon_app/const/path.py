@@ -3,6 +3,20 @@ from __future__ import annotations
 from pathlib import Path
 
 # filestate: python-constant-sort
+APP_DIR_WHEELHOUSE: Path = Path("wheelhouse")
+APP_FILE_APP_MANAGER_LOCK: Path = Path("app-manager.lock")
+APP_FILE_APP_MANAGER_SOCKET: Path = Path("app-manager.sock")
+APP_FILE_BENCHMARK_HISTORY: Path = Path("benchmark.history.jsonl")
+APP_FILE_COMMAND_INDEX: Path = Path("command.index.json")
+APP_FILE_CONFIG_BUILD_CACHE: Path = Path("config.build.cache.json")
+APP_FILE_IMAGE_BUILD_CACHE: Path = Path("image.build.cache.json")
+APP_FILE_IMPORT_INDEX: Path = Path("import.index.json")
+APP_FILE_PACKAGE_IMPACT_GRAPH: Path = Path("package.impact.graph.json")
+APP_FILE_PIPELINE_POLLER_SOCKET: Path = Path("pipeline-poller.sock")
+APP_FILE_PROPAGATION_LOCK: Path = Path("propagation.lock")
+APP_FILE_RUNNER_POOL: Path = Path("runner.pool.json")
+APP_FILE_RUNTIME_CONFIG_CACHE: Path = Path("config.runtime.cache.json")
+APP_FILE_SERVICE_MANIFESTS: Path = Path("service.manifests.json")
 APP_PATH_EXAMPLES: Path = Path("examples")
 APP_PATH_LICENSE: Path = Path("LICENSE")
 APP_PATH_README: Path = Path("README.md")
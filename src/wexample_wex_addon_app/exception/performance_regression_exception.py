@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+from wexample_app.exception.app_runtime_exception import AppRuntimeException
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class PerformanceRegressionException(AppRuntimeException):
+    """Exception raised when benchmarks regressed beyond the accepted threshold."""
+
+    error_code: ClassVar[str] = "PERFORMANCE_REGRESSION"
+    benchmark_names: list[str] = public_field(
+        description="Benchmarks whose median regressed significantly"
+    )
+    reference: str = public_field(description="Run the benchmarks were compared with")
+    threshold_pct: float = public_field(description="Accepted regression, in percent")
+
+    def _build_message(self) -> str:
+        names = "\n".join(f" - {name}" for name in self.benchmark_names)
+        return (
+            f"{len(self.benchmark_names)} benchmark(s) regressed by "
+            f"{self.threshold_pct}% or more compared with {self.reference}:\n{names}"
+        )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+from wexample_app.exception.app_runtime_exception import AppRuntimeException
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class PipelinePollException(AppRuntimeException):
+    """Exception raised when a polled CI endpoint answers a non-retryable status."""
+
+    error_code: ClassVar[str] = "PIPELINE_POLL"
+    status: int = public_field(description="HTTP status code of the response")
+    target: str = public_field(description="Key of the polled endpoint")
+
+    def is_redirect(self) -> bool:
+        return 300 <= self.status < 400
+
+    def _build_message(self) -> str:
+        return f"Polling pipeline {self.target} failed with HTTP status {self.status}."
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import ClassVar
+
+from wexample_app.exception.app_runtime_exception import AppRuntimeException
+from wexample_helpers.classes.field import public_field
+from wexample_helpers.decorator.base_class import base_class
+
+
+@base_class
+class SuiteTestsFailedException(AppRuntimeException):
+    """Exception raised when the tests of some packages of a suite failed."""
+
+    error_code: ClassVar[str] = "SUITE_TESTS_FAILED"
+    package_names: list[str] = public_field(
+        description="Packages whose tests failed, in completion order"
+    )
+    tested_count: int = public_field(description="Number of packages tested")
+
+    def _build_message(self) -> str:
+        names = "\n".join(f" - {name}" for name in self.package_names)
+        return (
+            f"Tests failed in {len(self.package_names)} of {self.tested_count} "
+            f"package(s):\n{names}"
+        )
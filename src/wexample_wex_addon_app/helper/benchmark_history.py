@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Value of `--compare` selecting the run recorded as baseline.
+BENCHMARK_HISTORY_BASELINE: str = "baseline"
+# Changes of the median smaller than this share are never flagged, in percent.
+BENCHMARK_HISTORY_MIN_CHANGE_PCT: float = 5.0
+# Change of the median, in standard errors, above which it is not noise.
+BENCHMARK_HISTORY_SIGNIFICANCE: float = 2.0
+
+
+def benchmark_history_append(path: Path, run: dict[str, Any]) -> None:
+    """Append one run to the history file, one JSON document per line."""
+    import json
+
+    from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as history_file:
+        history_file.write(json.dumps(run, sort_keys=True) + "\n")
+    file_chown_as_real_user_if_elevated(path)
+
+
+def benchmark_history_compare(
+    baseline_entries: list[dict[str, Any]],
+    current_entries: list[dict[str, Any]],
+    threshold_pct: float = BENCHMARK_HISTORY_MIN_CHANGE_PCT,
+) -> list[dict[str, Any]]:
+    """Compare the medians of each benchmark present in the current run.
+
+    Each item has the benchmark `name`, both medians, the `change_pct` of the
+    median and a `status`: "regression" or "improvement" when the median
+    moved by at least `threshold_pct` and by more than
+    BENCHMARK_HISTORY_SIGNIFICANCE standard errors, "unchanged" otherwise,
+    and "new" when the baseline has no such benchmark.
+
+    Only summary statistics are recorded, so the standard deviation of a run
+    is its `stddev_ms` when the tool reports one, estimated from its range
+    (a quarter of max - min) otherwise.
+    """
+    import math
+
+    baseline_by_name = {entry["name"]: entry for entry in baseline_entries}
+    comparison = []
+    for current in current_entries:
+        baseline = baseline_by_name.get(current["name"])
+        if baseline is None:
+            comparison.append(
+                {
+                    "name": current["name"],
+                    "baseline_ms": None,
+                    "current_ms": current["median_ms"],
+                    "change_pct": None,
+                    "status": "new",
+                }
+            )
+            continue
+
+        baseline_ms = float(baseline["median_ms"])
+        current_ms = float(current["median_ms"])
+        difference = current_ms - baseline_ms
+        change_pct = difference / baseline_ms * 100 if baseline_ms else 0.0
+
+        standard_error = math.sqrt(
+            _benchmark_history_variance_of_median(baseline)
+            + _benchmark_history_variance_of_median(current)
+        )
+        if standard_error:
+            score = difference / standard_error
+        else:
+            score = math.copysign(math.inf, difference) if difference else 0.0
+
+        status = "unchanged"
+        if change_pct >= threshold_pct and score > BENCHMARK_HISTORY_SIGNIFICANCE:
+            status = "regression"
+        elif (
+            change_pct <= -threshold_pct
+            and score < -BENCHMARK_HISTORY_SIGNIFICANCE
+        ):
+            status = "improvement"
+
+        comparison.append(
+            {
+                "name": current["name"],
+                "baseline_ms": baseline_ms,
+                "current_ms": current_ms,
+                "change_pct": round(change_pct, 2),
+                "status": status,
+            }
+        )
+    return comparison
+
+
+def benchmark_history_find_run(
+    runs: list[dict[str, Any]],
+    commit: str | None = None,
+    baseline: bool = False,
+    machine: str | None = None,
+) -> dict[str, Any] | None:
+    """Return the latest run of a commit, or the latest baseline run.
+
+    Runs of the given machine are preferred, as timings of different
+    machines do not compare; another machine's run is returned only when
+    there is none.
+    """
+    matching = [
+        run
+        for run in runs
+        if (commit is None or run.get("commit") == commit)
+        and (not baseline or run.get("baseline"))
+    ]
+    same_machine = [run for run in matching if run.get("machine") == machine]
+    candidates = same_machine or matching
+    return candidates[-1] if candidates else None
+
+
+def benchmark_history_machine_fingerprint() -> str:
+    """Short hash of the host and interpreter, shared by comparable runs."""
+    import hashlib
+    import os
+    import platform
+
+    parts = [
+        platform.node(),
+        platform.system(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+        platform.python_implementation(),
+        ".".join(platform.python_version_tuple()[:2]),
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:12]
+
+
+def benchmark_history_read(path: Path) -> list[dict[str, Any]]:
+    """Return the recorded runs, oldest first; unreadable lines are skipped."""
+    import json
+
+    if not path.exists():
+        return []
+
+    runs = []
+    for line in path.read_text().splitlines():
+        try:
+            run = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(run, dict):
+            runs.append(run)
+    return runs
+
+
+def _benchmark_history_variance_of_median(entry: dict[str, Any]) -> float:
+    stddev = entry.get("stddev_ms")
+    if stddev is None:
+        stddev = (float(entry["max_ms"]) - float(entry["min_ms"])) / 4
+    return float(stddev) ** 2 / max(1, int(entry.get("rounds") or 1))
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from wexample_wex_addon_app.const.db import (
+    DB_DUMP_COMPRESSION_GZIP,
+    DB_DUMP_COMPRESSION_NONE,
+    DB_DUMP_COMPRESSION_SUFFIXES,
+    DB_DUMP_COMPRESSION_ZIP,
+    DB_DUMP_COMPRESSION_ZSTD,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
+DB_DUMP_CHUNK_SIZE: int = 1024 * 1024
+
+
+def db_dump_extract(source: Path, target_dir: Path) -> Path:
+    """Decompress a zip, gzip or zstd dump into a new .sql file of `target_dir`.
+
+    For services restoring from a file rather than from stdin. The file gets
+    a unique name, so no existing dump is overwritten; the caller deletes it.
+    """
+    import os
+    import shutil
+    import tempfile
+    from pathlib import Path
+
+    base_name = source.name.split(".sql", 1)[0]
+    fd, name = tempfile.mkstemp(dir=target_dir, prefix=f"{base_name}.", suffix=".sql")
+    sql_path = Path(name)
+    try:
+        # Readable by the DB container, which may not run as the same user.
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "wb") as target, source.open("rb") as raw:
+            with _db_dump_source(raw, source.name) as sql:
+                shutil.copyfileobj(sql, target, DB_DUMP_CHUNK_SIZE)
+    except BaseException:
+        sql_path.unlink(missing_ok=True)
+        raise
+
+    return sql_path
+
+
+def db_dump_file_name(base_name: str, compression: str) -> str:
+    """Return the dump artifact name, e.g. "local-app-20250101.sql.zst"."""
+    return f"{base_name}.sql{_db_dump_suffix(compression)}"
+
+
+def db_dump_restore(
+    cmd: list[str],
+    source: Path,
+    on_progress: Callable[[int, int, int], None] | None = None,
+) -> int:
+    """Decompress `source` on the fly and pipe the SQL into the stdin of `cmd`.
+
+    Zip, gzip (.gz), zstd (.zst) and plain .sql files are supported; nothing
+    is extracted to disk. `on_progress` receives the SQL bytes sent, then the
+    archive bytes consumed out of its total size.
+
+    Returns the SQL bytes sent. Raises RuntimeError when `cmd` fails.
+    """
+    import os
+    import subprocess
+    import tempfile
+
+    total = source.stat().st_size
+    sent = 0
+
+    with tempfile.TemporaryFile() as stderr, source.open("rb") as raw:
+        process = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+        try:
+            with _db_dump_source(raw, source.name) as sql:
+                while chunk := sql.read(DB_DUMP_CHUNK_SIZE):
+                    process.stdin.write(chunk)
+                    sent += len(chunk)
+                    if on_progress is not None:
+                        consumed = os.lseek(raw.fileno(), 0, os.SEEK_CUR)
+                        on_progress(sent, min(consumed, total), total)
+        except BrokenPipeError:
+            # The restore command exited early: its stderr tells why.
+            pass
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise RuntimeError(
+                f"Restore command failed ({process.returncode}): {' '.join(cmd)}\n"
+                + stderr.read().decode(errors="replace")
+            )
+
+    if on_progress is not None:
+        on_progress(sent, total, total)
+
+    return sent
+
+
+def db_dump_run(
+    cmd: list[str],
+    target: Path,
+    compression: str = DB_DUMP_COMPRESSION_GZIP,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> tuple[int, int]:
+    """Pipe the stdout of `cmd` through the compressor straight into `target`.
+
+    Nothing is written to disk besides the compressed artifact. Raises
+    RuntimeError, without leaving any file behind, when `cmd` fails.
+    """
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        try:
+            sizes = db_dump_stream(
+                process.stdout,
+                target=target,
+                compression=compression,
+                on_progress=on_progress,
+                check=lambda: process.wait() == 0,
+            )
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            process.stdout.close()
+
+        if sizes is None:
+            stderr.seek(0)
+            raise RuntimeError(
+                f"Dump command failed ({process.returncode}): {' '.join(cmd)}\n"
+                + stderr.read().decode(errors="replace")
+            )
+
+    return sizes
+
+
+def db_dump_stream(
+    source: BinaryIO,
+    target: Path,
+    compression: str = DB_DUMP_COMPRESSION_GZIP,
+    on_progress: Callable[[int, int], None] | None = None,
+    check: Callable[[], bool] | None = None,
+) -> tuple[int, int] | None:
+    """Copy `source` into `target` through the selected compressor.
+
+    Data goes to "<target>.part", renamed once complete, so `target` never
+    holds a truncated dump. `on_progress` receives the bytes read and written
+    so far after each chunk. When `check` returns False once the source is
+    exhausted, the partial file is dropped and None is returned.
+
+    Returns the bytes read and the compressed size.
+    """
+    import os
+
+    suffix = _db_dump_suffix(compression)
+    part_path = target.with_name(f"{target.name}.part")
+    read_size = 0
+
+    try:
+        with part_path.open("wb") as raw:
+            entry_name = target.name[: -len(suffix)] if suffix else target.name
+            with _db_dump_sink(raw, compression, entry_name) as sink:
+                while chunk := source.read(DB_DUMP_CHUNK_SIZE):
+                    sink.write(chunk)
+                    read_size += len(chunk)
+                    if on_progress is not None:
+                        on_progress(read_size, os.fstat(raw.fileno()).st_size)
+
+            if check is not None and not check():
+                part_path.unlink()
+                return None
+
+        written_size = part_path.stat().st_size
+        part_path.replace(target)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    if on_progress is not None:
+        on_progress(read_size, written_size)
+
+    return read_size, written_size
+
+
+@contextmanager
+def _db_dump_sink(
+    raw: BinaryIO, compression: str, entry_name: str
+) -> Iterator[BinaryIO]:
+    if compression == DB_DUMP_COMPRESSION_NONE:
+        yield raw
+        return
+
+    if compression == DB_DUMP_COMPRESSION_ZIP:
+        import zipfile
+
+        # `entry_name` is the single member, as in zips made before streaming.
+        with zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(entry_name, "w", force_zip64=True) as sink:
+                yield sink
+        return
+
+    if compression == DB_DUMP_COMPRESSION_GZIP:
+        import gzip
+
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as sink:
+            yield sink
+        return
+
+    if compression == DB_DUMP_COMPRESSION_ZSTD:
+        import subprocess
+
+        # The zstd binary writes directly into the artifact and uses every core.
+        process = subprocess.Popen(
+            ["zstd", "-q", "-c", "-T0"], stdin=subprocess.PIPE, stdout=raw
+        )
+        try:
+            yield process.stdin
+        finally:
+            process.stdin.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"zstd exited with code {returncode}")
+        return
+
+    raise ValueError(f"Unknown dump compression '{compression}'")
+
+
+@contextmanager
+def _db_dump_source(raw: BinaryIO, name: str) -> Iterator[BinaryIO]:
+    if name.endswith(".zip"):
+        import zipfile
+
+        with zipfile.ZipFile(raw) as archive:
+            names = archive.namelist()
+            if not names:
+                raise RuntimeError("Zip file is empty")
+            with archive.open(names[0]) as sql:
+                yield sql
+        return
+
+    if name.endswith(DB_DUMP_COMPRESSION_SUFFIXES[DB_DUMP_COMPRESSION_GZIP]):
+        import gzip
+
+        with gzip.GzipFile(fileobj=raw, mode="rb") as sql:
+            yield sql
+        return
+
+    if name.endswith(DB_DUMP_COMPRESSION_SUFFIXES[DB_DUMP_COMPRESSION_ZSTD]):
+        import subprocess
+
+        # zstd reads the archive through the shared file descriptor, so the
+        # caller can still follow the progress from the raw file offset.
+        process = subprocess.Popen(
+            ["zstd", "-q", "-d", "-c"], stdin=raw, stdout=subprocess.PIPE
+        )
+        try:
+            yield process.stdout
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"zstd exited with code {returncode}")
+        return
+
+    yield raw
+
+
+def _db_dump_suffix(compression: str) -> str:
+    if compression not in DB_DUMP_COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Unknown dump compression '{compression}', expected one of: "
+            + ", ".join(sorted(DB_DUMP_COMPRESSION_SUFFIXES))
+        )
+    return DB_DUMP_COMPRESSION_SUFFIXES[compression]
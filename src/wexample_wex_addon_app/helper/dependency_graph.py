@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from graphlib import TopologicalSorter
+
+R = TypeVar("R")
+
+
+def dependency_graph_closure(
+    dependencies: Mapping[str, Iterable[str]],
+) -> dict[str, set[str]]:
+    """Return, for every node, the nodes it reaches through its dependencies.
+
+    Each node reaches itself. Dependencies pointing outside the graph are
+    ignored. Nodes are visited in topological order, so each closure is the
+    union of the already computed closures of its direct dependencies.
+    """
+    sorter = _dependency_graph_sorter(dependencies)
+    closures: dict[str, set[str]] = {}
+
+    while sorter.is_active():
+        for node in sorter.get_ready():
+            closure = {node}
+            for dependency in dependencies[node]:
+                if dependency in dependencies:
+                    closure |= closures[dependency]
+            closures[node] = closure
+            sorter.done(node)
+
+    return closures
+
+
+def dependency_graph_reverse(
+    dependencies: Mapping[str, Iterable[str]],
+) -> dict[str, list[str]]:
+    """Return, for every node, the nodes depending on it directly, sorted.
+
+    Dependencies pointing outside the graph are ignored.
+    """
+    dependents: dict[str, list[str]] = {node: [] for node in dependencies}
+    for node in sorted(dependencies):
+        for dependency in dependencies[node]:
+            if dependency in dependents and node not in dependents[dependency]:
+                dependents[dependency].append(node)
+    return dependents
+
+
+def dependency_graph_run(
+    dependencies: Mapping[str, Iterable[str]],
+    fn: Callable[[str], R],
+    *,
+    max_workers: int = 1,
+    fail_fast: bool = True,
+    on_done: Callable[[str, R | None, BaseException | None], None] | None = None,
+) -> dict[str, BaseException]:
+    """Run `fn` on every node, starting each one once its dependencies are done.
+
+    Dependencies pointing outside the graph are ignored. At most `max_workers`
+    nodes run at the same time; `fn` is expected to be I/O bound (typically a
+    subprocess), so a thread pool is enough to run nodes in parallel.
+
+    `on_done` is always called from the calling thread, which lets callers
+    print buffered output without interleaving. With `fail_fast`, no new node
+    starts after the first failure, but running ones are allowed to finish.
+
+    Returns the failures, keyed by node, in completion order.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    sorter = _dependency_graph_sorter(dependencies)
+    failures: dict[str, BaseException] = {}
+    ready: list[str] = []
+    max_workers = max(1, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: dict = {}
+
+        while sorter.is_active():
+            if not (fail_fast and failures):
+                ready.extend(sorted(sorter.get_ready()))
+                while ready and len(running) < max_workers:
+                    node = ready.pop(0)
+                    running[executor.submit(fn, node)] = node
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f]):
+                node = running.pop(future)
+                error = future.exception()
+                result = None if error is not None else future.result()
+                if error is not None:
+                    failures[node] = error
+                sorter.done(node)
+                if on_done is not None:
+                    on_done(node, result, error)
+
+    return failures
+
+
+def _dependency_graph_sorter(
+    dependencies: Mapping[str, Iterable[str]],
+) -> TopologicalSorter:
+    from graphlib import CycleError, TopologicalSorter
+
+    sorter: TopologicalSorter = TopologicalSorter()
+    for node in sorted(dependencies):
+        sorter.add(node, *sorted(d for d in dependencies[node] if d in dependencies))
+
+    try:
+        sorter.prepare()
+    except CycleError as err:
+        msg = getattr(err, "args", [None])[0] or "Cyclic dependencies detected"
+        raise ValueError(str(msg)) from err
+
+    return sorter
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from wexample_wex_addon_app.common.docker_engine_client import (
+        DockerEngineClient,
+    )
+
+_COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+# One Engine API client per daemon socket, shared by the whole process.
+_ENGINE_CLIENTS: dict[str, DockerEngineClient] = {}
+
+# The helpers below ask the daemon through the Engine API when its socket is
+# reachable, and run the `docker` CLI otherwise (remote DOCKER_HOST, contexts,
+# socket missing or not accessible).
+
+
+def docker_copy_to_container(
+    container_name: str, local_src: Path | str, container_dest: str
+) -> None:
+    """Copy a local file or dir into a container, like `docker cp`."""
+    from pathlib import Path
+
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            client.container_archive_put(
+                container_name, Path(local_src), container_dest
+            )
+            return
+        except OSError:
+            pass
+
+    subprocess.run(
+        ["docker", "cp", str(local_src), f"{container_name}:{container_dest}"],
+        check=True,
+    )
+
+
+def docker_container_events(
+    container_names: list[str],
+    since: float,
+    until: float,
+    on_event: Callable[[dict[str, str]], None],
+) -> bool:
+    """Pass events of the given containers to `on_event` as they happen.
+
+    Blocks until `until`. Each event is `{"name": ..., "action": ...}`, e.g.
+    "start" or "health_status: healthy". Returns False when the Engine API
+    is not reachable: there is no cheap CLI equivalent, callers poll instead.
+    """
+    client = docker_engine_client()
+    if client is None:
+        return False
+
+    try:
+        for event in client.events(
+            since,
+            until,
+            filters={"type": ["container"], "container": container_names},
+        ):
+            on_event(
+                {
+                    "name": (event.get("Actor") or {})
+                    .get("Attributes", {})
+                    .get("name", ""),
+                    "action": event.get("Action") or event.get("status") or "",
+                }
+            )
+    except (OSError, RuntimeError, ValueError):
+        return False
+    return True
+
+
+def docker_engine_client() -> DockerEngineClient | None:
+    """Shared Engine API client of the local daemon, None to use the CLI."""
+    import os
+
+    from wexample_wex_addon_app.common.docker_engine_client import (
+        DOCKER_ENGINE_SOCKET_PATH,
+        DockerEngineClient,
+    )
+
+    if os.environ.get("DOCKER_CONTEXT"):
+        return None
+
+    host = os.environ.get("DOCKER_HOST", "")
+    if host and not host.startswith("unix://"):
+        return None
+
+    socket_path = host[len("unix://") :] if host else DOCKER_ENGINE_SOCKET_PATH
+    if not os.path.exists(socket_path):
+        return None
+
+    client = _ENGINE_CLIENTS.get(socket_path)
+    if client is None:
+        client = DockerEngineClient(socket_path=socket_path)
+        _ENGINE_CLIENTS[socket_path] = client
+    return client
+
+
+def docker_exec(
+    container_name: str, command: list[str], user: str | None = None
+) -> str:
+    """Run a command in a running container and return its stdout.
+
+    Raises RuntimeError when the command fails, like the CLI-based
+    `wexample_helpers.helper.docker.docker_exec`. The CLI only takes over
+    when the Engine API is unreachable before the command started.
+    """
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            exit_code, stdout, stderr = client.container_exec(
+                container_name, command, user=user
+            )
+        except OSError:
+            pass
+        else:
+            if exit_code != 0:
+                raise RuntimeError(
+                    f"docker exec failed (exit {exit_code}):\n{stderr or stdout}"
+                )
+            return stdout
+
+    from wexample_helpers.helper.docker import docker_exec as docker_exec_cli
+
+    return docker_exec_cli(container_name=container_name, command=command, user=user)
+
+
+def docker_image_exists(image_name: str) -> bool:
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            return client.image_inspect(image_name) is not None
+        except OSError:
+            pass
+
+    from wexample_helpers.helper.docker import docker_image_exists as exists_cli
+
+    return exists_cli(image_name)
+
+
+def docker_image_id(image_name: str) -> str | None:
+    """Return the content digest of a local image, None when it is missing."""
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            image = client.image_inspect(image_name)
+        except OSError:
+            pass
+        else:
+            return image.get("Id") if image else None
+
+    result = subprocess.run(
+        ["docker", "image", "inspect", "--format", "{{.Id}}", image_name],
+        capture_output=True,
+        text=True,
+    )
+    image_id = result.stdout.strip() if result.returncode == 0 else ""
+    return image_id or None
+
+
+def docker_inspect_containers(container_names: list[str]) -> dict[str, dict[str, Any]]:
+    """Return the `docker inspect` data of each existing container, by name.
+
+    All containers are inspected in one batch: a single CLI call, or
+    concurrent Engine API requests.
+    """
+    import json
+
+    if not container_names:
+        return {}
+
+    client = docker_engine_client()
+    if client is not None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_wex_addon_app.common.docker_engine_client import (
+            DOCKER_ENGINE_POOL_SIZE,
+        )
+
+        # One request per container, spread over the pooled connections.
+        try:
+            with ThreadPoolExecutor(max_workers=DOCKER_ENGINE_POOL_SIZE) as executor:
+                items = list(executor.map(client.container_inspect, container_names))
+        except OSError:
+            pass
+        else:
+            return {
+                item["Name"].lstrip("/"): item for item in items if item is not None
+            }
+
+    result = subprocess.run(
+        ["docker", "inspect", *container_names],
+        capture_output=True,
+        text=True,
+    )
+    # Missing containers make the call fail, yet existing ones are printed.
+    try:
+        items = json.loads(result.stdout) if result.stdout.strip() else []
+    except ValueError:
+        return {}
+
+    return {item["Name"].lstrip("/"): item for item in items}
+
+
+def docker_list_containers(include_stopped: bool = False) -> list[dict[str, str]]:
+    """Return containers with their image and state, in one call.
+
+    Each item is `{"name": ..., "image": ..., "state": ...}`, `state` being
+    e.g. "running" or "exited". Returns an empty list when the docker daemon
+    cannot be reached.
+    """
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            return [
+                {
+                    "name": _container_name(container),
+                    "image": container.get("Image") or "",
+                    "state": container.get("State") or "",
+                }
+                for container in client.container_list(include_stopped)
+            ]
+        except OSError:
+            pass
+
+    cmd = ["docker", "ps", "--format", "{{.Names}}\t{{.Image}}\t{{.State}}"]
+    if include_stopped:
+        cmd.insert(2, "-a")
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return []
+
+    containers: list[dict[str, str]] = []
+    for line in result.stdout.splitlines():
+        name, _, rest = line.partition("\t")
+        image, _, state = rest.partition("\t")
+        if name:
+            containers.append({"name": name, "image": image, "state": state})
+    return containers
+
+
+def docker_list_image_tags() -> set[str]:
+    """Return every local image reference as "repository:tag", in one call.
+
+    Returns an empty set when the docker daemon cannot be reached.
+    """
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            return {
+                tag
+                for image in client.image_list()
+                for tag in image.get("RepoTags") or []
+                if not tag.endswith(":<none>")
+            }
+        except OSError:
+            pass
+
+    result = subprocess.run(
+        ["docker", "images", "--format", "{{.Repository}}:{{.Tag}}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return set()
+
+    return {
+        line
+        for line in result.stdout.splitlines()
+        if line and not line.endswith(":<none>")
+    }
+
+
+def docker_list_running_containers() -> list[dict[str, str]]:
+    """Return every running container with its compose project, in one call.
+
+    Each item is `{"name": ..., "project": ...}`; `project` is empty for
+    containers not started by docker compose. Returns an empty list when the
+    docker daemon cannot be reached.
+    """
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            return [
+                {
+                    "name": _container_name(container),
+                    "project": (container.get("Labels") or {}).get(
+                        _COMPOSE_PROJECT_LABEL, ""
+                    ),
+                }
+                for container in client.container_list()
+            ]
+        except OSError:
+            pass
+
+    result = subprocess.run(
+        [
+            "docker",
+            "ps",
+            "--format",
+            f'{{{{.Names}}}}\t{{{{.Label "{_COMPOSE_PROJECT_LABEL}"}}}}',
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return []
+
+    containers: list[dict[str, str]] = []
+    for line in result.stdout.splitlines():
+        name, _, project = line.partition("\t")
+        if name:
+            containers.append({"name": name, "project": project})
+    return containers
+
+
+def docker_remove_container(container_name: str) -> None:
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            client.container_remove(container_name)
+            return
+        except OSError:
+            pass
+
+    from wexample_helpers.helper.docker import docker_remove_container as remove_cli
+
+    remove_cli(container_name)
+
+
+def docker_remove_image(image_name: str) -> None:
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            client.image_remove(image_name)
+            return
+        except OSError:
+            pass
+
+    from wexample_helpers.helper.docker import docker_remove_image as remove_cli
+
+    remove_cli(image_name)
+
+
+def docker_stop_container(container_name: str) -> None:
+    client = docker_engine_client()
+    if client is not None:
+        try:
+            client.container_stop(container_name)
+            return
+        except OSError:
+            pass
+
+    from wexample_helpers.helper.docker import docker_stop_container as stop_cli
+
+    stop_cli(container_name)
+
+
+def _container_name(container: dict[str, Any]) -> str:
+    # `Names` also lists link aliases ("/other/alias"); the CLI shows the
+    # container's own name, the one without a parent.
+    names = [name.lstrip("/") for name in container.get("Names") or []]
+    return next((name for name in names if "/" not in name), names[0] if names else "")
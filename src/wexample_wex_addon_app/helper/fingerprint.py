@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from wexample_helpers.const.types import PathOrString
+
+
+def fingerprint_digest(fingerprints: dict[str, dict | None], *extra: str) -> str:
+    """Return the content address of a set of file fingerprints.
+
+    Only paths and content hashes are taken into account, so touching a file
+    without changing it keeps the same digest. `extra` values (env name, tool
+    version…) are mixed in for inputs that are not files.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(fingerprints):
+        fingerprint = fingerprints[path]
+        digest.update(path.encode())
+        digest.update(b"\0")
+        digest.update((fingerprint["sha256"] if fingerprint else "-").encode())
+        digest.update(b"\n")
+    for value in extra:
+        digest.update(str(value).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def fingerprint_file(path: PathOrString, previous: dict | None = None) -> dict | None:
+    """Return the mtime, size and sha256 of a file, or None when it is missing.
+
+    When `previous` has the same mtime and size, its hash is reused and the
+    file is not read again.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    if (
+        previous
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+        and previous.get("size") == stat.st_size
+    ):
+        sha256 = previous["sha256"]
+    else:
+        try:
+            sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+
+
+def fingerprint_files(
+    paths: Iterable[PathOrString], previous: dict[str, dict | None] | None = None
+) -> dict[str, dict | None]:
+    """Fingerprint every path, keyed by its string form."""
+    previous = previous or {}
+    return {
+        str(path): fingerprint_file(path, previous=previous.get(str(path)))
+        for path in paths
+    }
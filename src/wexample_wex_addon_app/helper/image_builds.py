@@ -5,6 +5,69 @@ from pathlib import Path
 from wexample_app.const.globals import APP_FILE_APP_CONFIG, WORKDIR_SETUP_DIR
 
 
+def build_command(app_path: Path, build: dict, no_cache: bool = True) -> list[str]:
+    cmd = ["docker", "build"]
+    if no_cache:
+        cmd.append("--no-cache")
+    cmd.extend(["-f", str(app_path / build["dockerfile"]), "-t", build["tag"]])
+    for key, value in (build.get("build_args") or {}).items():
+        cmd.extend(["--build-arg", f"{key}={value}"])
+    cmd.append(str(app_path))
+    return cmd
+
+
+def build_context_files(context_path: Path) -> list[Path]:
+    """Return the files docker sends as build context, honouring .dockerignore.
+
+    Matching is a close approximation of docker's rules (last matching pattern
+    wins, `!` re-includes, a directory match excludes its content). The app
+    tmp dir, where build state is kept, is never part of the context.
+    """
+    import os
+
+    from wexample_app.const.globals import APP_PATH_TMP
+
+    patterns = _read_dockerignore(context_path)
+    can_prune = not any(negate for _, negate in patterns)
+    skipped = {APP_PATH_TMP.as_posix()}
+    files: list[Path] = []
+
+    for root, dirs, names in os.walk(context_path):
+        rel_root = Path(root).relative_to(context_path)
+        kept_dirs = []
+        for name in sorted(dirs):
+            rel = (rel_root / name).as_posix()
+            if rel in skipped or (can_prune and _is_dockerignored(rel, patterns)):
+                continue
+            kept_dirs.append(name)
+        dirs[:] = kept_dirs
+
+        for name in sorted(names):
+            rel = (rel_root / name).as_posix()
+            if not _is_dockerignored(rel, patterns):
+                files.append(Path(root) / name)
+
+    return files
+
+
+def build_inputs(app_path: Path, build: dict) -> tuple[list[Path], tuple[str, ...]]:
+    """Return the files and values an image build depends on.
+
+    Feed them to a `ConfigBuildCache` to tell whether the image is up to date.
+    """
+    import json
+
+    dockerfile = app_path / build["dockerfile"]
+    files = list(dict.fromkeys([dockerfile, *build_context_files(app_path)]))
+    build_args = json.dumps(build.get("build_args") or {}, sort_keys=True)
+    return files, (build["tag"], build_args)
+
+
+def build_tag_reference(tag: str) -> str:
+    """Return `tag` as listed by `docker images`, e.g. "app" → "app:latest"."""
+    return tag if ":" in tag.rsplit("/", 1)[-1] else f"{tag}:latest"
+
+
 def load_builds(app_path: Path) -> dict:
     from wexample_wex_addon_app.item.file.app_config_yaml_file import (
         AppConfigYamlFile,
@@ -67,3 +130,38 @@ def _topo_sort(builds: dict, targets: set[str]) -> list[str]:
             visit(node)
 
     return order
+
+
+def _is_dockerignored(rel_path: str, patterns: list[tuple[str, bool]]) -> bool:
+    from fnmatch import fnmatchcase
+
+    parts = rel_path.split("/")
+    candidates = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+    ignored = False
+    for pattern, negate in patterns:
+        if any(
+            fnmatchcase(candidate, pattern)
+            or (pattern.startswith("**/") and fnmatchcase(candidate, pattern[3:]))
+            for candidate in candidates
+        ):
+            ignored = not negate
+    return ignored
+
+
+def _read_dockerignore(context_path: Path) -> list[tuple[str, bool]]:
+    path = context_path / ".dockerignore"
+    if not path.exists():
+        return []
+
+    patterns: list[tuple[str, bool]] = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        pattern = line.lstrip("!").strip().strip("/")
+        if pattern.startswith("./"):
+            pattern = pattern[2:]
+        if pattern:
+            patterns.append((pattern, negate))
+    return patterns
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+# Characters splitting a module reference into its parents: python and JS
+# modules, PHP namespaces.
+IMPORT_INDEX_SEPARATORS: str = "./\\"
+
+
+def import_index_locations(
+    index: Mapping[str, dict],
+    import_names: Mapping[str, str],
+) -> dict[str, list[str]]:
+    """Group the indexed imports by the package they belong to.
+
+    `import_names` maps the root module under which each package is imported
+    (e.g. "wexample_helpers") to the package name. A reference belongs to the
+    package with the longest matching root. Returns "path:line:column"
+    locations keyed by package name; imports of other modules are ignored.
+    """
+    locations: dict[str, list[str]] = {}
+
+    for path in sorted(index):
+        for reference, line, column in index[path].get("imports") or []:
+            package_name = _import_index_owner(reference, import_names)
+            if package_name is not None:
+                locations.setdefault(package_name, []).append(
+                    f"{path}:{line}:{column}"
+                )
+
+    return locations
+
+
+def import_index_parse_python(path: Path) -> list[tuple[str, int, int]]:
+    """Return the absolute modules imported by a python file.
+
+    Relative imports stay inside the package and are skipped, as are files
+    that do not parse.
+    """
+    import ast
+
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    imports: list[tuple[str, int, int]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(
+                (alias.name, node.lineno, node.col_offset + 1) for alias in node.names
+            )
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.append((node.module, node.lineno, node.col_offset + 1))
+
+    return sorted(imports, key=lambda i: (i[1], i[2], i[0]))
+
+
+def import_index_update(
+    files: Iterable[Path],
+    parse: Callable[[Path], Iterable[tuple[str, int, int]]],
+    previous: Mapping[str, dict] | None = None,
+) -> dict[str, dict]:
+    """Return the imports of every file, keyed by path.
+
+    Entries of `previous` are reused for files whose content hash did not
+    change, so only new or modified files go through `parse`. Files missing
+    from `files` are dropped from the index.
+    """
+    from wexample_wex_addon_app.helper.fingerprint import fingerprint_file
+
+    previous = previous or {}
+    index: dict[str, dict] = {}
+
+    for path in files:
+        key = str(path)
+        previous_entry = previous.get(key)
+        fingerprint = fingerprint_file(path, previous=previous_entry)
+        if fingerprint is None:
+            continue
+
+        if previous_entry and previous_entry.get("sha256") == fingerprint["sha256"]:
+            imports = previous_entry.get("imports") or []
+        else:
+            imports = [list(item) for item in parse(Path(path))]
+
+        index[key] = {**fingerprint, "imports": imports}
+
+    return index
+
+
+def _import_index_owner(reference: str, import_names: Mapping[str, str]) -> str | None:
+    if reference in import_names:
+        return import_names[reference]
+
+    for position in range(len(reference) - 1, 0, -1):
+        if reference[position] in IMPORT_INDEX_SEPARATORS:
+            package_name = import_names.get(reference[:position])
+            if package_name is not None:
+                return package_name
+
+    return None
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Mapping
+
+# Delay multiplier applied when a round brought nothing new or failed.
+PIPELINE_POLLER_BACKOFF_FACTOR: float = 2.0
+# Client errors worth retrying; any other 4xx, and redirects, end the poll.
+PIPELINE_POLLER_RETRYABLE_CLIENT_STATUSES: frozenset[int] = frozenset({408, 429})
+PIPELINE_POLLER_USER_AGENT: str = "wexample-pipeline-poller"
+
+
+async def pipeline_poller_close(
+    pools: dict[tuple[str, int, bool], asyncio.Queue],
+) -> None:
+    """Close the idle connections of pools filled by `pipeline_poller_fetch_round`."""
+    for pool in pools.values():
+        while not pool.empty():
+            connection = pool.get_nowait()
+            if connection is not None:
+                connection[1].close()
+    pools.clear()
+
+
+async def pipeline_poller_fetch_round(
+    pools: dict[tuple[str, int, bool], asyncio.Queue],
+    targets: Mapping[str, tuple[str, str, Mapping[str, str]]],
+    etags: dict[str, str],
+    pool_size: int = 4,
+    timeout: float = 30,
+) -> tuple[dict[str, Any], float]:
+    """Fetch every target once, concurrently, over pooled connections.
+
+    `targets` maps a key to the base URL, endpoint and headers to request.
+    `pools` keeps up to `pool_size` keep-alive connections per server across
+    rounds, and `etags` the last ETag of each key, sent back so an unchanged
+    resource costs a bodiless 304. A request still running after `timeout`
+    seconds is abandoned, along with its connection.
+
+    Returns, for each key, the decoded JSON payload, None when unchanged, or
+    the exception of a failed request: PipelinePollException for an answer
+    retrying cannot fix (a redirect, or a client error other than 408 and
+    429), any other exception for a transient failure. Also returns the
+    longest Retry-After delay asked, in seconds.
+    """
+    import asyncio
+    import json
+    import zlib
+    from urllib.parse import urlsplit
+
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+
+    requests = {}
+    for key, (base_url, path, headers) in targets.items():
+        url = urlsplit(base_url)
+        use_ssl = url.scheme == "https"
+        address = (url.hostname or "", url.port or (443 if use_ssl else 80), use_ssl)
+        if address not in pools:
+            # Slots of the connection pool, opened on first use. Last in, first
+            # out so that a single pending target keeps reusing one connection.
+            pools[address] = asyncio.LifoQueue()
+            for _ in range(max(1, pool_size)):
+                pools[address].put_nowait(None)
+        requests[key] = (
+            address,
+            _pipeline_poller_request(
+                url.netloc,
+                f"{url.path.rstrip('/')}/{path.lstrip('/')}",
+                dict(headers),
+                etags.get(key),
+            ),
+        )
+
+    responses = await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                _pipeline_poller_fetch(pools[address], address, request),
+                max(0.0, timeout),
+            )
+            for address, request in requests.values()
+        ),
+        return_exceptions=True,
+    )
+
+    results: dict[str, Any] = {}
+    retry_after = 0.0
+    for key, response in zip(requests, responses):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            results[key] = response
+            continue
+
+        status, headers, body = response
+        if status == 304:
+            results[key] = None
+            continue
+        if 300 <= status < 500 and (
+            status not in PIPELINE_POLLER_RETRYABLE_CLIENT_STATUSES
+        ):
+            results[key] = PipelinePollException(status=status, target=key)
+            continue
+        if status != 200:
+            results[key] = ConnectionError(f"{key} answered HTTP status {status}")
+            try:
+                retry_after = max(retry_after, float(headers.get("retry-after", 0)))
+            except ValueError:
+                pass
+            continue
+
+        try:
+            results[key] = json.loads(
+                _pipeline_poller_decode(headers, body) or b"null"
+            )
+        except (ValueError, zlib.error) as e:
+            results[key] = e
+            continue
+        if "etag" in headers:
+            etags[key] = headers["etag"]
+
+    return results, retry_after
+
+
+def pipeline_poller_is_reachable(base_url: str) -> bool:
+    """Whether the poller can talk to `base_url` directly, without a proxy."""
+    from urllib.parse import urlsplit
+    from urllib.request import getproxies, proxy_bypass
+
+    url = urlsplit(base_url)
+    if url.scheme not in ("http", "https"):
+        return False
+    if url.scheme not in getproxies():
+        return True
+    return bool(proxy_bypass(url.hostname or ""))
+
+
+def pipeline_poller_poll(
+    base_url: str,
+    targets: Mapping[str, str],
+    is_done: Callable[[str, Any], bool],
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 600,
+    interval: float = 5,
+    max_interval: float = 30,
+    pool_size: int = 4,
+    on_progress: Callable[[dict[str, Any], int], None] | None = None,
+) -> dict[str, Any]:
+    """Poll JSON API endpoints until `is_done(key, payload)` holds for each.
+
+    `targets` maps a key to an endpoint relative to `base_url`. Every round
+    fetches the pending targets concurrently over at most `pool_size`
+    keep-alive connections, sending the last ETag of each target so an
+    unchanged resource costs a bodiless 304. All targets share one delay: it
+    is reset to `interval` when a payload changed, and multiplied up to
+    `max_interval` after a round with no change or with failed requests
+    (honouring Retry-After). Failed requests, including the ones cut by the
+    deadline, keep the last payload, as transient API errors must not end a
+    wait.
+
+    `on_progress` receives the last payload of every target (None until
+    fetched) and the elapsed seconds after each round. Returns the final
+    payloads, or raises TimeoutError naming the pending targets.
+
+    The client is a minimal HTTP/1.1 one: it does not go through proxies
+    (check `pipeline_poller_is_reachable` first) and does not follow
+    redirects. A redirect, or a client error other than 408 and 429, raises
+    PipelinePollException at once. Gzip and deflate bodies are decoded.
+    """
+    import asyncio
+
+    return asyncio.run(
+        _pipeline_poller_run(
+            base_url=base_url,
+            targets=dict(targets),
+            is_done=is_done,
+            headers=dict(headers or {}),
+            timeout=timeout,
+            interval=interval,
+            max_interval=max_interval,
+            pool_size=max(1, pool_size),
+            on_progress=on_progress,
+        )
+    )
+
+
+async def _pipeline_poller_fetch(
+    pool: asyncio.Queue,
+    address: tuple[str, int, bool],
+    request: bytes,
+) -> tuple[int, dict[str, str], bytes]:
+    import asyncio
+
+    connection = await pool.get()
+    # A pooled connection may have been closed by the server while idle:
+    # retry once on a fresh one before reporting a failure.
+    retry = True
+    try:
+        while True:
+            if connection is None:
+                retry = False
+                host, port, use_ssl = address
+                connection = await asyncio.open_connection(
+                    host, port, ssl=True if use_ssl else None
+                )
+
+            reader, writer = connection
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers, body, keep_alive = await _pipeline_poller_read(
+                    reader
+                )
+            except (OSError, EOFError, ValueError, asyncio.IncompleteReadError):
+                writer.close()
+                connection = None
+                if retry:
+                    continue
+                raise
+
+            if not keep_alive:
+                writer.close()
+                connection = None
+            return status, headers, body
+    except asyncio.CancelledError:
+        # Cut mid-exchange: the rest of the response would be read as the
+        # answer to the next request.
+        if connection is not None:
+            connection[1].close()
+            connection = None
+        raise
+    finally:
+        pool.put_nowait(connection)
+
+
+async def _pipeline_poller_read(
+    reader: asyncio.StreamReader,
+) -> tuple[int, dict[str, str], bytes, bool]:
+    while True:
+        status_line = (await reader.readline()).decode("latin-1").strip()
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError(f"Malformed HTTP status line: {status_line!r}")
+        status = int(parts[1])
+
+        headers: dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if not line:
+                raise EOFError("Connection closed inside HTTP headers")
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        # Interim responses (100 Continue, 103 Early Hints) precede the final
+        # one on the same connection.
+        if not 100 <= status < 200:
+            break
+
+    keep_alive = (
+        parts[0] != "HTTP/1.0" and headers.get("connection", "").lower() != "close"
+    )
+
+    if status in (204, 304):
+        return status, headers, b"", keep_alive
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks: list[bytes] = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip trailers up to the final empty line.
+                while (await reader.readline()).strip():
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return status, headers, b"".join(chunks), keep_alive
+
+    if "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+        return status, headers, body, keep_alive
+
+    # No framing: the body ends with the connection.
+    return status, headers, await reader.read(), False
+
+
+def _pipeline_poller_decode(headers: dict[str, str], body: bytes) -> bytes:
+    import zlib
+
+    encoding = headers.get("content-encoding", "identity").lower()
+    if encoding == "gzip":
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    if encoding != "identity":
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    return body
+
+
+def _pipeline_poller_request(
+    host_header: str, path: str, headers: dict[str, str], etag: str | None
+) -> bytes:
+    lines = [
+        f"GET {path} HTTP/1.1",
+        f"Host: {host_header}",
+        "Connection: keep-alive",
+    ]
+    names = {name.lower() for name in headers}
+    if "accept" not in names:
+        lines.append("Accept: application/json")
+    if "accept-encoding" not in names:
+        lines.append("Accept-Encoding: gzip, deflate")
+    if "user-agent" not in names:
+        lines.append(f"User-Agent: {PIPELINE_POLLER_USER_AGENT}")
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _pipeline_poller_run(
+    base_url: str,
+    targets: dict[str, str],
+    is_done: Callable[[str, Any], bool],
+    headers: dict[str, str],
+    timeout: float,
+    interval: float,
+    max_interval: float,
+    pool_size: int,
+    on_progress: Callable[[dict[str, Any], int], None] | None,
+) -> dict[str, Any]:
+    import asyncio
+    import time
+
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+
+    pools: dict[tuple[str, int, bool], asyncio.Queue] = {}
+    payloads: dict[str, Any] = {key: None for key in targets}
+    etags: dict[str, str] = {}
+    pending = list(targets)
+    started = time.monotonic()
+    deadline = started + timeout
+    delay = interval
+
+    try:
+        while True:
+            # Requests left hanging by the server count as failed ones: the
+            # round never outlives the deadline.
+            results, retry_after = await pipeline_poller_fetch_round(
+                pools,
+                {key: (base_url, targets[key], headers) for key in pending},
+                etags,
+                pool_size=pool_size,
+                timeout=deadline - time.monotonic(),
+            )
+
+            changed = False
+            failed = False
+            for key, result in results.items():
+                if isinstance(result, PipelinePollException):
+                    raise result
+                if isinstance(result, Exception):
+                    failed = True
+                elif result is not None and result != payloads[key]:
+                    payloads[key] = result
+                    changed = True
+
+            pending = [
+                key
+                for key in pending
+                if payloads[key] is None or not is_done(key, payloads[key])
+            ]
+
+            now = time.monotonic()
+            if on_progress is not None:
+                on_progress(dict(payloads), int(now - started))
+            if not pending:
+                return payloads
+            if now >= deadline:
+                raise TimeoutError(
+                    f"Pipelines still running after {timeout}s: {', '.join(pending)}"
+                )
+
+            if changed and not failed:
+                delay = interval
+            else:
+                delay = min(delay * PIPELINE_POLLER_BACKOFF_FACTOR, max_interval)
+            delay = max(delay, min(retry_after, max_interval))
+            await asyncio.sleep(max(0.0, min(delay, deadline - now)))
+    finally:
+        await pipeline_poller_close(pools)
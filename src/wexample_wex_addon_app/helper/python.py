@@ -7,6 +7,11 @@ from pathlib import Path
 from wexample_helpers.const.types import PathOrString
 from wexample_helpers.helper.shell import shell_run
 
+# Stamp written in a venv by `python_install_environment` once installed.
+PYTHON_ENVIRONMENT_STAMP_FILE_NAME: str = ".wex-install.json"
+# Environment variable naming the wheel directory shared by venv installs.
+PYTHON_WHEELHOUSE_ENV_VAR: str = "WEX_PYTHON_WHEELHOUSE"
+
 
 def python_ensure_pip_or_fail(venv_path: Path) -> bool:
     # Ensure pip is installed in the venv
@@ -24,6 +29,75 @@ def python_ensure_pip_or_fail(venv_path: Path) -> bool:
     return True
 
 
+def python_get_editable_installs_in_venv(venv_path: Path) -> dict[str, Path]:
+    """Return the project path of every editable install of the venv.
+
+    Reads the venv's site-packages directly instead of asking pip, keyed by
+    normalized distribution name (see `python_normalize_package_name`).
+    Covers PEP 660 installs (`direct_url.json` of the dist-info marked
+    editable) and legacy `setup.py develop` ones (`.egg-link` files).
+    """
+    import json
+    from urllib.parse import urlparse
+    from urllib.request import url2pathname
+
+    editables: dict[str, Path] = {}
+    for site_packages in _python_get_site_packages_paths(venv_path):
+        for entry in site_packages.iterdir():
+            if entry.suffix == ".egg-link":
+                try:
+                    location = entry.read_text().splitlines()[0].strip()
+                except (OSError, IndexError):
+                    continue
+                name = python_normalize_package_name(entry.stem)
+                editables.setdefault(name, Path(location))
+                continue
+
+            if entry.suffix != ".dist-info":
+                continue
+            try:
+                direct_url = json.loads((entry / "direct_url.json").read_text())
+            except (OSError, ValueError):
+                continue
+            if not isinstance(direct_url, dict):
+                continue
+            if not (direct_url.get("dir_info") or {}).get("editable"):
+                continue
+            url = urlparse(str(direct_url.get("url", "")))
+            if url.scheme != "file":
+                continue
+
+            name = _python_read_dist_info_name(entry)
+            editables[python_normalize_package_name(name)] = Path(
+                url2pathname(url.path)
+            )
+
+    return editables
+
+
+def python_install_dependencies_batch_in_venv(
+    venv_path: Path, names: list[PathOrString], editable: bool = False
+) -> None:
+    """Install every dependency with a single pip call."""
+    if not names:
+        return
+
+    cmd = _python_get_pip_cmd(venv_path, "install")
+
+    if editable:
+        cmd.append(_python_get_no_cache_option(cmd))
+        for name in names:
+            cmd.extend(["-e", str(name)])
+    else:
+        cmd.extend(str(name) for name in names)
+
+    shell_run(
+        cmd=cmd,
+        cwd=venv_path.parent,
+        inherit_stdio=True,
+    )
+
+
 def python_install_dependencies_in_venv(
     venv_path: Path, names: list[PathOrString], editable: bool = False
 ) -> None:
@@ -36,15 +110,10 @@ def python_install_dependencies_in_venv(
 def python_install_dependency_in_venv(
     venv_path: Path, name: PathOrString, editable: bool = False
 ) -> None:
-    cmd = [
-        f"{venv_path}/bin/python",
-        "-m",
-        "pip",
-        "install",
-    ]
+    cmd = _python_get_pip_cmd(venv_path, "install")
 
     if editable:
-        cmd.extend(["--no-cache-dir", "-e"])
+        cmd.extend([_python_get_no_cache_option(cmd), "-e"])
 
     cmd.append(str(name))
 
@@ -55,18 +124,66 @@ def python_install_dependency_in_venv(
     )
 
 
-def python_install_environment(path: PathOrString) -> Path:
+def python_install_environment(
+    path: PathOrString,
+    force: bool = False,
+    wheelhouse: PathOrString | None = None,
+) -> Path:
+    """Create the project's `.venv` and install its `requirements.txt`.
+
+    An existing venv is kept while the requirements (and the files they
+    include with -r / -c) and the interpreter did not change, unless `force`.
+    Installs go through uv when it is on the PATH. Otherwise pip installs
+    from `wheelhouse`, a wheel directory shared by concurrent installs and
+    filled on the way, defaulting to the PYTHON_WHEELHOUSE_ENV_VAR variable.
+    """
+    import json
+    import os
+    import platform
+
+    from wexample_wex_addon_app.helper.fingerprint import (
+        fingerprint_digest,
+        fingerprint_files,
+    )
+
     project_path = Path(path)
 
     venv_path = project_path / ".venv"
     req_path = project_path / "requirements.txt"
+    stamp_path = venv_path / PYTHON_ENVIRONMENT_STAMP_FILE_NAME
+    uv_bin = shutil.which("uv")
+    if wheelhouse is None:
+        wheelhouse = os.environ.get(PYTHON_WHEELHOUSE_ENV_VAR) or None
+
+    try:
+        stamp = json.loads(stamp_path.read_text())
+    except (OSError, ValueError):
+        stamp = {}
+    if not isinstance(stamp, dict):
+        stamp = {}
+
+    files = fingerprint_files(
+        _python_get_requirements_files(req_path), previous=stamp.get("files")
+    )
+    digest = fingerprint_digest(
+        files, platform.python_version(), "uv" if uv_bin else "pip"
+    )
+    if (
+        not force
+        and stamp.get("digest") == digest
+        and (venv_path / "bin" / "python").exists()
+    ):
+        return venv_path
 
     if venv_path.exists():
         shutil.rmtree(venv_path, ignore_errors=True)
 
     # Crée un nouveau venv
+    venv_cmd = ["python3", "-m", "venv", ".venv", "--clear", "--copies"]
+    if uv_bin:
+        venv_cmd.append("--without-pip")
     shell_run(
-        cmd=["python3", "-m", "venv", ".venv", "--clear", "--copies"],
+        cmd=venv_cmd,
         cwd=project_path,
         inherit_stdio=True,
     )
@@ -74,26 +191,57 @@ def python_install_environment(path: PathOrString) -> Path:
     if req_path.exists():
         python_bin = venv_path / "bin" / "python"
 
-        shell_run(
-            cmd=[
-                str(python_bin),
-                "-m",
-                "pip",
-                "install",
-                "--upgrade",
-                "pip",
-                "setuptools",
-                "wheel",
-            ],
-            cwd=project_path,
-            inherit_stdio=True,
-        )
+        if uv_bin:
+            shell_run(
+                cmd=[
+                    uv_bin,
+                    "pip",
+                    "install",
+                    "--python",
+                    str(python_bin),
+                    "-r",
+                    "requirements.txt",
+                ],
+                cwd=project_path,
+                inherit_stdio=True,
+            )
+        else:
+            shell_run(
+                cmd=[
+                    str(python_bin),
+                    "-m",
+                    "pip",
+                    "install",
+                    "--upgrade",
+                    "pip",
+                    "setuptools",
+                    "wheel",
+                ],
+                cwd=project_path,
+                inherit_stdio=True,
+            )
 
-        shell_run(
-            cmd=[str(python_bin), "-m", "pip", "install", "-r", "requirements.txt"],
-            cwd=project_path,
-            inherit_stdio=True,
-        )
+            if wheelhouse:
+                _python_install_from_wheelhouse(
+                    python_bin=python_bin,
+                    project_path=project_path,
+                    wheelhouse=Path(wheelhouse),
+                )
+            else:
+                shell_run(
+                    cmd=[
+                        str(python_bin),
+                        "-m",
+                        "pip",
+                        "install",
+                        "-r",
+                        "requirements.txt",
+                    ],
+                    cwd=project_path,
+                    inherit_stdio=True,
+                )
+
+    stamp_path.write_text(json.dumps({"digest": digest, "files": files}))
 
     return venv_path
 
@@ -104,11 +252,9 @@ def python_is_package_installed_editable_in_venv(
     package_path: PathOrString,
 ) -> bool:
     """Return True if the package is installed in editable mode at the given path."""
-    python_bin = venv_path / "bin" / "python"
-
     try:
         result = subprocess.run(
-            [str(python_bin), "-m", "pip", "show", package_name],
+            [*_python_get_pip_cmd(venv_path, "show"), package_name],
             capture_output=True,
             text=True,
             timeout=5,
@@ -131,3 +277,131 @@ def python_is_package_installed_editable_in_venv(
 
     except (subprocess.SubprocessError, OSError):
         return False
+
+
+def python_normalize_package_name(name: str) -> str:
+    """Normalize a distribution name, as pip compares them (PEP 503)."""
+    import re
+
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _python_get_no_cache_option(pip_cmd: list[str]) -> str:
+    # uv spells pip's --no-cache-dir without the "-dir".
+    return "--no-cache-dir" if pip_cmd[1] == "-m" else "--no-cache"
+
+
+def _python_get_pip_cmd(venv_path: Path, subcommand: str) -> list[str]:
+    # Venvs created while uv is on the PATH have no pip: uv drives them.
+    python_bin = f"{venv_path}/bin/python"
+    uv_bin = shutil.which("uv")
+    if uv_bin:
+        return [uv_bin, "pip", subcommand, "--python", python_bin]
+    return [python_bin, "-m", "pip", subcommand]
+
+
+def _python_get_requirements_files(req_path: Path) -> list[Path]:
+    # The requirements file and the ones it includes, recursively.
+    files: list[Path] = []
+    pending = [req_path]
+    while pending:
+        current = pending.pop()
+        if current in files:
+            continue
+        files.append(current)
+        try:
+            lines = current.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            parts = line.split("#", 1)[0].split()
+            if len(parts) == 2 and parts[0] in (
+                "-r",
+                "-c",
+                "--requirement",
+                "--constraint",
+            ):
+                pending.append(current.parent / parts[1])
+    return files
+
+
+def _python_get_site_packages_paths(venv_path: Path) -> list[Path]:
+    return sorted(
+        path
+        for pattern in ("lib/python*/site-packages", "Lib/site-packages")
+        for path in venv_path.glob(pattern)
+        if path.is_dir()
+    )
+
+
+def _python_install_from_wheelhouse(
+    python_bin: Path, project_path: Path, wheelhouse: Path
+) -> None:
+    import fcntl
+    import os
+    import tempfile
+
+    install_cmd = [
+        str(python_bin),
+        "-m",
+        "pip",
+        "install",
+        "--no-index",
+        "--find-links",
+        str(wheelhouse),
+        "-r",
+        "requirements.txt",
+    ]
+
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    # Offline first: once a suite package filled it, most others need no
+    # download nor build at all.
+    result = shell_run(cmd=install_cmd, cwd=project_path, capture=True, check=False)
+    if result.returncode == 0:
+        return
+
+    # Built aside, in a directory pip does not list, so concurrent installs
+    # build in parallel and never see a partial wheel.
+    build_path = Path(tempfile.mkdtemp(prefix=".build-", dir=wheelhouse))
+    try:
+        shell_run(
+            cmd=[
+                str(python_bin),
+                "-m",
+                "pip",
+                "wheel",
+                "--wheel-dir",
+                str(build_path),
+                "--find-links",
+                str(wheelhouse),
+                "-r",
+                "requirements.txt",
+            ],
+            cwd=project_path,
+            inherit_stdio=True,
+        )
+
+        # Only the moves are serialized: each wheel lands in it once.
+        with (wheelhouse / ".lock").open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            for wheel_path in build_path.glob("*.whl"):
+                if not (wheelhouse / wheel_path.name).exists():
+                    os.replace(wheel_path, wheelhouse / wheel_path.name)
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+
+    shell_run(cmd=install_cmd, cwd=project_path, inherit_stdio=True)
+
+
+def _python_read_dist_info_name(dist_info_path: Path) -> str:
+    try:
+        with (dist_info_path / "METADATA").open(encoding="utf-8") as metadata:
+            for line in metadata:
+                if line.startswith("Name:"):
+                    return line.split(":", 1)[1].strip()
+                if not line.strip():
+                    break
+    except OSError:
+        pass
+    # Dist-info directories are named "{name}-{version}.dist-info".
+    return dist_info_path.stem.rpartition("-")[0] or dist_info_path.stem
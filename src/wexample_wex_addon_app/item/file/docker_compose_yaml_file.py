@@ -15,6 +15,11 @@ class DockerComposeYamlFile(YamlFile):
             for name, attrs in self.read_services().items()
         ]
 
+    def read_project_name(self) -> str | None:
+        """Return the top-level compose project `name:`, if declared."""
+        data = self.read_parsed() or {}
+        return data.get("name") or None
+
     def read_services(self) -> dict:
         """Return the `services:` dict, or an empty dict if absent."""
         data = self.read_parsed() or {}
@@ -34,6 +34,7 @@ class EachSuitePackageMiddleware(PackageSuiteMiddleware):
 
         # Check if --all-packages flag is set
         all_packages = function_kwargs.pop("all_packages", False)
+        jobs = function_kwargs.pop("jobs", 1)
 
         # Call parent to get and validate app_workdir,
         # but don't use generated contexts.
@@ -54,6 +55,7 @@ class EachSuitePackageMiddleware(PackageSuiteMiddleware):
                             command_wrapper=command_wrapper
                         ),
                         arguments=request.arguments,
+                        jobs=jobs,
                     )
 
                 # Create a single context with the custom function
@@ -71,18 +73,27 @@ class EachSuitePackageMiddleware(PackageSuiteMiddleware):
         return []
 
     def _get_middleware_options(self) -> list[Option]:
-        """Add the all_packages option."""
+        """Add the all_packages and jobs options."""
         from wexample_app.command.option import Option
 
         options = super()._get_middleware_options()
-        options.append(
-            Option(
-                name="all_packages",
-                type=bool,
-                required=False,
-                default=False,
-                is_flag=True,
-                description="Execute the command on all packages of the suite",
-            )
+        options.extend(
+            [
+                Option(
+                    name="all_packages",
+                    type=bool,
+                    required=False,
+                    default=False,
+                    is_flag=True,
+                    description="Execute the command on all packages of the suite",
+                ),
+                Option(
+                    name="jobs",
+                    type=int,
+                    required=False,
+                    default=1,
+                    description="Number of packages to execute in parallel, following the dependency graph",
+                ),
+            ]
         )
         return options
@@ -42,6 +42,7 @@ class SuiteOrEachPackageMiddleware(PackageSuiteMiddleware):
         all_packages = function_kwargs.pop("all_packages", False)
         packages_only = function_kwargs.pop("packages_only", False)
         suite_only = function_kwargs.pop("suite_only", False)
+        jobs = function_kwargs.pop("jobs", 1)
 
         # Validate conflicting options
         if packages_only and suite_only:
@@ -94,6 +95,7 @@ class SuiteOrEachPackageMiddleware(PackageSuiteMiddleware):
                         command_wrapper=command_wrapper
                     ),
                     arguments=request.arguments,
+                    jobs=jobs,
                 )
 
             # Create a context with the custom function for package iteration
@@ -141,6 +143,13 @@ class SuiteOrEachPackageMiddleware(PackageSuiteMiddleware):
                     is_flag=True,
                     description="Execute only on the suite itself, not on packages",
                 ),
+                Option(
+                    name="jobs",
+                    type=int,
+                    required=False,
+                    default=1,
+                    description="Number of packages to execute in parallel, following the dependency graph",
+                ),
             ]
         )
         return options
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from wexample_wex_addon_app.publication.strategy.abstract_publication_strategy import (
     AbstractPublicationStrategy,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     from wexample_filestate_git.remote.abstract_remote import AbstractRemote
 
+    from wexample_wex_addon_app.common.pipeline_poller_session import (
+        PipelinePollerSession,
+    )
+    from wexample_wex_addon_app.workdir.repo_workdir import RepoWorkdir
+
 _DEFAULT_TARGET_BRANCH = "main"
 _DEFAULT_CI_POLL_TIMEOUT = 600
 _DEFAULT_CI_POLL_TIMEOUT_STR = str(_DEFAULT_CI_POLL_TIMEOUT)
+# Pipeline status polling: conditional requests make an unchanged status
+# cheap, so start fast and back off while nothing changes.
+_CI_POLL_INTERVAL = 5
+_CI_POLL_MAX_INTERVAL = 20
 _PIPELINE_RETRY_ATTEMPTS = 360
 # Short detection windows for "does this project's CI even run pipelines at
 # this stage?". When nothing appears within the budget, we assume the CI is
@@ -19,12 +31,16 @@ _PIPELINE_RETRY_ATTEMPTS = 360
 # the wait rather than burning hours of exponential backoff.
 _MR_PIPELINE_DETECT_ATTEMPTS = 6
 _POST_MERGE_DETECT_ATTEMPTS = 6
+# The same window, in seconds, when polling through the poller session: the
+# retries above sleep 2 + 4 + 8 + 16 + 32 seconds.
+_PIPELINE_DETECT_TIMEOUT = 62
 _PIPELINE_TICK_SYMBOL = "⬤"
 _PIPELINE_TICK_COLOR = {
     "success": "green",
     "failed": "red",
     "canceled": "red",
 }
+_PIPELINE_TERMINAL_STATUSES = {"success", "failed", "canceled", "skipped"}
 
 
 class BranchMergePublicationStrategy(AbstractPublicationStrategy):
@@ -37,6 +53,35 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
         self._mr_iid: int | None = None
         self._target_branch: str = _DEFAULT_TARGET_BRANCH
         self._pre_merge_pipeline_id: int | None = None
+        self._poller_session: PipelinePollerSession | None = None
+
+    @classmethod
+    def create_poller_session(
+        cls, workdir: RepoWorkdir, socket_path: Path | None = None
+    ) -> PipelinePollerSession:
+        """Session polling pipelines, their statuses logged on a single line."""
+        from wexample_wex_addon_app.common.pipeline_poller_session import (
+            PipelinePollerSession,
+        )
+
+        state: dict = {"last": None}
+
+        def on_progress(statuses: dict[str, str], elapsed: int) -> None:
+            if state["last"] is not None:
+                workdir.io.erase_response(state["last"])
+            view = "  ".join(
+                f"@color:{_PIPELINE_TICK_COLOR.get(status, 'blue')}"
+                f"{{{_PIPELINE_TICK_SYMBOL}}} {key} — {status}"
+                for key, status in statuses.items()
+            )
+            state["last"] = workdir.log(f"{view} ({elapsed}s)")
+
+        return PipelinePollerSession(
+            interval=_CI_POLL_INTERVAL,
+            max_interval=_CI_POLL_MAX_INTERVAL,
+            on_progress=on_progress,
+            socket_path=socket_path,
+        )
 
     def post_push(self) -> None:
         namespace, name = self._get_repo_info()
@@ -66,6 +111,14 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
             f"Merge request !{self._mr_iid} ready: {proposal.get('web_url', '')}"
         )
 
+    def run_post_publish_pipeline(self) -> None:
+        try:
+            super().run_post_publish_pipeline()
+        finally:
+            if self._poller_session is not None:
+                self._poller_session.close()
+                self._poller_session = None
+
     def wait_for_ci(self) -> None:
         if not self._mr_iid:
             return
@@ -81,9 +134,8 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
                 .get_str_or_default(_DEFAULT_CI_POLL_TIMEOUT_STR)
             )
 
-            on_tick = self._make_pipeline_tick_handler(pipeline_id, "Pipeline")
-            status = remote.poll_pipeline(
-                namespace, name, pipeline_id, timeout=timeout, on_tick=on_tick
+            status = self._poll_pipeline(
+                remote, namespace, name, pipeline_id, "Pipeline", timeout
             )
 
             if status != "success":
@@ -143,9 +195,8 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
             .get_str_or_default(str(_DEFAULT_CI_POLL_TIMEOUT))
         )
 
-        on_tick = self._make_pipeline_tick_handler(pipeline_id, "Post-merge pipeline")
-        status = remote.poll_pipeline(
-            namespace, name, pipeline_id, timeout=timeout, on_tick=on_tick
+        status = self._poll_pipeline(
+            remote, namespace, name, pipeline_id, "Post-merge pipeline", timeout
         )
 
         if status != "success":
@@ -226,6 +277,106 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _get_branch_pipelines_endpoint(
+        self, remote: AbstractRemote, namespace: str, name: str
+    ) -> str | None:
+        """Endpoint `remote.get_branch_pipelines` reads, None for other remotes."""
+        from urllib.parse import quote
+
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        if isinstance(remote, GitlabRemote):
+            ref = quote(self._target_branch, safe="")
+            return (
+                f"{_get_gitlab_project_endpoint(namespace, name)}/pipelines"
+                f"?ref={ref}&order_by=id&sort=desc&per_page=5"
+            )
+        return None
+
+    def _get_merge_proposal_pipelines_endpoint(
+        self, remote: AbstractRemote, namespace: str, name: str
+    ) -> str | None:
+        """Endpoint `remote.get_merge_proposal_pipelines` reads, if a single one.
+
+        GitHub lists the checks of the pull request head commit, which takes a
+        first request to find: it is left to the remote.
+        """
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        if isinstance(remote, GitlabRemote):
+            project = _get_gitlab_project_endpoint(namespace, name)
+            return f"{project}/merge_requests/{self._mr_iid}/pipelines"
+        return None
+
+    def _get_pipeline_endpoint(
+        self, remote: AbstractRemote, namespace: str, name: str, pipeline_id: int
+    ) -> str | None:
+        """Endpoint `remote.get_pipeline` reads, None for unknown remotes."""
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+        from wexample_filestate_git.remote.gitlab_remote import GitlabRemote
+
+        if isinstance(remote, GitlabRemote):
+            project = _get_gitlab_project_endpoint(namespace, name)
+            return f"{project}/pipelines/{pipeline_id}"
+        if isinstance(remote, GithubRemote):
+            return f"repos/{namespace}/{name}/actions/runs/{pipeline_id}"
+        return None
+
+    def _get_pipeline_status(
+        self, remote: AbstractRemote, pipeline: dict[str, Any]
+    ) -> str:
+        """Status `remote.poll_pipeline` reports for a pipeline payload.
+
+        Only called for the remotes `_get_pipeline_endpoint` knows: GitHub
+        workflow runs report their conclusion once completed.
+        """
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+
+        if isinstance(remote, GithubRemote) and pipeline.get("status") == "completed":
+            return pipeline.get("conclusion") or "completed"
+        return pipeline.get("status", "")
+
+    def _get_poll_key(self, label: str) -> str:
+        # Keys of a shared session must tell the released packages apart.
+        return f"{self.workdir.get_project_name()} {label}"
+
+    def _get_poller_base_url(self, remote: AbstractRemote) -> str | None:
+        """API base URL the poller session can reach without a proxy, if any."""
+        from wexample_wex_addon_app.helper.pipeline_poller import (
+            pipeline_poller_is_reachable,
+        )
+
+        base_url = remote.get_base_url()
+        if base_url and pipeline_poller_is_reachable(base_url):
+            return base_url
+        return None
+
+    def _get_poller_session(self) -> PipelinePollerSession:
+        """Session of the running release if it serves one, else our own."""
+        import os
+        from pathlib import Path
+
+        from wexample_wex_addon_app.common.pipeline_poller_session import (
+            PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR,
+        )
+
+        if self._poller_session is None:
+            socket_path = os.environ.get(PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR)
+            self._poller_session = self.create_poller_session(
+                workdir=self.workdir,
+                socket_path=Path(socket_path) if socket_path else None,
+            )
+        return self._poller_session
+
+    def _is_pipeline_terminal(
+        self, remote: AbstractRemote, pipeline: dict[str, Any]
+    ) -> bool:
+        from wexample_filestate_git.remote.github_remote import GithubRemote
+
+        if isinstance(remote, GithubRemote):
+            return pipeline.get("status") == "completed"
+        return pipeline.get("status") in _PIPELINE_TERMINAL_STATUSES
+
     def _make_pipeline_tick_handler(self, pipeline_id: int, label: str):
         state: dict = {"last": None}
 
@@ -241,41 +392,131 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
 
     def _poll_for_pipeline(
         self,
-        check,
+        remote: AbstractRemote,
+        endpoint: str | None,
+        list_pipelines: Callable[[], list[dict[str, Any]]],
+        pick: Callable[[list[dict[str, Any]]], int | None],
+        label: str,
         retry_log,
         max_attempts: int,
     ) -> int | None:
-        """Poll until `check` returns a pipeline id, or give up at exhaustion.
+        """Poll a pipelines list until `pick` finds a pipeline id in it.
 
         Returns the pipeline id on success, or None if no pipeline appeared
-        within `max_attempts` — the caller decides what "no pipeline" means
-        in its context (MR-only CI vs post-merge-only CI).
+        within the detection window — the caller decides what "no pipeline"
+        means in its context (MR-only CI vs post-merge-only CI).
+
+        The list is read at `endpoint` through the poller session when the
+        remote API is reachable without a proxy, along with the other pending
+        pipelines; otherwise `list_pipelines` is retried `max_attempts` times.
         """
         from wexample_helpers.helper.polling_callback_manager import (
             PollingCallbackManager,
         )
 
+        from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+            PipelinePollException,
+        )
+
+        base_url = self._get_poller_base_url(remote)
+        if base_url and endpoint:
+
+            def describe(pipelines: list[dict[str, Any]]) -> tuple[str, bool]:
+                pipeline_id = pick(pipelines)
+                if pipeline_id is None:
+                    return "waiting", False
+                return f"found {pipeline_id}", True
+
+            try:
+                return pick(
+                    self._get_poller_session().wait(
+                        key=self._get_poll_key(label),
+                        base_url=base_url,
+                        path=endpoint,
+                        describe=describe,
+                        headers=remote.default_headers,
+                        timeout=_PIPELINE_DETECT_TIMEOUT,
+                    )
+                )
+            except TimeoutError:
+                return None
+            except PipelinePollException as e:
+                if not e.is_redirect():
+                    raise
+
         def on_retry(_attempt, _max, delay, _error, _message) -> None:
             self.workdir.log(retry_log(delay))
 
         try:
             return PollingCallbackManager(
-                callback=check,
+                callback=lambda: pick(list_pipelines()),
                 max_attempts=max_attempts,
                 on_retry_callback=on_retry,
             ).run()
         except TimeoutError:
             return None
 
+    def _poll_pipeline(
+        self,
+        remote: AbstractRemote,
+        namespace: str,
+        name: str,
+        pipeline_id: int,
+        label: str,
+        timeout: int,
+    ) -> str:
+        """Wait until the pipeline is terminal, return its final status.
+
+        The pipeline is polled through the poller session (keep-alive
+        connections, ETag revalidation, backoff shared with every pending
+        pipeline of the release) when the remote API is known and reachable
+        without a proxy, or by `remote.poll_pipeline`, which also takes over
+        when the API answers with a redirect.
+        """
+        import time
+
+        from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+            PipelinePollException,
+        )
+
+        base_url = self._get_poller_base_url(remote)
+        endpoint = self._get_pipeline_endpoint(remote, namespace, name, pipeline_id)
+        started = time.monotonic()
+
+        if base_url and endpoint:
+
+            def describe(pipeline: dict[str, Any]) -> tuple[str, bool]:
+                status = self._get_pipeline_status(remote, pipeline) or "unknown"
+                return status, self._is_pipeline_terminal(remote, pipeline)
+
+            try:
+                pipeline = self._get_poller_session().wait(
+                    key=self._get_poll_key(f"{label} {pipeline_id}"),
+                    base_url=base_url,
+                    path=endpoint,
+                    describe=describe,
+                    headers=remote.default_headers,
+                    timeout=timeout,
+                )
+                return self._get_pipeline_status(remote, pipeline)
+            except PipelinePollException as e:
+                if not e.is_redirect():
+                    raise
+
+        return remote.poll_pipeline(
+            namespace,
+            name,
+            pipeline_id,
+            timeout=max(1, int(timeout - (time.monotonic() - started))),
+            on_tick=self._make_pipeline_tick_handler(pipeline_id, label),
+        )
+
     def _wait_for_branch_pipeline(
         self, remote: AbstractRemote, namespace: str, name: str
     ) -> int | None:
         baseline = self._pre_merge_pipeline_id
 
-        def check() -> int | None:
-            pipelines = remote.get_branch_pipelines(
-                namespace, name, self._target_branch
-            )
+        def pick(pipelines: list[dict[str, Any]]) -> int | None:
             if not pipelines:
                 return None
             latest_id = pipelines[0]["id"]
@@ -284,7 +525,13 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
             return None
 
         return self._poll_for_pipeline(
-            check=check,
+            remote=remote,
+            endpoint=self._get_branch_pipelines_endpoint(remote, namespace, name),
+            list_pipelines=lambda: remote.get_branch_pipelines(
+                namespace, name, self._target_branch
+            ),
+            pick=pick,
+            label=f"'{self._target_branch}' pipeline",
             retry_log=lambda delay: (
                 f"No new pipeline on '{self._target_branch}' yet, "
                 f"retrying in {delay}s…"
@@ -295,16 +542,24 @@ class BranchMergePublicationStrategy(AbstractPublicationStrategy):
     def _wait_for_mr_pipeline(
         self, remote: AbstractRemote, namespace: str, name: str
     ) -> int | None:
-        def check() -> int | None:
-            pipelines = remote.get_merge_proposal_pipelines(
-                namespace, name, self._mr_iid
-            )
-            return pipelines[0]["id"] if pipelines else None
-
         return self._poll_for_pipeline(
-            check=check,
+            remote=remote,
+            endpoint=self._get_merge_proposal_pipelines_endpoint(
+                remote, namespace, name
+            ),
+            list_pipelines=lambda: remote.get_merge_proposal_pipelines(
+                namespace, name, self._mr_iid
+            ),
+            pick=lambda pipelines: pipelines[0]["id"] if pipelines else None,
+            label=f"MR !{self._mr_iid} pipeline",
             retry_log=lambda delay: (
                 f"No pipeline yet for MR !{self._mr_iid}, " f"retrying in {delay}s…"
             ),
             max_attempts=_MR_PIPELINE_DETECT_ATTEMPTS,
         )
+
+
+def _get_gitlab_project_endpoint(namespace: str, name: str) -> str:
+    # GitLab addresses projects by their URL-encoded full path.
+    project = f"{namespace}/{name}".replace("/", "%2F")
+    return f"projects/{project}"
@@ -9,7 +9,10 @@ from wexample_wex_core.resolver.abstract_command_resolver import AbstractCommand
 if TYPE_CHECKING:
     from wexample_wex_core.common.command_address import CommandAddress
     from wexample_wex_core.common.command_request import CommandRequest
-    from wexample_wex_core.const.registries import RegistryResolverData
+    from wexample_wex_core.const.registries import (
+        RegistryAddonData,
+        RegistryResolverData,
+    )
 
 _COMMANDS_SUBDIR = "commands"
 
@@ -55,8 +58,7 @@ class AppCommandResolver(AbstractCommandResolver):
             return None
 
         # App commands are cwd-relative — scan filesystem directly, not the registry
-        commands_base = base / _COMMANDS_SUBDIR
-        app_data = self._scan_commands_dir(commands_base, "app")
+        app_data = self._scan_app_commands(base)
         app_cmds = sorted(cmd["command"] for cmd in app_data.values())
 
         if not app_cmds:
@@ -122,8 +124,7 @@ class AppCommandResolver(AbstractCommandResolver):
         if not base:
             return {"app": {}}
 
-        commands_base = base / _COMMANDS_SUBDIR
-        return {"app": self._scan_commands_dir(commands_base, "app")}
+        return {"app": self._scan_app_commands(base)}
 
     def get_base_path(self) -> Path | None:
         """Walk up from cwd to find the nearest wex setup directory."""
@@ -169,3 +170,16 @@ class AppCommandResolver(AbstractCommandResolver):
             sys.path.append(commands_path_str)
 
         return match
+
+    def _scan_app_commands(self, base: Path) -> RegistryAddonData:
+        # This resolver is live: it scans on every startup, so go through the
+        # index to avoid importing every app command module each time.
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.common.command_index import CommandIndex
+        from wexample_wex_addon_app.const.path import APP_FILE_COMMAND_INDEX
+
+        index = CommandIndex(path=base.parent / APP_PATH_TMP / APP_FILE_COMMAND_INDEX)
+        data = index.scan(self, base / _COMMANDS_SUBDIR, "app")
+        index.save()
+        return data
@@ -190,7 +190,17 @@ class ServiceCommandResolver(AbstractCommandResolver):
         )
 
     def build_registry_data(self) -> RegistryResolverData:
+        from wexample_app.const.path import APP_DIR_NAME_TMP
+
+        from wexample_wex_addon_app.common.command_index import CommandIndex
+        from wexample_wex_addon_app.const.path import APP_FILE_COMMAND_INDEX
+
         registry: RegistryResolverData = {}
+        index = CommandIndex(
+            path=self.kernel.workdir.get_path()
+            / APP_DIR_NAME_TMP
+            / APP_FILE_COMMAND_INDEX
+        )
 
         self._get_app_addon_manager()
         for addon in self.kernel.get_addons().values():
@@ -204,7 +214,7 @@ class ServiceCommandResolver(AbstractCommandResolver):
 
                 service_name = service_dir.name
                 commands_base = service_dir / _COMMANDS_SUBDIR
-                addon_data = self._scan_commands_dir(commands_base, service_name)
+                addon_data = index.scan(self, commands_base, service_name)
                 self._inject_service_tag(addon_data, service_name)
 
                 if service_name not in registry:
@@ -212,6 +222,7 @@ class ServiceCommandResolver(AbstractCommandResolver):
                 else:
                     registry[service_name].update(addon_data)
 
+        index.save()
         return registry
 
     def is_attachment_active(self, request: CommandRequest) -> bool:
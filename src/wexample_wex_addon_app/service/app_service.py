@@ -48,6 +48,25 @@ class AppService:
         compose_abs = self.service_dir / compose_rel
         return compose_abs if compose_abs.exists() else None
 
+    def get_db_dump_command(self, database: str) -> list[str] | None:
+        """Return a command writing a plain SQL dump of `database` to stdout.
+
+        DB services override this (e.g. a `docker exec ... mysqldump` argv) so
+        that db/dump can compress the stream on the fly. When None, db/dump
+        falls back to the service `db/dump` command, which writes a .sql file
+        that is compressed afterwards. No service of this addon provides one:
+        DB services shipped by other addons opt in by overriding this.
+        """
+        return None
+
+    def get_db_restore_command(self, database: str) -> list[str] | None:
+        """Return a command loading plain SQL from stdin into `database`.
+
+        Counterpart of `get_db_dump_command()`: when set, db/restore streams
+        the decompressed dump into it instead of extracting it to disk first.
+        """
+        return None
+
     def get_runtime_contribution(self) -> dict:
         """Return this service's contribution to the runtime config.
 
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_wex_addon_app.common.webhook_token_index import (
+        WebhookTokenIndex,
+    )
 
 APPS_BASE_PATH: str = "/var/www"
 
@@ -10,6 +16,9 @@ class AppWebhookTypeResolver:
 
     URL format: /webhook/app/{env}/{app_name}/{command/path}
     Token file: {app_path}/.wex/local/webhook_tokens.yml
+
+    Tokens are looked up in the process-wide `WebhookTokenIndex` of the base
+    path, which parses each token file only when it changed.
     """
 
     def __init__(self, apps_base_path: str = APPS_BASE_PATH) -> None:
@@ -30,21 +39,17 @@ class AppWebhookTypeResolver:
         return str(app_path) if app_path is not None else None
 
     def resolve_token(self, command_path: str, command_str: str) -> str | None:
-        from wexample_app.const.globals import WORKDIR_LOCAL_DIR_NAME, WORKDIR_SETUP_DIR
+        parsed = self._parse(command_path)
+        if parsed is None:
+            return None
+        return self._get_index().get_token(parsed[0], parsed[1], command_str)
 
-        from wexample_wex_addon_app.item.file.webhook_tokens_yaml_file import (
-            WebhookTokensYamlFile,
+    def _get_index(self) -> WebhookTokenIndex:
+        from wexample_wex_addon_app.common.webhook_token_index import (
+            WebhookTokenIndex,
         )
 
-        app_path = self._resolve_app_path(command_path)
-        if app_path is None:
-            return None
-        token_file = app_path / WORKDIR_SETUP_DIR / WORKDIR_LOCAL_DIR_NAME / "webhook_tokens.yml"
-        if not token_file.exists():
-            return None
-        return WebhookTokensYamlFile.create_from_path(path=token_file).get_token(
-            command_str
-        )
+        return WebhookTokenIndex.shared(self._base)
 
     def _parse(self, command_path: str) -> tuple[str, str, str] | None:
         parts = command_path.split("/", 2)
@@ -9,6 +9,8 @@ from wexample_helpers_git.helper.git import git_run
 from wexample_wex_addon_app.workdir.repo_workdir import RepoWorkdir
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from wexample_prompt.common.progress.progress_handle import ProgressHandle
 
 
@@ -43,6 +45,42 @@ class CodeBaseWorkdir(RepoWorkdir):
         """
         return []
 
+    def build_import_index(self) -> dict[str, dict] | None:
+        """Parse the imports of the package files into a persistent index.
+
+        Only files added or modified since the previous call are parsed again.
+        Returns the entries keyed by file path, or None when this kind of
+        package does not support indexing its imports.
+        """
+        from wexample_app.const.globals import APP_PATH_TMP
+        from wexample_filestate.item.file.json_file import JsonFile
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        from wexample_wex_addon_app.const.path import APP_FILE_IMPORT_INDEX
+        from wexample_wex_addon_app.helper.import_index import import_index_update
+
+        files = self.get_import_index_files()
+        if files is None:
+            return None
+
+        index_path = self.get_path() / APP_PATH_TMP / APP_FILE_IMPORT_INDEX
+        index_file = JsonFile.create_from_path(path=index_path, configure=False)
+        previous = (
+            (index_file.read_parsed() or {}).get("files") or {}
+            if index_path.exists()
+            else {}
+        )
+
+        index = import_index_update(
+            files, parse=self.parse_imports_in_file, previous=previous
+        )
+        if index != previous:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_file.write_parsed({"files": index})
+            file_chown_as_real_user_if_elevated(index_path)
+
+        return index
+
     def commit_changes(
         self,
         progress: ProgressHandle | None = None,
@@ -114,6 +152,14 @@ class CodeBaseWorkdir(RepoWorkdir):
     def depends_from(self, package: CodeBaseWorkdir) -> bool:
         return package.get_package_dependency_name() in self.get_dependencies_versions()
 
+    def get_import_index_files(self) -> list[Path] | None:
+        """Source files whose imports `build_import_index()` tracks.
+
+        None means imports of this kind of package cannot be indexed, and
+        callers fall back to `search_imports_in_codebase()` when available.
+        """
+        return None
+
     def get_io_context_prefix(self) -> str | None:
         from wexample_helpers.helper.cli import cli_make_clickable_path
 
@@ -129,6 +175,10 @@ class CodeBaseWorkdir(RepoWorkdir):
         """Return the name used by other packages to mark it as a dependency"""
         return self.get_package_name()
 
+    def get_package_import_names(self) -> list[str]:
+        """Root modules or namespaces other packages import this one through."""
+        return []
+
     def git_run(self, cmd, **kwargs):
         kwargs.setdefault("cwd", self.get_path())
         return git_run(cmd, **kwargs)
@@ -216,6 +266,10 @@ class CodeBaseWorkdir(RepoWorkdir):
             self.info(f"Returning to {current_branch}...")
             git_switch_branch(current_branch, cwd=cwd, inherit_stdio=True)
 
+    def parse_imports_in_file(self, path: Path) -> list[tuple[str, int, int]]:
+        """Return the (module, line, column) of every import of a source file."""
+        return []
+
     def prepare_value(self, raw_value=None):
         from wexample_filestate.const.disk import DiskItemType
         from wexample_filestate.item.file.yaml_file import YamlFile
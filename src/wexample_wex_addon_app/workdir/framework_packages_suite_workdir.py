@@ -13,8 +13,14 @@ from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
 from wexample_wex_addon_app.workdir.repo_workdir import RepoWorkdir
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from wexample_config.const.types import DictConfig
 
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+    from wexample_wex_addon_app.common.package_impact_graph import (
+        PackageImpactGraph,
+    )
     from wexample_wex_addon_app.workdir.code_base_workdir import (
         CodeBaseWorkdir,
     )
@@ -25,6 +31,10 @@ if TYPE_CHECKING:
 
 @base_class
 class FrameworkPackageSuiteWorkdir(RepoWorkdir):
+    _impact_graph_cache: PackageImpactGraph | None = private_field(
+        default=None,
+        description="Cached dependency graph of the packages, invalidated on reload",
+    )
     _packages_by_name_cache: dict | None = private_field(
         default=None,
         description="Cached name→package lookup, invalidated on reload",
@@ -92,17 +102,21 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
 
     def build_ordered_dependencies(self) -> list[str]:
         """Return package names ordered leaves -> trunk."""
-        return self.topological_order(self.build_dependencies_map())
+        return self.topological_order(dict(self.get_impact_graph().dependencies))
 
     # Publication planning helpers
     def compute_packages_to_publish(self) -> list[CodeBaseWorkdir]:
         """Return packages that changed since their last publication tag.
 
         If a package has no previous tag, it is considered to be published.
+        Tags and changes of the whole suite are read once, see GitChangeOracle.
         """
+        from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+        oracle = GitChangeOracle()
         to_publish: list[CodeBaseWorkdir] = []
         for pkg in self.get_packages():
-            if pkg.has_changes_since_last_publication_tag():
+            if pkg.has_changes_since_last_publication_tag(oracle=oracle):
                 to_publish.append(pkg)
         return to_publish
 
@@ -175,12 +189,76 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
             resolved.append(Path(entry_path))
         return resolved
 
+    def get_affected_packages(self, since: str) -> list[CodeBaseWorkdir]:
+        """Packages with files changed since a git ref, and their dependents.
+
+        Dependents are followed transitively. Uncommitted changes to tracked
+        files count. Packages come in dependency order.
+        """
+        from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+        oracle = GitChangeOracle()
+        packages_by_root: dict[str, list[CodeBaseWorkdir]] = {}
+        for package in self.get_packages():
+            root = oracle.get_repository_root(package.get_path())
+            packages_by_root.setdefault(str(root), []).append(package)
+
+        # One diff per repository, mapped to packages by path.
+        changed_paths: list[Path] = []
+        changed_names: list[str] = []
+        for packages in packages_by_root.values():
+            paths = oracle.get_changed_paths(since, packages[0].get_path())
+            if paths is not None:
+                changed_paths.extend(paths)
+                continue
+            # Outside git, or unknown ref in this repository.
+            changed_names.extend(
+                package.get_package_name()
+                for package in packages
+                if oracle.has_changes_since(since, package.get_path())
+            )
+
+        graph = self.get_impact_graph()
+        affected = graph.get_impacted_by_paths(changed_paths) | graph.get_impacted(
+            changed_names
+        )
+
+        return [
+            package
+            for package in self.get_ordered_packages()
+            if package.get_package_name() in affected
+        ]
+
     def get_dependents(self, package: CodeBaseWorkdir) -> list[CodeBaseWorkdir]:
-        dependents = []
-        for neighbor_package in self.get_packages():
-            if neighbor_package.depends_from(package):
-                dependents.append(neighbor_package)
-        return dependents
+        names = set(self.get_impact_graph().get_dependents(package.get_package_name()))
+        return [p for p in self.get_packages() if p.get_package_name() in names]
+
+    def get_impact_graph(self) -> PackageImpactGraph:
+        """Dependency graph of the packages, cached on disk by manifest content."""
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.common.package_impact_graph import (
+            PackageImpactGraph,
+        )
+        from wexample_wex_addon_app.const.path import APP_FILE_PACKAGE_IMPACT_GRAPH
+
+        if self._impact_graph_cache is None:
+
+            def _build() -> tuple[dict[str, list[str]], dict[str, str]]:
+                # Resolved, like the paths git reports changes for.
+                return self.build_dependencies_map(), {
+                    package.get_package_name(): str(package.get_path().resolve())
+                    for package in self.get_packages()
+                }
+
+            self._impact_graph_cache = PackageImpactGraph.load_or_build(
+                cache_path=self.get_path()
+                / APP_PATH_TMP
+                / APP_FILE_PACKAGE_IMPACT_GRAPH,
+                package_paths=self.get_packages_paths(),
+                build=_build,
+            )
+        return self._impact_graph_cache
 
     def get_local_packages_names(self) -> list[str]:
         return [p.get_package_name() for p in self.get_packages()]
@@ -205,6 +283,7 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
                 class_type=self._get_children_package_workdir_class(), recursive=True
             )
             self._packages_by_name_cache = None
+            self._impact_graph_cache = None
         return self._packages_cache
 
     def get_packages_paths(self) -> list[Path]:
@@ -223,11 +302,20 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
     def has_tests(self) -> bool:
         return any(package.has_tests() for package in self.get_packages())
 
+    def get_python_wheelhouse_path(self) -> Path | None:
+        """Wheel directory shared by the venv installs of the suite packages."""
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.const.path import APP_DIR_WHEELHOUSE
+
+        return self.get_path() / APP_PATH_TMP / APP_DIR_WHEELHOUSE
+
     def packages_execute_function(
         self,
         command: callable,
         arguments: list[str] | None = None,
         force: bool = False,
+        jobs: int = 1,
     ) -> None:
         """
         Execute a Python command function (addon command) on all packages.
@@ -249,6 +337,7 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
             command=resolved_command,
             arguments=arguments,
             force=force,
+            jobs=jobs,
         )
 
     def packages_execute_manager(
@@ -257,6 +346,7 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
         arguments: list[str] | None = None,
         force: bool = False,
         fail_fast: bool = True,
+        jobs: int = 1,
     ) -> None:
         """Execute a manager command on all packages."""
         self._packages_execute(
@@ -265,22 +355,177 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
             message="Executing command",
             force=force,
             fail_fast=fail_fast,
+            jobs=jobs,
         )
 
-    def packages_execute_shell(self, cmd: list[str], force: bool = False) -> None:
+    def packages_execute_shell(
+        self, cmd: list[str], force: bool = False, jobs: int = 1
+    ) -> None:
         """Execute a raw shell command on all packages."""
         self._packages_execute(
             cmd=cmd,
             executor_method=ManagedWorkdir.shell_run_from_path,
             message="Executing shell",
             force=force,
+            jobs=jobs,
         )
 
+    def packages_release(
+        self, force: bool = False, skip_test: bool = False, jobs: int = 1
+    ) -> None:
+        """Release every package that changed, or depends on one that did.
+
+        Packages are released through `app::release/publish`, leaves first.
+        With `jobs` above 1, independent packages release concurrently: their
+        CI, deployment and registry waits overlap, and each dependent starts
+        as soon as its own dependencies are published. Packages sharing a git
+        repository are still released one at a time.
+
+        Released concurrently, packages wait for their CI pipelines through a
+        single poller session served by this process: every pending pipeline
+        is polled in the same rounds, and their statuses show on one line.
+        """
+        import threading
+
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.commands.release.publish import (
+            app__release__publish,
+        )
+        from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+        from wexample_wex_addon_app.common.pipeline_poller_session import (
+            PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR,
+        )
+        from wexample_wex_addon_app.const.path import APP_FILE_PIPELINE_POLLER_SOCKET
+        from wexample_wex_addon_app.publication.strategy.branch_merge_publication_strategy import (
+            BranchMergePublicationStrategy,
+        )
+
+        # Dependents of a changed package may receive a version bump from it
+        # during the run: keep them, their own release re-checks live.
+        reaches = self.get_impact_graph().get_reach()
+        changed = {
+            package.get_package_name()
+            for package in (
+                self.get_packages() if force else self.compute_packages_to_publish()
+            )
+        }
+        package_paths = [
+            package.get_path()
+            for package in self.get_ordered_packages()
+            if reaches.get(package.get_package_name(), set()) & changed
+        ]
+
+        if not package_paths:
+            self.success("No package to release.")
+            return
+
+        arguments = []
+        if force:
+            arguments.append("--force")
+        if skip_test:
+            arguments.append("--skip-test")
+
+        # Branch switches and commits of packages living in the same git
+        # repository must not interleave.
+        oracle = GitChangeOracle()
+        locks = {
+            str(oracle.get_repository_root(path)): threading.Lock()
+            for path in package_paths
+        }
+
+        # Output of packages released one at a time is not buffered: they
+        # show their own pipeline progress.
+        poller_session = None
+        env = None
+        if jobs > 1:
+            socket_path = (
+                self.get_path() / APP_PATH_TMP / APP_FILE_PIPELINE_POLLER_SOCKET
+            )
+            poller_session = BranchMergePublicationStrategy.create_poller_session(
+                workdir=self, socket_path=socket_path
+            )
+            poller_session.serve()
+            env = {PIPELINE_POLLER_SESSION_SOCKET_ENV_VAR: str(socket_path)}
+
+        def _release_from_path(cmd: list[str], path: Path, **kwargs):
+            with locks[str(oracle.get_repository_root(path))]:
+                return ManagedWorkdir.manager_run_from_path(
+                    cmd=cmd, path=path, env=env, **kwargs
+                )
+
+        try:
+            self._packages_execute(
+                cmd=[
+                    AddonCommandResolver.build_command_from_function(
+                        command_wrapper=app__release__publish
+                    ),
+                    *arguments,
+                ],
+                executor_method=_release_from_path,
+                message="Releasing",
+                jobs=jobs,
+                package_paths=package_paths,
+            )
+        finally:
+            if poller_session is not None:
+                poller_session.close()
+
+    def packages_run_profiling(self, jobs: int = 1) -> dict:
+        """Run the benchmarks of every package having some, `jobs` at a time.
+
+        Returns a dict with:
+            - "entries": list[dict]  (`run_profiling` entries, plus "package")
+            - "errors": dict[str, str]  (error of each failed package)
+
+        Benchmarks running concurrently share the CPU: timings are comparable
+        within one run, not with runs made with another `jobs` value.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_wex_addon_app.workdir.mixin.abstract_profiling_workdir_mixin import (
+            AbstractProfilingWorkdirMixin,
+        )
+
+        packages = [
+            package
+            for package in self.get_ordered_packages()
+            if isinstance(package, AbstractProfilingWorkdirMixin)
+            and (package.get_path() / package.get_benchmark_dir()).is_dir()
+        ]
+
+        def _profile(package: CodeBaseWorkdir) -> dict:
+            try:
+                return package.run_profiling()
+            except Exception as e:
+                return {"error": str(e) or type(e).__name__}
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            results = list(executor.map(_profile, packages))
+
+        entries: list[dict] = []
+        errors: dict[str, str] = {}
+        for package, result in zip(packages, results):
+            package_name = package.get_package_name()
+            if "error" in result:
+                errors[package_name] = result["error"]
+                continue
+            entries.extend(
+                {"package": package_name, **entry}
+                for entry in result.get("entries", [])
+            )
+
+        return {"entries": entries, "errors": errors}
+
     def packages_validate_internal_dependencies_declarations(self) -> None:
         """Ensure imports match declared local dependencies."""
         from wexample_wex_addon_app.exception.dependency_violation_exception import (
             DependencyViolationException,
         )
+        from wexample_wex_addon_app.helper.dependency_graph import (
+            dependency_graph_closure,
+        )
+        from wexample_wex_addon_app.helper.import_index import import_index_locations
 
         dependencies_map = self.build_dependencies_map()
 
@@ -290,36 +535,40 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
             total=len(dependencies_map), print_response=False
         ).get_handle()
 
+        # Packages each one may import: itself and everything it reaches
+        # through its declared local dependencies.
+        allowed_map = dependency_graph_closure(dependencies_map)
+        import_names: dict[str, str] = {}
         for package_name in dependencies_map:
             package = self.get_package(package_name)
-            if package is None:
-                continue
+            if package is not None:
+                for import_name in package.get_package_import_names():
+                    import_names[import_name] = package_name
 
-            search_fn = getattr(package, "search_imports_in_codebase", None)
-            if not callable(search_fn):
-                progress.advance(
-                    label=f"Package {package.get_project_name()} (no search)", step=1
-                )
+        for package_name in dependencies_map:
+            package = self.get_package(package_name)
+            if package is None:
                 continue
 
-            for package_name_search in dependencies_map:
-                searched_package = self.get_package(package_name_search)
-                if searched_package is None:
-                    continue
-
-                imports = search_fn(searched_package)
-                if not imports:
+            index = package.build_import_index() if import_names else None
+            if index is not None:
+                imports_map = import_index_locations(index, import_names)
+            else:
+                search_fn = getattr(package, "search_imports_in_codebase", None)
+                if not callable(search_fn):
+                    progress.advance(
+                        label=f"Package {package.get_project_name()} (no search)",
+                        step=1,
+                    )
                     continue
-
-                dependencies_stack = self.build_dependencies_stack(
-                    package, searched_package, dependencies_map
+                imports_map = self._search_imports_by_package(
+                    search_fn, dependencies_map
                 )
 
-                if not dependencies_stack:
-                    import_locations = [
-                        f"{res.item.get_path()}:{res.line}:{res.column}"
-                        for res in imports
-                    ]
+            allowed = allowed_map[package_name]
+            for package_name_search in dependencies_map:
+                import_locations = imports_map.get(package_name_search)
+                if import_locations and package_name_search not in allowed:
                     raise DependencyViolationException(
                         package_name=package_name,
                         imported_package=package_name_search,
@@ -425,38 +674,31 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
         return raw_value
 
     def propagate_packages_versions(self) -> None:
-        for package in self.get_ordered_packages():
-            self.propagate_version_of(package=package)
-
-    def propagate_version_of(self, package: WithSuiteTreeWorkdirMixin) -> None:
-        from wexample_helpers.const.types import UPGRADE_TYPE_MINOR
+        from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
 
-        bump_type = package.classify_version_bump()
+        # Propagation only writes dependency versions, which bump
+        # classification does not look at: one snapshot serves every package.
+        oracle = GitChangeOracle()
+        for package in self.get_ordered_packages():
+            self.propagate_version_of(package=package, oracle=oracle)
 
-        # Patch bumps do not propagate — dependents with >= already satisfy the new version
-        if bump_type == UPGRADE_TYPE_MINOR:
-            package.log(
-                f"Patch bump for {package.get_project_name()}, skipping propagation.",
-                prefix=True,
-            )
-            return
+    def propagate_version_of(
+        self,
+        package: WithSuiteTreeWorkdirMixin,
+        oracle: GitChangeOracle | None = None,
+    ) -> None:
+        import fcntl
 
-        package.log(f"Propagating version {package.get_setup_version()}", prefix=True)
-        package.io.indentation_up()
+        from wexample_app.const.globals import APP_PATH_TMP
 
-        for dependent in self.get_dependents(package):
-            updated = dependent.save_dependency(
-                package=package,
-                version=package.get_setup_version(),
-                operator=">=",
-            )
-            if updated:
-                package.log(
-                    f"Updated {dependent.get_project_name()} dependencies",
-                )
+        from wexample_wex_addon_app.const.path import APP_FILE_PROPAGATION_LOCK
 
-        package.success("Packages version has been propagated across suite")
-        package.io.indentation_down()
+        # Packages released concurrently may bump the same dependent.
+        lock_path = self.get_path() / APP_PATH_TMP / APP_FILE_PROPAGATION_LOCK
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock_path.open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._propagate_version_of(package=package, oracle=oracle)
 
     def publish_dependencies(self) -> dict[str, str]:
         """The suite provides dependency of package it manages."""
@@ -467,9 +709,25 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
 
         return dependencies
 
-    def setup_install(self, env: str | None = None, force: bool = False) -> None:
+    def setup_install(
+        self, env: str | None = None, force: bool = False, jobs: int = 1
+    ) -> None:
+        """Install the suite, then every package of it.
+
+        Package venvs share a wheel directory in the suite tmp dir. With
+        `jobs` above 1, packages whose app manager is already set up are
+        installed in their own manager process, `jobs` at a time, each once
+        its local dependencies are installed.
+        """
+        import functools
+
         from wexample_app.const.env import ENV_NAME_LOCAL
 
+        from wexample_wex_addon_app.commands.setup.install import (
+            app__setup__install,
+        )
+        from wexample_wex_addon_app.helper.python import PYTHON_WHEELHOUSE_ENV_VAR
+
         self.subtitle(f"Installing suite: {self.get_project_name()}")
         super().setup_install(env=env, force=force)
 
@@ -477,27 +735,129 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
             self._pre_install_python_packages_editable(force=force)
 
         self.subtitle(f"Installing packages")
+        parallel_paths = []
         for package in self.get_packages():
+            if jobs > 1 and ManagedWorkdir.is_app_workdir_path_setup(
+                path=package.get_path()
+            ):
+                parallel_paths.append(package.get_path())
+                continue
             package.ensure_app_manager_setup()
             self.log(f"Installing {package.get_project_name()}...")
             package.setup_install(env=env, force=force)
 
-    def test_run(self, format: str | None = None) -> None:
-        """Run the tests of every package in the suite; raise on first failure."""
+        if parallel_paths:
+            cmd = [
+                AddonCommandResolver.build_command_from_function(
+                    command_wrapper=app__setup__install
+                )
+            ]
+            if env:
+                cmd.extend(["--env", env])
+            if force:
+                # Not a flag option: it takes a value.
+                cmd.extend(["--force", "true"])
+
+            # Package processes find it through their suite too; the variable
+            # reaches venv installs that do not ask their workdir for it.
+            wheelhouse_env = {
+                PYTHON_WHEELHOUSE_ENV_VAR: str(self.get_python_wheelhouse_path())
+            }
+            self._packages_execute(
+                cmd=cmd,
+                executor_method=functools.partial(
+                    ManagedWorkdir.manager_run_from_path, env=wheelhouse_env
+                ),
+                message="Installing",
+                jobs=jobs,
+                package_paths=parallel_paths,
+            )
+
+    def test_run(
+        self,
+        format: str | None = None,
+        jobs: int = 1,
+        affected_since: str | None = None,
+    ) -> None:
+        """Run the tests of every package in the suite, dependencies first.
+
+        With `jobs` above 1, each package is tested in its own manager process
+        as soon as its local dependencies are tested, `jobs` at a time, and
+        its output is printed once done. With `affected_since`, only packages
+        changed since that git ref and their dependents are tested.
+
+        Every package is tested even when some fail; failures are raised
+        together at the end.
+        """
         from wexample_prompt.enums.terminal_color import TerminalColor
 
+        from wexample_wex_addon_app.commands.test.run import app__test__run
+        from wexample_wex_addon_app.exception.suite_tests_failed_exception import (
+            SuiteTestsFailedException,
+        )
+
         packages = [p for p in self.get_ordered_packages() if p.has_tests()]
-        progress = self.progress(
-            total=len(packages),
-            color=TerminalColor.CYAN,
-            print_response=False,
-        ).get_handle()
+        if affected_since is not None:
+            affected = {
+                package.get_package_name()
+                for package in self.get_affected_packages(since=affected_since)
+            }
+            packages = [p for p in packages if p.get_package_name() in affected]
 
-        for package in packages:
-            progress.advance(step=1, label=f"Testing {package.get_project_name()}")
-            package.test_run(format=format)
+        if not packages:
+            self.success("No package to test.")
+            return
 
-        progress.finish(label="All package tests passed")
+        if jobs > 1:
+            cmd = [
+                AddonCommandResolver.build_command_from_function(
+                    command_wrapper=app__test__run
+                )
+            ]
+            if format:
+                cmd.extend(["--format", format])
+
+            failed_paths = self._packages_execute(
+                cmd=cmd,
+                executor_method=ManagedWorkdir.manager_run_from_path,
+                message="Testing",
+                fail_fast=False,
+                jobs=jobs,
+                package_paths=[package.get_path() for package in packages],
+            )
+            failed = [
+                package.get_package_name()
+                for package in packages
+                if package.get_path() in failed_paths
+            ]
+        else:
+            failed = []
+            progress = self.progress(
+                total=len(packages),
+                color=TerminalColor.CYAN,
+                print_response=False,
+            ).get_handle()
+
+            for package in packages:
+                progress.advance(step=1, label=f"Testing {package.get_project_name()}")
+                try:
+                    package.test_run(format=format)
+                except Exception as e:
+                    failed.append(package.get_package_name())
+                    self.warning(f"Tests of {package.get_package_name()} failed: {e}")
+
+            progress.finish(
+                label=(
+                    f"{len(failed)} of {len(packages)} package(s) failed"
+                    if failed
+                    else "All package tests passed"
+                )
+            )
+
+        if failed:
+            raise SuiteTestsFailedException(
+                package_names=failed, tested_count=len(packages)
+            )
 
     def topological_order(self, dep_map: dict[str, list[str]]) -> list[str]:
         """Deterministic topological order (leaves -> trunk) using graphlib."""
@@ -577,25 +937,49 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
         message: str,
         force: bool = False,
         fail_fast: bool = True,
-    ) -> None:
+        jobs: int = 1,
+        package_paths: list[Path] | None = None,
+    ) -> list[Path]:
         """
         Generic method to execute a command on all detected packages.
 
+        Returns the paths of the packages that failed, when `fail_fast` is off.
+
         Args:
             cmd: Command to execute (as a list of strings)
             executor_method: Method used to execute the command (e.g. manager_run_from_path, shell_run_from_path)
             message: Displayed title message
             force: If True, run even if directory is not recognized as an app workdir
             fail_fast: If True (default), stop on first error. If False, continue and report all failures at end.
+            jobs: Maximum number of packages executed concurrently. Above 1, each
+                package starts once its local dependencies are done and its
+                output is buffered, then printed prefixed with the package name.
+            package_paths: Packages to execute on, in this order, instead of every
+                detected package.
         """
         from wexample_prompt.enums.terminal_color import TerminalColor
 
-        failed_packages = []
+        package_paths = [
+            package_path
+            for package_path in (
+                self.get_packages_paths() if package_paths is None else package_paths
+            )
+            if force or ManagedWorkdir.is_app_workdir_path(path=package_path)
+        ]
 
-        for package_path in self.get_packages_paths():
-            if not force and not ManagedWorkdir.is_app_workdir_path(path=package_path):
-                continue
+        if jobs > 1:
+            return self._packages_execute_parallel(
+                package_paths=package_paths,
+                cmd=cmd,
+                executor_method=executor_method,
+                message=message,
+                fail_fast=fail_fast,
+                jobs=jobs,
+            )
+
+        failed_packages = []
 
+        for package_path in package_paths:
             self._package_title(path=package_path, message=message)
             self.command(command=cmd, indentation=1)
             self.separator(color=TerminalColor.BLACK)
@@ -620,10 +1004,90 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
                 f"{len(failed_packages)} package(s) failed: {', '.join(names)}"
             )
 
+        return failed_packages
+
+    def _packages_execute_parallel(
+        self,
+        package_paths: list[Path],
+        cmd: list[str],
+        executor_method: callable,
+        message: str,
+        fail_fast: bool,
+        jobs: int,
+    ) -> list[Path]:
+        from wexample_prompt.enums.terminal_color import TerminalColor
+
+        from wexample_wex_addon_app.helper.dependency_graph import (
+            dependency_graph_run,
+        )
+
+        paths_by_key = {str(path.resolve()): path for path in package_paths}
+        names_by_key: dict[str, str] = {}
+        for package in self.get_packages():
+            key = str(package.get_path().resolve())
+            if key in paths_by_key:
+                names_by_key[key] = package.get_package_name()
+        keys_by_name = {name: key for key, name in names_by_key.items()}
+
+        dependencies_map = self.build_dependencies_map()
+        graph = {
+            key: [
+                keys_by_name[name]
+                for name in dependencies_map.get(names_by_key.get(key), [])
+                if name in keys_by_name
+            ]
+            for key in paths_by_key
+        }
+
+        self.log(f"{message} on {len(graph)} package(s) with {jobs} parallel jobs")
+        self.command(command=cmd, indentation=1)
+
+        def _run(key: str):
+            return executor_method(cmd=cmd, path=paths_by_key[key], inherit_stdio=False)
+
+        def _on_done(key: str, result, error: BaseException | None) -> None:
+            path = paths_by_key[key]
+            self._package_title(path=path, message=message)
+            if error is not None:
+                stdout = getattr(error, "stdout", None)
+                stderr = getattr(error, "stderr", None)
+            elif result is None:
+                stdout = stderr = None
+                self.log("Invalid package directory, skipping.", indentation=1)
+            else:
+                stdout, stderr = result.stdout, result.stderr
+
+            for output in (stdout, stderr):
+                for line in (output or "").splitlines():
+                    self.log(f"[{path.name}] {line}", indentation=1)
+
+            if error is not None:
+                self.log("Package failed.", indentation=1)
+            self.separator(color=TerminalColor.BLACK)
+
+        failures = dependency_graph_run(
+            dependencies=graph,
+            fn=_run,
+            max_workers=jobs,
+            fail_fast=fail_fast,
+            on_done=_on_done,
+        )
+
+        if not failures:
+            return []
+
+        if fail_fast:
+            raise next(iter(failures.values()))
+
+        names = [paths_by_key[key].name for key in failures]
+        self.warning(f"{len(failures)} package(s) failed: {', '.join(names)}")
+        return [paths_by_key[key] for key in failures]
+
     def _pre_install_python_packages_editable(self, force: bool = False) -> None:
         from wexample_wex_addon_app.helper.python import (
-            python_install_dependency_in_venv,
-            python_is_package_installed_editable_in_venv,
+            python_get_editable_installs_in_venv,
+            python_install_dependencies_batch_in_venv,
+            python_normalize_package_name,
         )
 
         venv_path_config = self.search_app_or_suite_runtime_config("python.venv_path")
@@ -643,17 +1107,71 @@ class FrameworkPackageSuiteWorkdir(RepoWorkdir):
         self.subtitle(
             f"Pre-installing {len(python_packages)} Python packages in editable mode"
         )
+        # One read of the venv answers for every package, no pip call.
+        editables = {} if force else python_get_editable_installs_in_venv(venv_path)
+        to_install = []
         for pkg in python_packages:
             pkg_path = pkg.get_path()
             pkg_name = pkg.get_package_name()
-            if force or not python_is_package_installed_editable_in_venv(
-                venv_path=venv_path,
-                package_name=pkg_name,
-                package_path=pkg_path,
-            ):
+            editable_path = editables.get(python_normalize_package_name(pkg_name))
+            if editable_path and editable_path.resolve() == pkg_path.resolve():
+                self.log(f"  [skip] {pkg_name} (already editable)")
+            else:
                 self.log(f"  -e {pkg_name}")
-                python_install_dependency_in_venv(
-                    venv_path=venv_path, name=pkg_path, editable=True
+                to_install.append(pkg_path)
+
+        python_install_dependencies_batch_in_venv(
+            venv_path=venv_path, names=to_install, editable=True
+        )
+
+    def _propagate_version_of(
+        self,
+        package: WithSuiteTreeWorkdirMixin,
+        oracle: GitChangeOracle | None = None,
+    ) -> None:
+        from wexample_helpers.const.types import UPGRADE_TYPE_MINOR
+
+        bump_type = package.classify_version_bump(oracle=oracle)
+
+        # Patch bumps do not propagate — dependents with >= already satisfy the new version
+        if bump_type == UPGRADE_TYPE_MINOR:
+            package.log(
+                f"Patch bump for {package.get_project_name()}, skipping propagation.",
+                prefix=True,
+            )
+            return
+
+        package.log(f"Propagating version {package.get_setup_version()}", prefix=True)
+        package.io.indentation_up()
+
+        for dependent in self.get_dependents(package):
+            updated = dependent.save_dependency(
+                package=package,
+                version=package.get_setup_version(),
+                operator=">=",
+            )
+            if updated:
+                package.log(
+                    f"Updated {dependent.get_project_name()} dependencies",
                 )
-            else:
-                self.log(f"  [skip] {pkg_name} (already editable)")
+
+        package.success("Packages version has been propagated across suite")
+        package.io.indentation_down()
+
+    def _search_imports_by_package(
+        self, search_fn: Callable, dependencies_map: dict[str, list[str]]
+    ) -> dict[str, list[str]]:
+        # Packages without an import index: one codebase search per package.
+        imports_map: dict[str, list[str]] = {}
+        for package_name_search in dependencies_map:
+            searched_package = self.get_package(package_name_search)
+            if searched_package is None:
+                continue
+
+            imports = search_fn(searched_package)
+            if imports:
+                imports_map[package_name_search] = [
+                    f"{res.item.get_path()}:{res.line}:{res.column}"
+                    for res in imports
+                ]
+        return imports_map
@@ -47,6 +47,8 @@ if TYPE_CHECKING:
     )
     from wexample_helpers.classes.shell_result import ShellResult
 
+    from wexample_wex_addon_app.common.config_build_cache import ConfigBuildCache
+
 
 @base_class
 class ManagedWorkdir(
@@ -84,19 +86,26 @@ class ManagedWorkdir(
     def manager_run_command_from_path(
         cls,
         path: str,
-        command: callable,
+        command: callable | str,
         arguments: list[str] | None = None,
+        inherit_stdio: bool = True,
     ) -> AppManagerShellResult:
         """
         Execute a Python addon command (e.g., app__setup__install) using the app manager,
         within a specific workdir.
+
+        `command` may also be a command name, e.g. a service hook address.
         """
         from wexample_app.const.globals import APP_PATH_BIN_APP_MANAGER
         from wexample_helpers.helper.shell import shell_run
 
         # Resolve function to CLI command name
-        resolved_command = AddonCommandResolver.build_command_from_function(
-            command_wrapper=command
+        resolved_command = (
+            command
+            if isinstance(command, str)
+            else AddonCommandResolver.build_command_from_function(
+                command_wrapper=command
+            )
         )
 
         request_id = request_build_id()
@@ -116,10 +125,17 @@ class ManagedWorkdir(
             *(arguments or []),
         ]
 
-        # Run the manager command in the given workdir
+        # Run the manager command in the given workdir, through the app-manager
+        # daemon when it is enabled for this app.
+        result = cls._manager_daemon_request(
+            path=path, cmd=full_cmd, inherit_stdio=inherit_stdio
+        )
+        if result is None:
+            result = shell_run(cmd=full_cmd, cwd=path, inherit_stdio=inherit_stdio)
+
         return AppManagerShellResult.from_shell_result(
             request_id=request_id,
-            result=shell_run(cmd=full_cmd, cwd=path, inherit_stdio=True),
+            result=result,
         )
 
     @classmethod
@@ -128,7 +144,14 @@ class ManagedWorkdir(
         path: FileStringOrPath,
         cmd: list[str] | str,
         inherit_stdio: bool = True,
+        env: dict[str, str] | None = None,
     ) -> ShellResult:
+        """Run an app-manager command line in the app at `path`.
+
+        `env` adds to the environment of this process for that command only.
+        """
+        import os
+
         from wexample_app.const.globals import APP_PATH_BIN_APP_MANAGER
         from wexample_helpers.helper.shell import shell_run
 
@@ -138,22 +161,51 @@ class ManagedWorkdir(
         full_cmd = [str(APP_PATH_BIN_APP_MANAGER), "--subprocess"]
         full_cmd.extend(cmd)
 
+        result = cls._manager_daemon_request(
+            path=path, cmd=full_cmd, inherit_stdio=inherit_stdio, env=env
+        )
+        if result is not None:
+            return result
+
         return shell_run(
             cmd=full_cmd,
             cwd=path,
+            env={**os.environ, **env} if env else None,
             inherit_stdio=inherit_stdio,
         )
 
     @classmethod
     def shell_run_from_path(
-        cls, path: FileStringOrPath, cmd: list[str] | str
+        cls,
+        path: FileStringOrPath,
+        cmd: list[str] | str,
+        inherit_stdio: bool = True,
     ) -> ShellResult:
         from wexample_helpers.helper.shell import shell_run
 
         return shell_run(
             cmd=cmd,
             cwd=str(path),
-            inherit_stdio=True,
+            inherit_stdio=inherit_stdio,
+        )
+
+    @classmethod
+    def _manager_daemon_request(
+        cls,
+        path: FileStringOrPath,
+        cmd: list[str],
+        inherit_stdio: bool = True,
+        env: dict[str, str] | None = None,
+    ) -> ShellResult | None:
+        from pathlib import Path
+
+        from wexample_wex_addon_app.common.app_manager_daemon import (
+            AppManagerDaemon,
+        )
+
+        # cmd[0] is the app-manager binary, the daemon gets the arguments.
+        return AppManagerDaemon(app_path=Path(path).resolve()).request(
+            argv=cmd[1:], cwd=Path(path), inherit_stdio=inherit_stdio, env=env
         )
 
     @staticmethod
@@ -242,11 +294,19 @@ class ManagedWorkdir(
         from wexample_config.config_value.nested_config_value import NestedConfigValue
         from wexample_helpers.helper.dict import dict_merge
 
+        # Merging the suite tree parses every config and env file up to the
+        # root suite: reuse the previous result while none of them changed.
+        cached = self._read_runtime_config_value_cache()
+        if cached is not None:
+            return NestedConfigValue(raw=cached)
+
         base = super().build_runtime_config_value()
         project_name = self.get_docker_project_name(self.get_app_env())
-        return NestedConfigValue(
+        value = NestedConfigValue(
             raw=dict_merge(base.to_dict(), {"app": {"project_name": project_name}})
         )
+        self._write_runtime_config_value_cache(value.to_dict())
+        return value
 
     def clear_logs(self) -> None:
         import shutil
@@ -257,6 +317,15 @@ class ManagedWorkdir(
         if logs_dir.exists():
             shutil.rmtree(logs_dir)
 
+    def clear_runtime_config_cache(self) -> None:
+        super().clear_runtime_config_cache()
+
+        cache_path = self._get_runtime_config_value_cache_path()
+        if cache_path.exists():
+            cache_path.unlink()
+
+        self.get_config_build_cache().clear()
+
     def configure(self, config: DictConfig, eager: bool = False) -> None:
         super().configure(config=config, eager=eager)
 
@@ -345,6 +414,29 @@ class ManagedWorkdir(
         suite = AppAddonManager.from_kernel(kernel).create_app_workdir(path=suite_path)
         return suite.get_code_scope_paths(kernel)
 
+    def get_config_build_cache(self) -> ConfigBuildCache:
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.common.config_build_cache import ConfigBuildCache
+        from wexample_wex_addon_app.const.path import APP_FILE_CONFIG_BUILD_CACHE
+
+        return ConfigBuildCache(
+            path=self.get_path() / APP_PATH_TMP / APP_FILE_CONFIG_BUILD_CACHE
+        )
+
+    def get_db_dumps_dir(self, service_name: str) -> Path:
+        from wexample_app.const.globals import WORKDIR_SETUP_DIR
+
+        return self.get_path() / WORKDIR_SETUP_DIR / service_name / "dumps"
+
+    def get_db_name(self, service_name: str) -> str:
+        runtime = self.get_runtime_config()
+        return (
+            runtime.search(f"service.{service_name}.name").get_str_or_none()
+            or runtime.search("db.main").get_str_or_none()
+            or runtime.search("app.name").get_str()
+        )
+
     def get_dependencies_versions(self) -> dict[str, str]:
         return {}
 
@@ -385,6 +477,16 @@ class ManagedWorkdir(
 
         return result
 
+    def get_image_build_cache(self) -> ConfigBuildCache:
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.common.config_build_cache import ConfigBuildCache
+        from wexample_wex_addon_app.const.path import APP_FILE_IMAGE_BUILD_CACHE
+
+        return ConfigBuildCache(
+            path=self.get_path() / APP_PATH_TMP / APP_FILE_IMAGE_BUILD_CACHE
+        )
+
     def get_local_libraries_paths(self) -> list[ConfigValue]:
         return self.get_runtime_config().search("libraries").get_list_or_default()
 
@@ -813,36 +915,28 @@ class ManagedWorkdir(
         return raw_value
 
     def runtime_cleanup(self) -> tuple[int, int]:
-        from wexample_helpers.helper.docker import (
-            docker_container_is_running,
+        from wexample_wex_addon_app.helper.docker import (
             docker_image_exists,
+            docker_list_containers,
             docker_remove_container,
             docker_remove_image,
             docker_stop_container,
         )
-        from wexample_helpers.helper.shell import shell_run
 
         image_names: set[str] = self._collect_docker_image_names()
 
-        result = shell_run(
-            cmd=["docker", "ps", "-a", "--format", "{{.Names}}\t{{.Image}}"],
-            capture=True,
-        )
-        # Avoid splitting each matching line twice by capturing the split result
-        # once via a nested loop.
+        # One listing gives both the containers to remove and their state.
         containers_to_remove = [
-            parts[0]
-            for line in result.stdout.strip().splitlines()
-            if "\t" in line
-            for parts in (line.split("\t"),)
-            if parts[1] in image_names
+            container
+            for container in docker_list_containers(include_stopped=True)
+            if container["image"] in image_names
         ]
 
         removed_containers = 0
-        for name in containers_to_remove:
-            if docker_container_is_running(name):
-                docker_stop_container(name)
-            docker_remove_container(name)
+        for container in containers_to_remove:
+            if container["state"] == "running":
+                docker_stop_container(container["name"])
+            docker_remove_container(container["name"])
             removed_containers += 1
 
         removed_images = 0
@@ -898,3 +992,70 @@ class ManagedWorkdir(
 
     def _get_iml_file_class(self) -> type[ImlFile]:
         return ImlFile
+
+    def _get_runtime_config_value_cache_path(self) -> Path:
+        from wexample_app.const.globals import WORKDIR_SETUP_DIR
+        from wexample_app.const.path import APP_DIR_NAME_TMP
+
+        from wexample_wex_addon_app.const.path import APP_FILE_RUNTIME_CONFIG_CACHE
+
+        return (
+            self.get_path()
+            / WORKDIR_SETUP_DIR
+            / APP_DIR_NAME_TMP
+            / APP_FILE_RUNTIME_CONFIG_CACHE
+        )
+
+    def _read_runtime_config_value_cache(self) -> dict | None:
+        """Return the cached runtime config value, or None when any source changed.
+
+        Sources are checked by mtime and size first; a file whose metadata moved
+        is re-hashed, so touching it without changing its content keeps the cache.
+        """
+        from wexample_filestate.item.file.json_file import JsonFile
+
+        from wexample_wex_addon_app.helper.fingerprint import (
+            fingerprint_digest,
+            fingerprint_files,
+        )
+
+        cache_path = self._get_runtime_config_value_cache_path()
+        if not cache_path.exists():
+            return None
+
+        cache_file = JsonFile.create_from_path(path=cache_path, configure=False)
+        cache = cache_file.read_parsed() or {}
+        sources = cache.get("sources")
+        if not isinstance(sources, dict) or "value" not in cache:
+            return None
+
+        fingerprints = fingerprint_files(sources, previous=sources)
+        if fingerprint_digest(fingerprints, self.get_app_env()) != cache.get("digest"):
+            return None
+
+        if fingerprints != sources:
+            # Same content, newer metadata: store it to skip hashing next time.
+            cache["sources"] = fingerprints
+            cache_file.write_parsed(cache)
+
+        return cache["value"]
+
+    def _write_runtime_config_value_cache(self, value: dict) -> None:
+        from wexample_filestate.item.file.json_file import JsonFile
+        from wexample_helpers.helper.file import file_chown_as_real_user_if_elevated
+
+        from wexample_wex_addon_app.helper.fingerprint import (
+            fingerprint_digest,
+            fingerprint_files,
+        )
+
+        fingerprints = fingerprint_files(self.get_runtime_config_source_paths())
+        cache_path = self._get_runtime_config_value_cache_path()
+        JsonFile.create_from_path(path=cache_path, configure=False).write_parsed(
+            {
+                "digest": fingerprint_digest(fingerprints, self.get_app_env()),
+                "sources": fingerprints,
+                "value": value,
+            }
+        )
+        file_chown_as_real_user_if_elevated(cache_path)
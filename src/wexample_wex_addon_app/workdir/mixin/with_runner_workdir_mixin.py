@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from wexample_runner.runner_config import RunnerConfig
     from wexample_runner.runner_result import RunnerResult
 
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
 
 class WithRunnerWorkdirMixin:
     """Mixin that gives a workdir the ability to execute commands inside runners (e.g. Docker).
@@ -17,10 +19,24 @@ class WithRunnerWorkdirMixin:
 
     The runner is built and started automatically on first use.
     If ephemeral=True in the RunnerConfig, the container is destroyed after each call.
+
+    Setting the `runner.pool_idle_ttl` runtime config (seconds) pools the
+    non-ephemeral runners: their containers stay warm across commands and
+    processes and are removed once idle for that long, see RunnerPool.
     """
 
     _runner_instances: dict[str, DockerRunner] = {}
 
+    def get_runner_pool_idle_ttl(self, runner_name: str) -> int | None:
+        """Seconds a pooled container of the runner stays up unused.
+
+        None does not pool the runner. Override to pool runners regardless of
+        the runtime config.
+        """
+        return self.search_app_or_suite_runtime_config(
+            "runner.pool_idle_ttl"
+        ).get_int_or_none()
+
     def get_runners(self) -> dict[str, RunnerConfig]:
         """Declare the runners available for this workdir.
 
@@ -51,6 +67,12 @@ class WithRunnerWorkdirMixin:
         Destroys the container after execution if ephemeral=True.
         """
         runner = self._get_or_create_runner(runner_name)
+        pool = None if runner.ephemeral else self._get_runner_pool(runner_name)
+        if pool is not None:
+            return self._runner_exec_pooled(
+                pool=pool, runner=runner, cmd=cmd, workdir=workdir, env=env
+            )
+
         runner.ensure_running()
 
         result = runner.execute(cmd=cmd, workdir=workdir, env=env)
@@ -61,6 +83,32 @@ class WithRunnerWorkdirMixin:
 
         return result
 
+    def runner_exec_batch(
+        self,
+        runner_name: str,
+        cmds: list[list[str] | str],
+        workdir: str | None = None,
+        env: dict[str, str] | None = None,
+        stop_on_error: bool = False,
+    ) -> list[RunnerResult]:
+        """Execute several commands in one exec session of the named runner.
+
+        Each command gets its own result, in order. With `stop_on_error`, the
+        commands after the first failing one are not run and have no result.
+        When the session itself fails before any command, its result is the
+        only one returned.
+        """
+        import uuid
+
+        marker = f"__wex_batch_{uuid.uuid4().hex}"
+        result = self.runner_exec(
+            runner_name=runner_name,
+            cmd=["sh", "-c", _build_batch_script(cmds, marker, stop_on_error)],
+            workdir=workdir,
+            env=env,
+        )
+        return _split_batch_result(result, marker, len(cmds))
+
     def _build_runner(self, runner_name: str) -> DockerRunner:
         from wexample_runner.runner.docker_runner import DockerRunner
 
@@ -101,3 +149,95 @@ class WithRunnerWorkdirMixin:
             runner = self._build_runner(runner_name)
             self._runner_instances[runner_name] = runner
         return runner
+
+    def _get_runner_pool(self, runner_name: str) -> RunnerPool | None:
+        from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+        idle_ttl = self.get_runner_pool_idle_ttl(runner_name)
+        if idle_ttl is None:
+            return None
+
+        return RunnerPool.shared(
+            state_path=RunnerPool.get_state_path(self.get_path()),
+            idle_ttl=idle_ttl,
+        )
+
+    def _runner_exec_pooled(
+        self,
+        pool: RunnerPool,
+        runner: DockerRunner,
+        cmd: list[str] | str,
+        workdir: str | None,
+        env: dict[str, str] | None,
+    ) -> RunnerResult:
+        with pool.use(runner) as pooled:
+            result = pooled.execute(cmd=cmd, workdir=workdir, env=env)
+        if _is_container_gone(result):
+            # Expired and removed by another process since this one acquired it.
+            pool.forget(runner)
+            with pool.use(runner) as pooled:
+                result = pooled.execute(cmd=cmd, workdir=workdir, env=env)
+        return result
+
+
+def _build_batch_script(
+    cmds: list[list[str] | str], marker: str, stop_on_error: bool
+) -> str:
+    import shlex
+
+    # Each command's output is framed by marker lines on both streams. The
+    # closing marker starts with a newline, so output without a final one
+    # still ends before it.
+    lines = []
+    for index, cmd in enumerate(cmds):
+        command = cmd if isinstance(cmd, str) else shlex.join(cmd)
+        lines += [
+            f"printf '%s\\n' '{marker}:{index}'",
+            f"printf '%s\\n' '{marker}:{index}' >&2",
+            f"( {command}\n)",
+            "code=$?",
+            f"printf '\\n%s\\n' \"{marker}:{index}:$code\"",
+            f"printf '\\n%s\\n' '{marker}:{index}:end' >&2",
+        ]
+        if stop_on_error:
+            lines.append('[ "$code" -eq 0 ] || exit "$code"')
+    return "\n".join(lines)
+
+
+def _is_container_gone(result: RunnerResult) -> bool:
+    return result.stderr.startswith("Error response from daemon") and (
+        "No such container" in result.stderr or "is not running" in result.stderr
+    )
+
+
+def _split_batch_result(
+    result: RunnerResult, marker: str, count: int
+) -> list[RunnerResult]:
+    import re
+
+    from wexample_runner.runner_result import RunnerResult
+
+    results = []
+    for index in range(count):
+        opening = re.escape(f"{marker}:{index}")
+        stdout = re.search(
+            rf"^{opening}\n(.*?)\n{opening}:(\d+)$",
+            result.stdout,
+            re.DOTALL | re.MULTILINE,
+        )
+        if stdout is None:
+            break
+        stderr = re.search(
+            rf"^{opening}\n(.*?)\n{opening}:end$",
+            result.stderr,
+            re.DOTALL | re.MULTILINE,
+        )
+        results.append(
+            RunnerResult(
+                exit_code=int(stdout.group(2)),
+                stderr=stderr.group(1) if stderr else "",
+                stdout=stdout.group(1),
+            )
+        )
+
+    return results or [result]
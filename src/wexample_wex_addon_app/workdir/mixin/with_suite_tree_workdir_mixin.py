@@ -123,6 +123,39 @@ class WithSuiteTreeWorkdirMixin(BaseClass):
                 )
         return value
 
+    def get_python_wheelhouse_path(self) -> Path | None:
+        """Wheel directory shared by the venv installs of the parent suite."""
+        from wexample_app.const.globals import APP_PATH_TMP
+
+        from wexample_wex_addon_app.const.path import APP_DIR_WHEELHOUSE
+
+        suite_path = self.find_suite_workdir_path()
+        if not suite_path:
+            return None
+        return suite_path / APP_PATH_TMP / APP_DIR_WHEELHOUSE
+
+    def get_runtime_config_source_paths(self) -> list[Path]:
+        """Return every file read by `build_runtime_config_value`.
+
+        That is the config and local env file of each workdir of the suite
+        tree, plus the env-specific config of the current workdir.
+        """
+        from wexample_app.const.globals import (
+            APP_FILE_APP_CONFIG,
+            APP_PATH_LOCAL_ENV,
+            WORKDIR_SETUP_DIR,
+        )
+
+        env_dir = self.get_path() / WORKDIR_SETUP_DIR / "env" / self.get_app_env()
+        paths = [env_dir / APP_FILE_APP_CONFIG]
+        for workdir_path in self.collect_stack_in_suites_tree(
+            lambda workdir: workdir.get_path()
+        ):
+            paths.append(workdir_path / WORKDIR_SETUP_DIR / APP_FILE_APP_CONFIG)
+            paths.append(workdir_path / APP_PATH_LOCAL_ENV)
+
+        return paths
+
     def get_shallow_suite_workdir(self) -> False | FrameworkPackageSuiteWorkdir:
         suite_class = self._get_suite_workdir_class()
         if not suite_class:
@@ -161,6 +194,16 @@ class WithSuiteTreeWorkdirMixin(BaseClass):
             return
         suite.propagate_version_of(package=self)
 
+    def python_install_environment(self, force: bool = False) -> Path:
+        """Create or refresh the `.venv` of the workdir, see the helper."""
+        from wexample_wex_addon_app.helper.python import python_install_environment
+
+        return python_install_environment(
+            path=self.get_path(),
+            force=force,
+            wheelhouse=self.get_python_wheelhouse_path(),
+        )
+
     def search_closest_in_suites_tree(self, callback) -> Any:
         workdir = self
 
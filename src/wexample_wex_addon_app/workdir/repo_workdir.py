@@ -4,31 +4,49 @@ from typing import TYPE_CHECKING
 
 from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
 from wexample_helpers.classes.abstract_method import abstract_method
+from wexample_helpers.classes.private_field import private_field
 from wexample_helpers.decorator.base_class import base_class
 
 from wexample_wex_addon_app.workdir.managed_workdir import ManagedWorkdir
 
 if TYPE_CHECKING:
-    pass
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
 
 
 @base_class
 class RepoWorkdir(ManagedWorkdir):
-    def bump(self, interactive: bool = False, force: bool = False, **kwargs) -> bool:
-        """Create a version-x.y.z branch, update the version number in config. Don't commit changes."""
+    _git_change_oracle: GitChangeOracle | None = private_field(
+        default=None,
+        description="Snapshot answering git change checks while classifying a bump",
+    )
+
+    def bump(
+        self,
+        interactive: bool = False,
+        force: bool = False,
+        oracle: GitChangeOracle | None = None,
+        **kwargs,
+    ) -> bool:
+        """Create a version-x.y.z branch, update the version number in config. Don't commit changes.
+
+        Changes are read from `oracle`, or from one made for this bump.
+        """
         from wexample_helpers.helper.version import version_increment
         from wexample_prompt.responses.interactive.confirm_prompt_response import (
             ConfirmPromptResponse,
         )
 
-        has_changes = self.has_changes_since_last_publication_tag()
+        from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+        oracle = oracle or GitChangeOracle()
+        has_changes = self.has_changes_since_last_publication_tag(oracle=oracle)
         if not force and not has_changes:
             self.log(f"Package {self.get_package_name()} has no new content to bump.")
             return False
 
         current_version = self.get_setup_version()
         if "type" not in kwargs:
-            kwargs["type"] = self.classify_version_bump()
+            kwargs["type"] = self.classify_version_bump(oracle=oracle)
         new_version = version_increment(version=current_version, **kwargs)
         branch_name = f"version-{new_version}"
 
@@ -105,20 +123,25 @@ class RepoWorkdir(ManagedWorkdir):
             "Fix: run `eval $(ssh-agent) && ssh-add`, then `wex core::env/configure`"
         )
 
-    def classify_version_bump(self) -> str:
+    def classify_version_bump(self, oracle: GitChangeOracle | None = None) -> str:
         """Return the version bump type for this package based on changes since last tag.
 
         Handles the no-previous-tag case (first publication → patch) then delegates
-        to _classify_version_bump() for language-specific logic.
+        to _classify_version_bump() for language-specific logic. With an `oracle`,
+        tags and changes are read from its suite-wide snapshot instead of git.
         """
         from wexample_helpers.const.types import UPGRADE_TYPE_MINOR
 
-        last_tag = self.get_last_publication_tag()
+        last_tag = self.get_last_publication_tag(oracle=oracle)
         if last_tag is None:
             # First publication — no previous consumers, nothing to break
             return UPGRADE_TYPE_MINOR
 
-        return self._classify_version_bump(last_tag)
+        self._git_change_oracle = oracle
+        try:
+            return self._classify_version_bump(last_tag)
+        finally:
+            self._git_change_oracle = None
 
     def count_source_code_lines(self) -> int:
         return self._count_code_lines(self._get_source_code_directories())
@@ -140,10 +163,15 @@ class RepoWorkdir(ManagedWorkdir):
         """
         return 0
 
-    def get_last_publication_tag(self) -> str | None:
+    def get_last_publication_tag(
+        self, oracle: GitChangeOracle | None = None
+    ) -> str | None:
         """Return the last publication tag for this package, or None if none exists."""
         from wexample_helpers_git.helper.git import git_last_tag_for_prefix
 
+        if oracle is not None:
+            return oracle.get_last_tag(self.get_path(), self.get_package_name())
+
         prefix = f"{self.get_package_name()}/v*"
         return git_last_tag_for_prefix(prefix, cwd=self.get_path(), inherit_stdio=False)
 
@@ -177,7 +205,9 @@ class RepoWorkdir(ManagedWorkdir):
             cwd=self.get_path()
         ) or git_has_changes_since_tag(last_commit, ".", cwd=self.get_path())
 
-    def has_changes_since_last_publication_tag(self) -> bool:
+    def has_changes_since_last_publication_tag(
+        self, oracle: GitChangeOracle | None = None
+    ) -> bool:
         """Return True if there are any changes (code or deps) since the last publication tag.
 
         Compares the working tree against the last pub tag so that dep-version
@@ -186,9 +216,11 @@ class RepoWorkdir(ManagedWorkdir):
         """
         from wexample_helpers_git.helper.git import git_has_changes_since_tag
 
-        last_tag = self.get_last_publication_tag()
+        last_tag = self.get_last_publication_tag(oracle=oracle)
         if last_tag is None:
             return True
+        if oracle is not None:
+            return oracle.has_changes_since(last_tag, self.get_path())
         return git_has_changes_since_tag(last_tag, ".", cwd=self.get_path())
 
     def has_tests(self) -> bool:
@@ -334,14 +366,11 @@ class RepoWorkdir(ManagedWorkdir):
         Override in language-specific workdirs for finer-grained detection.
         """
         from wexample_helpers.const.types import UPGRADE_TYPE_MAJOR, UPGRADE_TYPE_MINOR
-        from wexample_helpers_git.helper.git import git_has_changes_since_tag
 
         workdir_path = self.get_path()
         for directory in self._get_critical_directories():
             dir_path = workdir_path / directory
-            if dir_path.exists() and git_has_changes_since_tag(
-                last_tag, directory, cwd=workdir_path
-            ):
+            if dir_path.exists() and self._has_changes_since_tag(last_tag, directory):
                 return UPGRADE_TYPE_MAJOR
 
         return UPGRADE_TYPE_MINOR
@@ -403,6 +432,19 @@ class RepoWorkdir(ManagedWorkdir):
     def _get_test_code_directories(self) -> list[TargetFileOrDirectoryType]:
         return []
 
+    def _has_changes_since_tag(self, tag: str, pathspec: str = ".") -> bool:
+        """Git change check for `_classify_version_bump()` implementations.
+
+        Goes through the suite oracle when `classify_version_bump()` got one.
+        """
+        from wexample_helpers_git.helper.git import git_has_changes_since_tag
+
+        if self._git_change_oracle is not None:
+            return self._git_change_oracle.has_changes_since(
+                tag, self.get_path(), pathspec
+            )
+        return git_has_changes_since_tag(tag, pathspec, cwd=self.get_path())
+
     def _post_publish(self) -> None:
         pass
 
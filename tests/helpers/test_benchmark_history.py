@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def test_benchmark_history_append_and_read(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        benchmark_history_append,
+        benchmark_history_read,
+    )
+
+    path = tmp_path / ".wex" / "local" / "benchmark.history.jsonl"
+    assert benchmark_history_read(path) == []
+
+    benchmark_history_append(path, {"commit": "a", "entries": []})
+    with path.open("a") as history_file:
+        history_file.write("not json\n")
+    benchmark_history_append(path, {"commit": "b", "entries": []})
+
+    assert [run["commit"] for run in benchmark_history_read(path)] == ["a", "b"]
+
+
+def test_benchmark_history_compare_flags_significant_changes() -> None:
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        benchmark_history_compare,
+    )
+
+    baseline = [
+        _entry("stable", 10.0, 9.8, 10.2),
+        _entry("slower", 10.0, 9.8, 10.2),
+        _entry("faster", 10.0, 9.8, 10.2),
+        _entry("noisy", 10.0, 2.0, 30.0),
+    ]
+    current = [
+        _entry("stable", 10.1, 9.9, 10.3),
+        _entry("slower", 12.0, 11.8, 12.2),
+        _entry("faster", 8.0, 7.8, 8.2),
+        _entry("noisy", 12.0, 2.0, 30.0),
+        _entry("added", 1.0, 0.9, 1.1),
+    ]
+
+    comparison = {
+        item["name"]: item for item in benchmark_history_compare(baseline, current)
+    }
+
+    assert comparison["stable"]["status"] == "unchanged"
+    assert comparison["slower"]["status"] == "regression"
+    assert comparison["slower"]["change_pct"] == 20.0
+    assert comparison["faster"]["status"] == "improvement"
+    # Same change as "slower", yet within the noise of the runs.
+    assert comparison["noisy"]["status"] == "unchanged"
+    assert comparison["added"]["status"] == "new"
+
+
+def test_benchmark_history_compare_respects_threshold() -> None:
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        benchmark_history_compare,
+    )
+
+    baseline = [_entry("bench", 10.0, 10.0, 10.0)]
+    current = [_entry("bench", 11.0, 11.0, 11.0)]
+
+    assert benchmark_history_compare(baseline, current, 5.0)[0]["status"] == (
+        "regression"
+    )
+    assert benchmark_history_compare(baseline, current, 15.0)[0]["status"] == (
+        "unchanged"
+    )
+
+
+def test_benchmark_history_find_run_prefers_same_machine() -> None:
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        benchmark_history_find_run,
+    )
+
+    runs = [
+        {"commit": "a", "machine": "m1", "baseline": True, "id": 1},
+        {"commit": "a", "machine": "m2", "baseline": False, "id": 2},
+        {"commit": "b", "machine": "m1", "baseline": False, "id": 3},
+        {"commit": "b", "machine": "m2", "baseline": True, "id": 4},
+    ]
+
+    assert benchmark_history_find_run(runs, commit="a", machine="m1")["id"] == 1
+    assert benchmark_history_find_run(runs, commit="a", machine="m3")["id"] == 2
+    assert benchmark_history_find_run(runs, baseline=True, machine="m1")["id"] == 1
+    assert benchmark_history_find_run(runs, baseline=True, machine="m2")["id"] == 4
+    assert benchmark_history_find_run(runs, commit="c", machine="m1") is None
+
+
+def test_benchmark_history_machine_fingerprint_is_stable() -> None:
+    from wexample_wex_addon_app.helper.benchmark_history import (
+        benchmark_history_machine_fingerprint,
+    )
+
+    fingerprint = benchmark_history_machine_fingerprint()
+
+    assert fingerprint == benchmark_history_machine_fingerprint()
+    assert len(fingerprint) == 12
+
+
+def test_performance_report_gate_fails_without_baseline(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_app.exception.app_runtime_exception import AppRuntimeException
+
+    from wexample_wex_addon_app.commands.performance.report import (
+        app__performance__report,
+    )
+    from wexample_wex_addon_app.workdir.mixin.abstract_profiling_workdir_mixin import (
+        AbstractProfilingWorkdirMixin,
+    )
+
+    class _Workdir(AbstractProfilingWorkdirMixin):
+        def get_path(self) -> Path:
+            return tmp_path
+
+        def run_profiling(self) -> dict:
+            return {
+                "entries": [_entry("bench", 1.0, 1.0, 1.0)],
+                "language": "python",
+                "tool": "pytest",
+            }
+
+    class _Io:
+        def properties(self, properties: dict, title: str) -> None:
+            pass
+
+    class _Context:
+        io = _Io()
+        kernel = None
+
+    for response in (
+        "multiple_response.MultipleResponse",
+        "properties_response.PropertiesResponse",
+        "warning_response.WarningResponse",
+    ):
+        monkeypatch.setattr(
+            f"wexample_app.response.{response}", lambda **kwargs: kwargs
+        )
+
+    with pytest.raises(AppRuntimeException, match="--allow-missing-baseline"):
+        app__performance__report.function(
+            context=_Context(), app_workdir=_Workdir(), fail_on_regression=10.0
+        )
+
+    allowed = app__performance__report.function(
+        context=_Context(),
+        app_workdir=_Workdir(),
+        fail_on_regression=10.0,
+        allow_missing_baseline=True,
+    )
+    assert "No recorded run" in allowed["responses"][-1]["message"]
+
+
+def _entry(name: str, median: float, low: float, high: float) -> dict[str, Any]:
+    return {
+        "name": name,
+        "min_ms": low,
+        "mean_ms": median,
+        "median_ms": median,
+        "max_ms": high,
+        "rounds": 20,
+    }
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import gzip
+import io
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SQL = b"INSERT INTO t VALUES (1);\n" * 10000
+
+
+def test_db_dump_extract_writes_new_sql_file(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_extract
+
+    source = tmp_path / "local-app.sql.gz"
+    source.write_bytes(gzip.compress(SQL))
+    existing = tmp_path / "local-app.sql"
+    existing.write_bytes(b"keep")
+
+    sql_path = db_dump_extract(source, tmp_path)
+
+    assert sql_path.parent == tmp_path and sql_path.suffix == ".sql"
+    assert sql_path.read_bytes() == SQL
+    assert existing.read_bytes() == b"keep"
+
+
+def test_db_dump_file_name_rejects_unknown_compression() -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_file_name
+
+    assert db_dump_file_name("local-app", "gzip") == "local-app.sql.gz"
+    assert db_dump_file_name("local-app", "none") == "local-app.sql"
+    assert db_dump_file_name("local-app", "zip") == "local-app.sql.zip"
+
+    with pytest.raises(ValueError):
+        db_dump_file_name("local-app", "rar")
+
+
+def test_db_dump_run_streams_command_output_to_gzip(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_run
+
+    source = tmp_path / "dump.sql"
+    source.write_bytes(SQL)
+    target = tmp_path / "dump.sql.gz"
+    progress = []
+
+    read_size, written_size = db_dump_run(
+        [sys.executable, "-c", _CAT, str(source)],
+        target=target,
+        compression="gzip",
+        on_progress=lambda read, written: progress.append((read, written)),
+    )
+
+    assert gzip.decompress(target.read_bytes()) == SQL
+    assert read_size == len(SQL)
+    assert written_size == target.stat().st_size < len(SQL)
+    assert progress[-1] == (read_size, written_size)
+    assert set(tmp_path.iterdir()) == {source, target}
+
+
+@pytest.mark.parametrize("name", ["dump.sql", "dump.sql.gz", "dump.sql.zip"])
+def test_db_dump_restore_streams_archive_to_stdin(tmp_path: Path, name: str) -> None:
+    import zipfile
+
+    from wexample_wex_addon_app.helper.db_dump import db_dump_restore
+
+    source = tmp_path / name
+    if name.endswith(".gz"):
+        source.write_bytes(gzip.compress(SQL))
+    elif name.endswith(".zip"):
+        with zipfile.ZipFile(source, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("dump.sql", SQL)
+    else:
+        source.write_bytes(SQL)
+    received = tmp_path / "received.sql"
+    progress = []
+
+    sent = db_dump_restore(
+        [sys.executable, "-c", _TEE, str(received)],
+        source=source,
+        on_progress=lambda *values: progress.append(values),
+    )
+
+    assert sent == len(SQL)
+    assert received.read_bytes() == SQL
+    assert progress[-1] == (len(SQL), source.stat().st_size, source.stat().st_size)
+
+
+def test_db_dump_restore_failure_reports_stderr(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_restore
+
+    source = tmp_path / "dump.sql"
+    source.write_bytes(SQL)
+
+    with pytest.raises(RuntimeError, match="denied"):
+        db_dump_restore(
+            [sys.executable, "-c", _FAIL.format(message="denied")], source=source
+        )
+
+
+def test_db_dump_run_failure_leaves_no_file(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_run
+
+    target = tmp_path / "dump.sql.gz"
+
+    with pytest.raises(RuntimeError, match="boom"):
+        db_dump_run(
+            [sys.executable, "-c", _FAIL.format(message="boom")],
+            target=target,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_db_dump_stream_zip_keeps_sql_entry_name(tmp_path: Path) -> None:
+    import zipfile
+
+    from wexample_wex_addon_app.helper.db_dump import db_dump_restore, db_dump_stream
+
+    target = tmp_path / "local-app.sql.zip"
+    received = tmp_path / "received.sql"
+
+    db_dump_stream(io.BytesIO(SQL), target=target, compression="zip")
+
+    with zipfile.ZipFile(target) as archive:
+        assert archive.namelist() == ["local-app.sql"]
+        assert archive.read("local-app.sql") == SQL
+
+    db_dump_restore([sys.executable, "-c", _TEE, str(received)], source=target)
+
+    assert received.read_bytes() == SQL
+
+
+@pytest.mark.skipif(shutil.which("zstd") is None, reason="zstd not installed")
+def test_db_dump_stream_zstd(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.db_dump import db_dump_restore, db_dump_stream
+
+    target = tmp_path / "dump.sql.zst"
+    received = tmp_path / "received.sql"
+
+    db_dump_stream(io.BytesIO(SQL), target=target, compression="zstd")
+
+    assert subprocess.run(
+        ["zstd", "-d", "-c", str(target)], capture_output=True, check=True
+    ).stdout == SQL
+
+    db_dump_restore([sys.executable, "-c", _TEE, str(received)], source=target)
+
+    assert received.read_bytes() == SQL
+
+
+def test_db_restore_gz_without_restore_command(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.app_addon_manager import AppAddonManager
+    from wexample_wex_addon_app.commands.db.restore import app__db__restore
+
+    dumps_dir = tmp_path / "dumps"
+    dumps_dir.mkdir()
+    (dumps_dir / "local-app.sql.gz").write_bytes(gzip.compress(SQL))
+    restored: list[bytes] = []
+
+    class _Request:
+        def __init__(self, kernel, name: str, arguments: dict) -> None:
+            self.name = name
+            self.arguments = arguments
+
+    class _Kernel:
+        def _get_command_request_class(self) -> type:
+            return _Request
+
+        def execute_kernel_command(self, request: _Request) -> None:
+            if request.name.endswith("::db/restore"):
+                restored.append(
+                    (dumps_dir / request.arguments["file_name"]).read_bytes()
+                )
+
+    class _Service:
+        def get_db_restore_command(self, database: str) -> None:
+            return None
+
+    class _Manager:
+        def get_app_service(self, service_name: str, app_workdir) -> _Service:
+            return _Service()
+
+    class _Workdir:
+        def get_db_dumps_dir(self, service_name: str) -> Path:
+            return dumps_dir
+
+        def get_db_name(self, service_name: str) -> str:
+            return "app"
+
+        def get_main_db_service(self) -> str:
+            return "mysql"
+
+        def get_path(self) -> Path:
+            return tmp_path
+
+    class _Io:
+        def log(self, message: str) -> None:
+            pass
+
+    class _Context:
+        io = _Io()
+        kernel = _Kernel()
+
+    monkeypatch.setattr(
+        AppAddonManager, "from_kernel", classmethod(lambda cls, kernel: _Manager())
+    )
+    monkeypatch.setattr(
+        "wexample_app.response.success_response.SuccessResponse",
+        lambda kernel, message: message,
+    )
+
+    assert (
+        app__db__restore.function(
+            context=_Context(), app_workdir=_Workdir(), file_path="local-app.sql.gz"
+        )
+        == "Restoration complete"
+    )
+    assert restored == [SQL]
+    assert [path.name for path in dumps_dir.iterdir()] == ["local-app.sql.gz"]
+
+
+_CAT = (
+    "import shutil, sys; "
+    "shutil.copyfileobj(open(sys.argv[1], 'rb'), sys.stdout.buffer)"
+)
+_FAIL = "import sys; sys.stderr.write('{message}'); sys.exit(1)"
+_TEE = (
+    "import shutil, sys; "
+    "shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], 'wb'))"
+)
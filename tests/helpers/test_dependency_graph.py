@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+
+def test_dependency_graph_closure_includes_transitive_dependencies() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import (
+        dependency_graph_closure,
+    )
+
+    closures = dependency_graph_closure(
+        {"a": ["b"], "b": ["c", "external"], "c": [], "d": []}
+    )
+
+    assert closures == {
+        "a": {"a", "b", "c"},
+        "b": {"b", "c"},
+        "c": {"c"},
+        "d": {"d"},
+    }
+
+
+def test_dependency_graph_reverse_lists_direct_dependents() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import (
+        dependency_graph_reverse,
+    )
+
+    dependents = dependency_graph_reverse(
+        {"a": ["b", "c"], "b": ["c", "external"], "c": [], "d": ["c", "c"]}
+    )
+
+    assert dependents == {"a": [], "b": ["a"], "c": ["a", "b", "d"], "d": []}
+
+
+def test_dependency_graph_run_collects_failures_without_fail_fast() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    def _fn(node: str) -> str:
+        if node == "a":
+            raise RuntimeError("boom")
+        return node
+
+    failures = dependency_graph_run(
+        {"a": [], "b": ["a"], "c": []}, _fn, max_workers=2, fail_fast=False
+    )
+
+    assert list(failures) == ["a"]
+    assert str(failures["a"]) == "boom"
+
+
+def test_dependency_graph_run_ignores_unknown_dependencies() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    done: list[str] = []
+    dependency_graph_run(
+        {"a": ["external"]}, lambda n: n, on_done=lambda n, r, e: done.append(n)
+    )
+
+    assert done == ["a"]
+
+
+def test_dependency_graph_run_raises_on_cycle() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    with pytest.raises(ValueError):
+        dependency_graph_run({"a": ["b"], "b": ["a"]}, lambda n: n)
+
+
+def test_dependency_graph_run_runs_independent_nodes_concurrently() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    failures = dependency_graph_run(
+        {"a": [], "b": []}, lambda n: barrier.wait(), max_workers=2
+    )
+
+    assert failures == {}
+
+
+def test_dependency_graph_run_starts_nodes_after_dependencies() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    done: list[str] = []
+    dependency_graph_run(
+        {"app": ["mid"], "mid": ["base"], "base": []},
+        lambda n: n,
+        max_workers=4,
+        on_done=lambda n, r, e: done.append(r),
+    )
+
+    assert done == ["base", "mid", "app"]
+
+
+def test_dependency_graph_run_stops_scheduling_on_fail_fast() -> None:
+    from wexample_wex_addon_app.helper.dependency_graph import dependency_graph_run
+
+    started: list[str] = []
+
+    def _fn(node: str) -> None:
+        started.append(node)
+        raise RuntimeError(node)
+
+    failures = dependency_graph_run({"a": [], "b": ["a"]}, _fn, fail_fast=True)
+
+    assert started == ["a"]
+    assert list(failures) == ["a"]
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import socketserver
+import subprocess
+import tarfile
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def test_docker_list_image_tags_skips_untagged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_list_image_tags
+
+    _use_cli(monkeypatch)
+    stdout = "app:latest\n<none>:<none>\nbase:1.0\n"
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: _Result(0, stdout))
+
+    assert docker_list_image_tags() == {"app:latest", "base:1.0"}
+
+
+def test_docker_list_running_containers_empty_when_docker_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_list_running_containers
+
+    _use_cli(monkeypatch)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: _Result(1))
+
+    assert docker_list_running_containers() == []
+
+
+def test_docker_list_running_containers_parses_projects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_list_running_containers
+
+    _use_cli(monkeypatch)
+    stdout = "demo_local_web\tdemo_local\nstandalone\t\n"
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: _Result(0, stdout))
+
+    assert docker_list_running_containers() == [
+        {"name": "demo_local_web", "project": "demo_local"},
+        {"name": "standalone", "project": ""},
+    ]
+
+
+
+def test_docker_container_events_streams_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_container_events
+
+    events: list[dict[str, str]] = []
+
+    with _FakeDockerDaemon(monkeypatch) as daemon:
+        assert docker_container_events(["demo_db"], 10.0, 11.5, events.append)
+
+    assert events == [{"name": "demo_db", "action": "health_status: healthy"}]
+    _, path, _ = daemon.requests[-1]
+    assert path.startswith("/events?since=10.000000000&until=11.500000000")
+
+
+def test_docker_container_events_without_engine_api(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_container_events
+
+    _use_cli(monkeypatch)
+
+    assert not docker_container_events(["demo_db"], 0.0, 1.0, print)
+
+
+def test_docker_copy_to_container_puts_archive_in_parent_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_copy_to_container
+
+    source = tmp_path / "dump.sql"
+    source.write_text("SELECT 1;")
+
+    with _FakeDockerDaemon(monkeypatch) as daemon:
+        docker_copy_to_container("demo_db", source, "/tmp/restore.sql")
+
+    method, path, body = daemon.requests[-1]
+    assert (method, path) == ("PUT", "/containers/demo_db/archive?path=%2Ftmp")
+    with tarfile.open(fileobj=io.BytesIO(body)) as archive:
+        assert archive.getnames() == ["restore.sql"]
+
+
+def test_docker_exec_demultiplexes_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_exec
+
+    with _FakeDockerDaemon(monkeypatch, exec_output=(0, "hello\n", "warn\n")):
+        assert docker_exec("demo_web", ["echo", "hello"]) == "hello\n"
+
+
+def test_docker_exec_raises_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_exec
+
+    with _FakeDockerDaemon(monkeypatch, exec_output=(2, "", "boom\n")):
+        with pytest.raises(RuntimeError, match="exit 2"):
+            docker_exec("demo_web", ["false"])
+
+
+def test_docker_exec_waits_for_stalled_exec_without_cli_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_engine_client, docker_exec
+
+    _forbid_cli_exec(monkeypatch)
+    with _FakeDockerDaemon(
+        monkeypatch, exec_output=(0, "done\n", ""), exec_stall=0.5
+    ) as daemon:
+        docker_engine_client().timeout = 0.1
+
+        assert docker_exec("demo_web", ["sleep", "1"]) == "done\n"
+
+    starts = [r for r in daemon.requests if r[1] == "/exec/abc/start"]
+    assert len(starts) == 1
+
+
+def test_docker_exec_lost_after_start_raises_without_cli_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_exec
+
+    _forbid_cli_exec(monkeypatch)
+    with _FakeDockerDaemon(monkeypatch, exec_drop=True) as daemon:
+        with pytest.raises(RuntimeError, match="lost the exec"):
+            docker_exec("demo_web", ["touch", "/tmp/once"])
+
+    starts = [r for r in daemon.requests if r[1] == "/exec/abc/start"]
+    assert len(starts) == 1
+
+
+def test_docker_image_id_none_when_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_image_id
+
+    _use_cli(monkeypatch)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: _Result(1))
+
+    assert docker_image_id("missing:latest") is None
+
+
+def test_docker_image_id_reads_cli_digest(monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_image_id
+
+    _use_cli(monkeypatch)
+    monkeypatch.setattr(
+        subprocess, "run", lambda *a, **k: _Result(0, "sha256:abc\n")
+    )
+
+    assert docker_image_id("app:latest") == "sha256:abc"
+
+
+def test_docker_inspect_containers_reuses_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_inspect_containers
+
+    names = ["demo_web", "missing", "demo_db"]
+    with _FakeDockerDaemon(monkeypatch) as daemon:
+        inspected = docker_inspect_containers(names)
+        docker_inspect_containers(names)
+
+    assert sorted(inspected) == ["demo_db", "demo_web"]
+    assert inspected["demo_web"]["State"]["Status"] == "running"
+    # Six requests, never more connections than concurrent requests.
+    assert daemon.connections <= len(names)
+
+
+def test_docker_list_containers_falls_back_to_cli(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_list_containers
+
+    # A socket path nobody listens on: the API fails, the CLI answers.
+    socket_path = tmp_path / "docker.sock"
+    socket_path.touch()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    stdout = "demo_web\tdemo/web:1.0\trunning\n"
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: _Result(0, stdout))
+
+    assert docker_list_containers(include_stopped=True) == [
+        {"name": "demo_web", "image": "demo/web:1.0", "state": "running"}
+    ]
+
+
+def test_docker_list_running_containers_uses_engine_api(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.helper.docker import docker_list_running_containers
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The docker CLI should not run")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+
+    with _FakeDockerDaemon(monkeypatch):
+        assert docker_list_running_containers() == [
+            {"name": "demo_web", "project": "demo_local"},
+            {"name": "standalone", "project": ""},
+        ]
+
+
+class _FakeDockerDaemon:
+    """Serve a few Engine API endpoints on a unix socket, pointed by DOCKER_HOST."""
+
+    def __init__(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        exec_output: tuple[int, str, str] = (0, "", ""),
+        exec_stall: float = 0,
+        exec_drop: bool = False,
+    ) -> None:
+        self.connections = 0
+        self.requests: list[tuple[str, str, bytes]] = []
+        self._directory = tempfile.mkdtemp(prefix="docker")
+        self._exec_drop = exec_drop
+        self._exec_output = exec_output
+        self._exec_stall = exec_stall
+        self._monkeypatch = monkeypatch
+        self._socket_path = os.path.join(self._directory, "docker.sock")
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                fake.connections += 1
+
+            def do_DELETE(self) -> None:
+                fake._handle(self)
+
+            def do_GET(self) -> None:
+                fake._handle(self)
+
+            def do_HEAD(self) -> None:
+                fake._handle(self)
+
+            def do_POST(self) -> None:
+                fake._handle(self)
+
+            def do_PUT(self) -> None:
+                fake._handle(self)
+
+            def address_string(self) -> str:
+                return "docker"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = socketserver.ThreadingUnixStreamServer(
+            self._socket_path, Handler
+        )
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    def __enter__(self) -> _FakeDockerDaemon:
+        self._monkeypatch.setenv("DOCKER_HOST", f"unix://{self._socket_path}")
+        self._monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        from wexample_wex_addon_app.helper.docker import _ENGINE_CLIENTS
+
+        client = _ENGINE_CLIENTS.pop(self._socket_path, None)
+        if client is not None:
+            client.close()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        length = int(request.headers.get("Content-Length") or 0)
+        body = request.rfile.read(length) if length else b""
+        self.requests.append((request.command, request.path, body))
+        path = request.path.split("?")[0]
+
+        if path == "/containers/json":
+            self._send_json(
+                request,
+                200,
+                [
+                    {
+                        "Names": ["/demo_web", "/other/web"],
+                        "Labels": {"com.docker.compose.project": "demo_local"},
+                    },
+                    {"Names": ["/standalone"], "Labels": {}},
+                ],
+            )
+        elif path in ("/containers/demo_web/json", "/containers/demo_db/json"):
+            name = path.split("/")[2]
+            self._send_json(
+                request, 200, {"Name": f"/{name}", "State": {"Status": "running"}}
+            )
+        elif path == "/events":
+            event = {
+                "Type": "container",
+                "Action": "health_status: healthy",
+                "Actor": {"Attributes": {"name": "demo_db"}},
+            }
+            chunk = json.dumps(event).encode() + b"\n"
+            request.send_response(200)
+            request.send_header("Content-Type", "application/json")
+            request.send_header("Transfer-Encoding", "chunked")
+            request.end_headers()
+            request.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(chunk), chunk))
+        elif path.endswith("/exec") and request.command == "POST":
+            self._send_json(request, 201, {"Id": "abc"})
+        elif path == "/exec/abc/start":
+            # Stands for a long command, answered once it ends.
+            time.sleep(self._exec_stall)
+            if self._exec_drop:
+                request.close_connection = True
+                return
+            # The daemon hijacks the connection: no length, closed at the end.
+            exit_code, stdout, stderr = self._exec_output
+            stream = b""
+            for kind, text in ((1, stdout), (2, stderr)):
+                if text:
+                    data = text.encode()
+                    stream += bytes([kind, 0, 0, 0]) + len(data).to_bytes(4, "big")
+                    stream += data
+            request.send_response(200)
+            request.send_header("Content-Type", "application/vnd.docker.raw-stream")
+            request.end_headers()
+            request.wfile.write(stream)
+            request.close_connection = True
+        elif path == "/exec/abc/json":
+            self._send_json(request, 200, {"ExitCode": self._exec_output[0]})
+        elif path.endswith("/archive") and request.command == "PUT":
+            self._send_json(request, 200, None)
+        else:
+            self._send_json(request, 404, {"message": "No such object"})
+
+    def _send_json(
+        self, request: BaseHTTPRequestHandler, status: int, payload: Any
+    ) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        if request.command != "HEAD":
+            request.wfile.write(body)
+
+
+class _Result:
+    def __init__(self, returncode: int, stdout: str = "") -> None:
+        self.returncode = returncode
+        self.stdout = stdout
+
+
+
+def _forbid_cli_exec(monkeypatch: pytest.MonkeyPatch) -> None:
+    import wexample_helpers.helper.docker
+
+    def docker_exec_cli(*args, **kwargs):
+        raise AssertionError("the command must not run again through the CLI")
+
+    monkeypatch.setattr(wexample_helpers.helper.docker, "docker_exec", docker_exec_cli)
+
+
+def _use_cli(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DOCKER_HOST", "unix:///nonexistent/docker.sock")
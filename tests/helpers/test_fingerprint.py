@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def test_fingerprint_digest_ignores_metadata_only_changes(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.fingerprint import (
+        fingerprint_digest,
+        fingerprint_files,
+    )
+
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1\n")
+    before = fingerprint_digest(fingerprint_files([path]))
+
+    os.utime(path, ns=(1, 1))
+
+    assert fingerprint_digest(fingerprint_files([path])) == before
+
+
+def test_fingerprint_digest_changes_with_content(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.fingerprint import (
+        fingerprint_digest,
+        fingerprint_files,
+    )
+
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1\n")
+    before = fingerprint_digest(fingerprints=fingerprint_files([path]))
+
+    path.write_text("a: 2\n")
+
+    assert fingerprint_digest(fingerprint_files([path])) != before
+
+
+def test_fingerprint_digest_mixes_extra_values(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.fingerprint import fingerprint_digest
+
+    assert fingerprint_digest({}, "local") != fingerprint_digest({}, "prod")
+
+
+def test_fingerprint_file_returns_none_when_missing(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.fingerprint import fingerprint_file
+
+    assert fingerprint_file(tmp_path / "missing.yml") is None
+
+
+def test_fingerprint_file_reuses_previous_hash_when_metadata_matches(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_app.helper.fingerprint import fingerprint_file
+
+    path = tmp_path / "config.yml"
+    path.write_text("a: 1\n")
+    previous = dict(fingerprint_file(path), sha256="cached")
+
+    assert fingerprint_file(path, previous=previous)["sha256"] == "cached"
@@ -6,6 +6,72 @@ import pytest
 from wexample_app.const.globals import APP_FILE_APP_CONFIG, WORKDIR_SETUP_DIR
 
 
+def test_build_command_keeps_no_cache_by_default(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.image_builds import build_command
+
+    build = {"dockerfile": "Dockerfile", "tag": "app", "build_args": {"A": "1"}}
+
+    assert build_command(tmp_path, build) == [
+        "docker",
+        "build",
+        "--no-cache",
+        "-f",
+        str(tmp_path / "Dockerfile"),
+        "-t",
+        "app",
+        "--build-arg",
+        "A=1",
+        str(tmp_path),
+    ]
+    assert "--no-cache" not in build_command(tmp_path, build, no_cache=False)
+
+
+def test_build_context_files_honours_dockerignore(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.image_builds import build_context_files
+
+    for rel in (
+        "Dockerfile",
+        "src/app.py",
+        "node_modules/lib/index.js",
+        "logs/debug.log",
+        "logs/keep.log",
+        ".wex/tmp/image.build.cache.json",
+    ):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(rel)
+    (tmp_path / ".dockerignore").write_text(
+        "# deps\nnode_modules\n**/*.log\n!logs/keep.log\n"
+    )
+
+    files = {
+        path.relative_to(tmp_path).as_posix()
+        for path in build_context_files(tmp_path)
+    }
+
+    assert files == {".dockerignore", "Dockerfile", "src/app.py", "logs/keep.log"}
+
+
+def test_build_inputs_change_with_build_args(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.image_builds import build_inputs
+
+    (tmp_path / "Dockerfile").write_text("FROM scratch\n")
+    build = {"dockerfile": "Dockerfile", "tag": "app"}
+
+    files, extra = build_inputs(tmp_path, build)
+    _, other_extra = build_inputs(tmp_path, {**build, "build_args": {"A": "1"}})
+
+    assert files == [tmp_path / "Dockerfile"]
+    assert extra != other_extra
+
+
+def test_build_tag_reference_defaults_to_latest() -> None:
+    from wexample_wex_addon_app.helper.image_builds import build_tag_reference
+
+    assert build_tag_reference("app") == "app:latest"
+    assert build_tag_reference("registry:5000/app") == "registry:5000/app:latest"
+    assert build_tag_reference("app:1.2") == "app:1.2"
+
+
 def test_collect_deps_gathers_transitive_chain() -> None:
     from wexample_wex_addon_app.helper.image_builds import _collect_deps
 
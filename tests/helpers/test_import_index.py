@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_import_index_locations_matches_longest_root() -> None:
+    from wexample_wex_addon_app.helper.import_index import import_index_locations
+
+    index = {
+        "/b.py": {"imports": [["wexample_helpers_git.helper.git", 3, 1]]},
+        "/a.py": {
+            "imports": [
+                ["wexample_helpers.helper.file", 1, 1],
+                ["wexample_helpers_extra", 2, 1],
+                ["os", 3, 1],
+            ]
+        },
+    }
+
+    locations = import_index_locations(
+        index,
+        {"wexample_helpers": "helpers", "wexample_helpers_git": "helpers-git"},
+    )
+
+    assert locations == {"helpers": ["/a.py:1:1"], "helpers-git": ["/b.py:3:1"]}
+
+
+def test_import_index_parse_python_skips_relative_imports(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.import_index import import_index_parse_python
+
+    source = tmp_path / "module.py"
+    source.write_text(
+        "import os, json\n"
+        "from . import sibling\n"
+        "\n"
+        "def f():\n"
+        "    from wexample_helpers.helper.file import file_read\n"
+    )
+
+    assert import_index_parse_python(source) == [
+        ("json", 1, 1),
+        ("os", 1, 1),
+        ("wexample_helpers.helper.file", 5, 5),
+    ]
+
+
+def test_import_index_parse_python_ignores_invalid_files(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.import_index import import_index_parse_python
+
+    source = tmp_path / "broken.py"
+    source.write_text("def (:\n")
+
+    assert import_index_parse_python(source) == []
+
+
+def test_import_index_update_only_parses_changed_files(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.import_index import (
+        import_index_parse_python,
+        import_index_update,
+    )
+
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text("import os\n")
+    second.write_text("import json\n")
+    parsed: list[Path] = []
+
+    def _parse(path: Path):
+        parsed.append(path)
+        return import_index_parse_python(path)
+
+    index = import_index_update([first, second], parse=_parse)
+    assert parsed == [first, second]
+
+    parsed.clear()
+    second.write_text("import sys\n")
+    index = import_index_update([first, second], parse=_parse, previous=index)
+
+    assert parsed == [second]
+    assert index[str(first)]["imports"] == [["os", 1, 1]]
+    assert index[str(second)]["imports"] == [["sys", 1, 1]]
+
+
+def test_import_index_update_drops_missing_files(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.import_index import (
+        import_index_parse_python,
+        import_index_update,
+    )
+
+    kept = tmp_path / "kept.py"
+    kept.write_text("import os\n")
+    previous = import_index_update(
+        [kept, tmp_path / "gone.py"], parse=import_index_parse_python
+    )
+    previous[str(tmp_path / "removed.py")] = {"imports": [["json", 1, 1]]}
+
+    index = import_index_update(
+        [kept], parse=import_index_parse_python, previous=previous
+    )
+
+    assert list(index) == [str(kept)]
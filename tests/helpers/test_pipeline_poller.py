@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+
+def test_pipeline_poller_poll_multiplexes_pipelines_on_pooled_connections() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer(
+        {
+            "/api/v4/projects/group%2Frepo/pipelines/1": ["running", "success"],
+            "/api/v4/projects/group%2Frepo/pipelines/2": [
+                "pending",
+                "running",
+                "failed",
+            ],
+        }
+    )
+    progress: list[dict[str, Any]] = []
+
+    with server:
+        payloads = pipeline_poller_poll(
+            base_url=f"{server.url}/api/v4",
+            targets={
+                "1": "projects/group%2Frepo/pipelines/1",
+                "2": "projects/group%2Frepo/pipelines/2",
+            },
+            is_done=lambda key, payload: payload["status"]
+            in {"success", "failed"},
+            headers={"PRIVATE-TOKEN": "secret"},
+            interval=0.01,
+            max_interval=0.02,
+            pool_size=2,
+            on_progress=lambda payloads, elapsed: progress.append(payloads),
+        )
+
+    assert payloads["1"]["status"] == "success"
+    assert payloads["2"]["status"] == "failed"
+    assert progress[0]["1"]["status"] == "running"
+    assert progress[-1] == payloads
+    assert len(server.connections) <= 2
+    assert all(token == "secret" for token in server.tokens)
+
+
+def test_pipeline_poller_poll_reuses_etags() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer(
+        {"/repos/owner/repo/actions/runs/7": ["queued"] * 3 + ["completed"]}
+    )
+
+    with server:
+        payloads = pipeline_poller_poll(
+            base_url=server.url,
+            targets={"7": "repos/owner/repo/actions/runs/7"},
+            is_done=lambda key, payload: payload["status"] == "completed",
+            interval=0.01,
+            max_interval=0.02,
+        )
+
+    assert payloads["7"]["status"] == "completed"
+    assert server.not_modified == 2
+    assert len(server.connections) == 1
+
+
+def test_pipeline_poller_poll_retries_failed_requests() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer({"/pipelines/3": ["success"]}, failures=2)
+
+    with server:
+        payloads = pipeline_poller_poll(
+            base_url=server.url,
+            targets={"3": "pipelines/3"},
+            is_done=lambda key, payload: payload["status"] == "success",
+            interval=0.01,
+            max_interval=0.02,
+        )
+
+    assert payloads["3"]["status"] == "success"
+
+
+def test_pipeline_poller_poll_times_out() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer({"/pipelines/4": ["running"]})
+
+    with server, pytest.raises(TimeoutError, match="4"):
+        pipeline_poller_poll(
+            base_url=server.url,
+            targets={"4": "pipelines/4"},
+            is_done=lambda key, payload: payload["status"] == "success",
+            timeout=0.1,
+            interval=0.01,
+            max_interval=0.02,
+        )
+
+
+def test_pipeline_poller_poll_decodes_gzip_bodies() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer({"/pipelines/5": ["success"]}, compress=True)
+
+    with server:
+        payloads = pipeline_poller_poll(
+            base_url=server.url,
+            targets={"5": "pipelines/5"},
+            is_done=lambda key, payload: payload["status"] == "success",
+            interval=0.01,
+            max_interval=0.02,
+        )
+
+    assert payloads["5"]["status"] == "success"
+
+
+def test_pipeline_poller_poll_fails_fast_on_client_errors() -> None:
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer({})
+
+    with server, pytest.raises(PipelinePollException) as error:
+        pipeline_poller_poll(
+            base_url=server.url,
+            targets={"6": "pipelines/6"},
+            is_done=lambda key, payload: True,
+            timeout=30,
+            interval=0.01,
+        )
+
+    assert error.value.status == 404
+    assert not error.value.is_redirect()
+    assert server.requests == 1
+
+
+def test_pipeline_poller_poll_stops_on_redirects() -> None:
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    server = _FakeCiServer({}, redirects={"/pipelines/8": "/api/v5/pipelines/8"})
+
+    with server, pytest.raises(PipelinePollException) as error:
+        pipeline_poller_poll(
+            base_url=server.url,
+            targets={"8": "pipelines/8"},
+            is_done=lambda key, payload: True,
+            timeout=30,
+            interval=0.01,
+        )
+
+    assert error.value.is_redirect()
+
+
+def test_pipeline_poller_poll_times_out_on_stalled_server() -> None:
+    import time
+
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    # Accepts connections, never answers.
+    with _RawServer(lambda request: None) as server:
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="9"):
+            pipeline_poller_poll(
+                base_url=server.url,
+                targets={"9": "pipelines/9"},
+                is_done=lambda key, payload: True,
+                timeout=0.3,
+                interval=0.01,
+            )
+
+    assert time.monotonic() - started < 2
+
+
+def test_pipeline_poller_poll_skips_interim_responses() -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import pipeline_poller_poll
+
+    body = b'{"status": "success"}'
+    response = (
+        b"HTTP/1.1 103 Early Hints\r\nLink: </style.css>\r\n\r\n"
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+
+    requests: list[bytes] = []
+
+    def respond(request: bytes) -> bytes:
+        requests.append(request)
+        return response
+
+    with _RawServer(respond) as server:
+        payloads = pipeline_poller_poll(
+            base_url=server.url,
+            targets={"10": "pipelines/10"},
+            is_done=lambda key, payload: payload["status"] == "success",
+            timeout=5,
+            interval=0.01,
+        )
+
+    assert payloads["10"]["status"] == "success"
+    # The final response answered the first request.
+    assert len(requests) == 1
+
+
+def test_pipeline_poller_fetch_round_reaches_several_servers() -> None:
+    import asyncio
+
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+    from wexample_wex_addon_app.helper.pipeline_poller import (
+        pipeline_poller_close,
+        pipeline_poller_fetch_round,
+    )
+
+    gitlab = _FakeCiServer({"/api/v4/pipelines/1": ["running"]})
+    github = _FakeCiServer({"/runs/2": ["completed"]})
+
+    async def rounds() -> list:
+        pools: dict = {}
+        etags: dict = {}
+        targets = {
+            "1": (f"{gitlab.url}/api/v4", "pipelines/1", {}),
+            "2": (github.url, "runs/2", {}),
+            "3": (github.url, "runs/3", {}),
+        }
+        try:
+            return [
+                await pipeline_poller_fetch_round(pools, targets, etags),
+                await pipeline_poller_fetch_round(pools, targets, etags),
+            ]
+        finally:
+            await pipeline_poller_close(pools)
+
+    with gitlab, github:
+        (first, _), (second, _) = asyncio.run(rounds())
+
+    assert first["1"] == {"status": "running"}
+    assert first["2"] == {"status": "completed"}
+    assert isinstance(first["3"], PipelinePollException)
+    # Unchanged resources come back as 304.
+    assert second["1"] is None and second["2"] is None
+    assert len(gitlab.connections) == 1
+
+
+def test_pipeline_poller_is_reachable(monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.helper.pipeline_poller import (
+        pipeline_poller_is_reachable,
+    )
+
+    for name in ("http_proxy", "https_proxy", "no_proxy", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+    assert pipeline_poller_is_reachable("https://gitlab.example.com/api/v4")
+    assert not pipeline_poller_is_reachable("ftp://gitlab.example.com")
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+    assert not pipeline_poller_is_reachable("https://gitlab.example.com/api/v4")
+    assert pipeline_poller_is_reachable("https://internal.example.com/api/v4")
+    assert pipeline_poller_is_reachable("http://gitlab.example.com/api/v4")
+
+
+class _FakeCiServer:
+    """Serve each path a sequence of pipeline statuses, one step per request.
+
+    The last status repeats. Responses carry an ETag of the status, answered
+    by a 304 when the client sends it back.
+    """
+
+    def __init__(
+        self,
+        statuses: dict[str, list[str]],
+        failures: int = 0,
+        compress: bool = False,
+        redirects: dict[str, str] | None = None,
+    ) -> None:
+        self.connections: set[tuple] = set()
+        self.not_modified = 0
+        self.requests = 0
+        self.tokens: list[str | None] = []
+        self._compress = compress
+        self._failures = failures
+        self._redirects = redirects or {}
+        self._lock = threading.Lock()
+        self._statuses = statuses
+        self._steps = dict.fromkeys(statuses, 0)
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                fake._handle(self)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    def __enter__(self) -> _FakeCiServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests += 1
+            self.connections.add(request.client_address)
+            self.tokens.append(request.headers.get("PRIVATE-TOKEN"))
+            failing = self._failures > 0
+            self._failures -= 1
+            statuses = self._statuses.get(request.path)
+            if statuses is not None and not failing:
+                step = self._steps[request.path]
+                self._steps[request.path] = step + 1
+                status = statuses[min(step, len(statuses) - 1)]
+
+        if failing:
+            request.send_response(503)
+            request.send_header("Retry-After", "0")
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+        if request.path in self._redirects:
+            request.send_response(301)
+            request.send_header("Location", self._redirects[request.path])
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+        if statuses is None:
+            request.send_response(404)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        etag = f'W/"{status}"'
+        if request.headers.get("If-None-Match") == etag:
+            with self._lock:
+                self.not_modified += 1
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.end_headers()
+            return
+
+        body = json.dumps({"status": status}).encode()
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        if self._compress:
+            body = gzip.compress(body)
+            request.send_header("Content-Encoding", "gzip")
+        request.send_header("Content-Length", str(len(body)))
+        request.send_header("ETag", etag)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+class _RawServer:
+    """Answer each HTTP request with the bytes `respond` returns for it.
+
+    None leaves the request unanswered, with the connection open.
+    """
+
+    def __init__(self, respond) -> None:
+        import socket
+
+        self._respond = respond
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._connections: list = []
+
+    def __enter__(self) -> _RawServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._listener.close()
+        for connection in self._connections:
+            connection.close()
+
+    @property
+    def url(self) -> str:
+        host, port = self._listener.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def _handle(self, connection) -> None:
+        data = b""
+        while True:
+            try:
+                chunk = connection.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            data += chunk
+            while b"\r\n\r\n" in data:
+                request, data = data.split(b"\r\n\r\n", 1)
+                response = self._respond(request)
+                if response is not None:
+                    connection.sendall(response)
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            self._connections.append(connection)
+            threading.Thread(
+                target=self._handle, args=(connection,), daemon=True
+            ).start()
@@ -6,6 +6,167 @@ from pathlib import Path
 import pytest
 
 
+def test_get_editable_installs_reads_direct_url_and_egg_link(tmp_path: Path) -> None:
+    import json
+
+    from wexample_wex_addon_app.helper.python import (
+        python_get_editable_installs_in_venv,
+    )
+
+    site_packages = tmp_path / "lib" / "python3.12" / "site-packages"
+    project = tmp_path / "project"
+
+    editable = site_packages / "my_pkg-1.0.dist-info"
+    editable.mkdir(parents=True)
+    (editable / "METADATA").write_text("Metadata-Version: 2.1\nName: My.Pkg\n\n")
+    (editable / "direct_url.json").write_text(
+        json.dumps({"url": project.as_uri(), "dir_info": {"editable": True}})
+    )
+
+    regular = site_packages / "other-2.0.dist-info"
+    regular.mkdir()
+    (regular / "direct_url.json").write_text(
+        json.dumps({"url": project.as_uri(), "dir_info": {}})
+    )
+    (site_packages / "legacy_pkg.egg-link").write_text(f"{tmp_path / 'legacy'}\n.")
+
+    assert python_get_editable_installs_in_venv(tmp_path) == {
+        "my-pkg": project,
+        "legacy-pkg": tmp_path / "legacy",
+    }
+
+
+def test_get_editable_installs_empty_without_site_packages(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.helper.python import (
+        python_get_editable_installs_in_venv,
+    )
+
+    assert python_get_editable_installs_in_venv(tmp_path) == {}
+
+
+def test_install_dependencies_batch_runs_one_pip_call(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper import python as python_module
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        python_module, "shell_run", lambda cmd, **kwargs: calls.append(cmd)
+    )
+    monkeypatch.setattr(python_module.shutil, "which", lambda name: None)
+
+    python_module.python_install_dependencies_batch_in_venv(tmp_path, [], True)
+    python_module.python_install_dependencies_batch_in_venv(
+        tmp_path, ["a", "b"], editable=True
+    )
+
+    assert calls == [
+        [
+            f"{tmp_path}/bin/python",
+            "-m",
+            "pip",
+            "install",
+            "--no-cache-dir",
+            "-e",
+            "a",
+            "-e",
+            "b",
+        ]
+    ]
+
+
+def test_install_dependencies_go_through_uv_when_available(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper import python as python_module
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        python_module, "shell_run", lambda cmd, **kwargs: calls.append(cmd)
+    )
+    monkeypatch.setattr(python_module.shutil, "which", lambda name: "/bin/uv")
+
+    python_module.python_install_dependencies_batch_in_venv(
+        tmp_path, ["a"], editable=True
+    )
+    python_module.python_install_dependency_in_venv(tmp_path, "b")
+
+    # uv venvs are created without pip.
+    uv_install = ["/bin/uv", "pip", "install", "--python", f"{tmp_path}/bin/python"]
+    assert calls == [[*uv_install, "--no-cache", "-e", "a"], [*uv_install, "b"]]
+
+
+def test_install_environment_keeps_venv_while_requirements_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper import python as python_module
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(python_module, "shell_run", _fake_shell_run(calls))
+    monkeypatch.setattr(python_module.shutil, "which", lambda name: None)
+    monkeypatch.delenv(python_module.PYTHON_WHEELHOUSE_ENV_VAR, raising=False)
+    (tmp_path / "requirements.txt").write_text("-c constraints.txt\nrequests\n")
+    (tmp_path / "constraints.txt").write_text("requests==2.0\n")
+
+    python_module.python_install_environment(tmp_path)
+    installs = len(calls)
+    python_module.python_install_environment(tmp_path)
+    assert len(calls) == installs
+
+    (tmp_path / "constraints.txt").write_text("requests==3.0\n")
+    python_module.python_install_environment(tmp_path)
+    assert len(calls) == installs * 2
+
+    python_module.python_install_environment(tmp_path, force=True)
+    assert len(calls) == installs * 3
+
+
+def test_install_environment_installs_from_wheelhouse_offline_first(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper import python as python_module
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(python_module, "shell_run", _fake_shell_run(calls))
+    monkeypatch.setattr(python_module.shutil, "which", lambda name: None)
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    wheelhouse = tmp_path / "wheelhouse"
+
+    python_module.python_install_environment(tmp_path, wheelhouse=wheelhouse)
+
+    assert wheelhouse.is_dir()
+    assert calls[-1][3:6] == ["install", "--no-index", "--find-links"]
+    assert not any("--wheel-dir" in call for call in calls)
+
+
+def test_install_environment_fills_wheelhouse_on_miss(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from wexample_wex_addon_app.helper import python as python_module
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        python_module, "shell_run", _fake_shell_run(calls, offline_misses=1)
+    )
+    monkeypatch.setattr(python_module.shutil, "which", lambda name: None)
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    wheelhouse = tmp_path / "wheelhouse"
+
+    python_module.python_install_environment(tmp_path, wheelhouse=wheelhouse)
+
+    offline = calls[-1]
+    assert offline[3:6] == ["install", "--no-index", "--find-links"]
+    assert calls[-3:] == [offline, calls[-2], offline]
+    # Built aside, then moved in: nothing is left of the build directory.
+    build_path = Path(calls[-2][calls[-2].index("--wheel-dir") + 1])
+    assert build_path.parent == wheelhouse
+    assert not build_path.exists()
+    assert sorted(path.name for path in wheelhouse.iterdir()) == [
+        ".lock",
+        "requests-1.0-py3-none-any.whl",
+    ]
+
+
 def test_install_dependencies_calls_per_name(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -103,6 +264,25 @@ def test_is_package_installed_editable_true_when_paths_match(
     )
 
 
+def _fake_shell_run(calls: list[list[str]], offline_misses: int = 0):
+    misses = [offline_misses]
+
+    def _shell_run(cmd: list[str], cwd: Path, **kwargs) -> _Result:
+        calls.append(cmd)
+        if "venv" in cmd:
+            (cwd / ".venv" / "bin").mkdir(parents=True)
+            (cwd / ".venv" / "bin" / "python").touch()
+        if "--wheel-dir" in cmd:
+            wheel_dir = Path(cmd[cmd.index("--wheel-dir") + 1])
+            (wheel_dir / "requests-1.0-py3-none-any.whl").touch()
+        if "--no-index" in cmd and misses[0]:
+            misses[0] -= 1
+            return _Result(1)
+        return _Result(0)
+
+    return _shell_run
+
+
 class _Result:
     def __init__(self, returncode: int, stdout: str = "") -> None:
         self.returncode = returncode
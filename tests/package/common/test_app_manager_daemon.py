@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+def test_app_manager_daemon_runs_requests_with_client_stdio(tmp_path: Path) -> None:
+    from wexample_helpers.exception.shell_command_failed_exception import (
+        ShellCommandFailedException,
+    )
+
+    def run_argv(argv: list[str]) -> int:
+        os.write(1, f"out {' '.join(argv)} in {os.getcwd()}".encode())
+        os.write(2, f"err {os.environ.get('DAEMON_TEST_VAR')}".encode())
+        return 3 if argv == ["fail"] else 0
+
+    daemon, thread = _serve(tmp_path, run_argv)
+    workdir = tmp_path / "sub"
+    workdir.mkdir()
+    os.environ["DAEMON_TEST_VAR"] = "from-client"
+    try:
+        result = daemon.request(["app::info", "--x"], cwd=workdir, inherit_stdio=False)
+        overridden = daemon.request(
+            ["env"], inherit_stdio=False, env={"DAEMON_TEST_VAR": "from-request"}
+        )
+        with pytest.raises(ShellCommandFailedException) as failure:
+            daemon.request(["fail"], inherit_stdio=False)
+    finally:
+        del os.environ["DAEMON_TEST_VAR"]
+        daemon.stop()
+        thread.join(timeout=5)
+
+    assert result.returncode == 0
+    assert result.stdout == f"out app::info --x in {workdir}"
+    assert result.stderr == "err from-client"
+    assert overridden.stderr == "err from-request"
+    assert failure.value.returncode == 3
+    assert failure.value.stdout == f"out fail in {tmp_path}"
+    assert not thread.is_alive()
+    assert not daemon.is_enabled()
+
+
+def test_app_manager_daemon_socket_and_lock_stay_private(tmp_path: Path) -> None:
+    import stat
+
+    def run_argv(argv: list[str]) -> int:
+        fd_dir = Path("/proc/self/fd")
+        targets = {os.path.realpath(fd_dir / fd) for fd in os.listdir(fd_dir)}
+        os.write(1, str(str(daemon.get_lock_path()) in targets).encode())
+        return 0
+
+    daemon, thread = _serve(tmp_path, run_argv)
+    try:
+        mode = stat.S_IMODE(daemon.get_socket_path().stat().st_mode)
+        result = daemon.request(["app::info"], inherit_stdio=False)
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
+
+    assert mode == 0o600
+    # The child would otherwise hold the lock for as long as its command.
+    assert result.stdout == "False"
+
+
+def test_app_manager_daemon_exits_when_idle(tmp_path: Path) -> None:
+    daemon, thread = _serve(tmp_path, lambda argv: 0, idle_timeout=1)
+
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert not daemon.get_socket_path().exists()
+
+
+def test_app_manager_daemon_request_closes_pipes_when_send_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import socket
+
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    daemon = AppManagerDaemon(app_path=tmp_path)
+    socket_path = daemon.get_socket_path()
+    socket_path.parent.mkdir(parents=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def send_fds(*args, **kwargs):
+        raise OSError("broken pipe")
+
+    monkeypatch.setattr(socket, "send_fds", send_fds)
+    with listener:
+        open_fds = set(os.listdir("/proc/self/fd"))
+        result = daemon.request(["app::info"], inherit_stdio=False)
+        leaked = set(os.listdir("/proc/self/fd")) - open_fds
+
+    assert result is None
+    assert leaked == set()
+
+
+def test_app_manager_daemon_refuses_requests_once_stale(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from wexample_app.const.globals import APP_FILE_APP_CONFIG, WORKDIR_SETUP_DIR
+
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    config_path = tmp_path / WORKDIR_SETUP_DIR / APP_FILE_APP_CONFIG
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text("global: {}\n")
+    spawned: list[Path] = []
+    monkeypatch.setattr(
+        AppManagerDaemon, "spawn", lambda self: spawned.append(self.app_path)
+    )
+    ran: list[list[str]] = []
+    daemon, thread = _serve(tmp_path, lambda argv: ran.append(argv) or 0)
+
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    result = daemon.request(["app::info"], inherit_stdio=False)
+    thread.join(timeout=5)
+
+    assert result is None
+    assert ran == []
+    assert spawned == [tmp_path]
+    assert not thread.is_alive()
+    # Left in place for the fresh daemon to take over.
+    assert daemon.get_socket_path().is_socket()
+
+
+def test_app_manager_daemon_request_removes_dead_socket_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import socket
+
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    daemon = AppManagerDaemon(app_path=tmp_path)
+    socket_path = daemon.get_socket_path()
+    socket_path.parent.mkdir(parents=True)
+    # Bound, then closed without unlinking: like a daemon that died.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+        dead.bind(str(socket_path))
+    spawned: list[Path] = []
+    monkeypatch.setattr(
+        AppManagerDaemon, "spawn", lambda self: spawned.append(self.app_path)
+    )
+
+    assert daemon.request(["app::info"], inherit_stdio=False) is None
+    assert daemon.request(["app::info"], inherit_stdio=False) is None
+
+    assert spawned == [tmp_path]
+    assert not socket_path.exists()
+
+
+def _serve(app_path: Path, run_argv, idle_timeout: float = 0):
+    from wexample_wex_addon_app.common.app_manager_daemon import AppManagerDaemon
+
+    daemon = AppManagerDaemon(app_path=app_path)
+    thread = threading.Thread(
+        target=daemon.serve,
+        kwargs={"run_argv": run_argv, "idle_timeout": idle_timeout},
+        daemon=True,
+    )
+    thread.start()
+    for _ in range(100):
+        if daemon.is_enabled():
+            break
+        time.sleep(0.05)
+    return daemon, thread
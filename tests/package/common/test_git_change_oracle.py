@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+
+def test_git_change_oracle_get_changed_paths(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+    root = _init_suite_repository(tmp_path)
+    _git(root, "tag", "lib/v1.0.0")
+    (root / "packages" / "lib" / "README.md").write_text("# Changed\n")
+    (root / "other" / "module.py").write_text("value = 1\n")
+
+    oracle = GitChangeOracle()
+
+    assert oracle.get_changed_paths("lib/v1.0.0", root / "packages") == [
+        root / "other" / "module.py",
+        root / "packages" / "lib" / "README.md",
+    ]
+    assert oracle.get_changed_paths("lib/v9.9.9", root) is None
+    assert oracle.get_changed_paths("lib/v1.0.0", tmp_path) is None
+
+
+def test_git_change_oracle_get_last_tag_sorts_versions_per_package(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+    root = _init_suite_repository(tmp_path)
+    for tag in ("lib/v1.9.0", "lib/v1.10.0", "lib2/v3.0.0", "other/v0.1.0"):
+        _git(root, "tag", tag)
+
+    oracle = GitChangeOracle()
+
+    assert oracle.get_last_tag(root / "packages" / "lib", "lib") == "lib/v1.10.0"
+    assert oracle.get_last_tag(root / "packages" / "lib2", "lib2") == "lib2/v3.0.0"
+    assert oracle.get_last_tag(root / "packages" / "lib", "missing") is None
+    assert oracle.get_repository_root(root / "packages" / "lib") == root
+
+
+def test_git_change_oracle_has_changes_since_nested_package_prefix(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+    root = _init_suite_repository(tmp_path)
+    _git(root, "tag", "lib/v1.0.0")
+    (root / "packages" / "lib2" / "src" / "module.py").write_text("changed = 1\n")
+    (root / "packages" / "lib" / "README.md").write_text("# Changed\n")
+
+    oracle = GitChangeOracle()
+    lib = root / "packages" / "lib"
+
+    # lib2 shares the "packages/lib" string prefix, not the directory.
+    assert oracle.has_changes_since("lib/v1.0.0", lib) is True
+    assert oracle.has_changes_since("lib/v1.0.0", lib, "src") is False
+    assert oracle.has_changes_since("lib/v1.0.0", root / "packages" / "lib2") is True
+    assert oracle.has_changes_since("lib/v1.0.0", root / "other") is False
+    assert oracle.has_changes_since("lib/v1.0.0", root) is True
+
+
+def test_git_change_oracle_has_changes_since_unknown_tag(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.git_change_oracle import GitChangeOracle
+
+    root = _init_suite_repository(tmp_path)
+
+    oracle = GitChangeOracle()
+
+    assert oracle.has_changes_since("lib/v9.9.9", root / "other") is True
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+def _init_suite_repository(tmp_path: Path) -> Path:
+    root = tmp_path / "suite"
+    for path in (
+        "packages/lib/README.md",
+        "packages/lib/src/module.py",
+        "packages/lib2/src/module.py",
+        "other/module.py",
+    ):
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("value = 0\n")
+
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(
+        root,
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-q",
+        "-m",
+        "init",
+    )
+    return root
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_package_impact_graph_load_or_build_uses_cache(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.package_impact_graph import (
+        PackageImpactGraph,
+    )
+
+    package_paths = _create_packages(tmp_path, "core", "web")
+    build = _Build(tmp_path)
+    cache_path = tmp_path / "tmp" / "graph.json"
+
+    first = PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+    second = PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+
+    assert build.calls == 1
+    assert second.dependencies == first.dependencies == {"core": [], "web": ["core"]}
+    assert second.paths == first.paths
+
+
+def test_package_impact_graph_load_or_build_invalidates_on_manifest_change(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_app.common.package_impact_graph import (
+        PackageImpactGraph,
+    )
+
+    package_paths = _create_packages(tmp_path, "core", "web")
+    build = _Build(tmp_path)
+    cache_path = tmp_path / "tmp" / "graph.json"
+    PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+
+    # Same content, new mtime: still cached.
+    manifest = tmp_path / "web" / "pyproject.toml"
+    manifest.write_text(manifest.read_text())
+    PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+    assert build.calls == 1
+
+    manifest.write_text('[project]\nname = "web"\ndependencies = []\n')
+    PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+    assert build.calls == 2
+
+    # A manifest appearing in a package counts as a change too.
+    (tmp_path / "core" / "package.json").write_text("{}")
+    PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+    assert build.calls == 3
+
+
+def test_package_impact_graph_load_or_build_invalidates_on_package_set_change(
+    tmp_path: Path,
+) -> None:
+    from wexample_wex_addon_app.common.package_impact_graph import (
+        PackageImpactGraph,
+    )
+
+    package_paths = _create_packages(tmp_path, "core", "web")
+    build = _Build(tmp_path)
+    cache_path = tmp_path / "tmp" / "graph.json"
+    PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+
+    package_paths += _create_packages(tmp_path, "cli")
+    graph = PackageImpactGraph.load_or_build(cache_path, package_paths, build)
+    assert build.calls == 2
+    assert "cli" in graph.paths
+
+    graph = PackageImpactGraph.load_or_build(cache_path, package_paths[:2], build)
+    assert build.calls == 3
+
+
+def test_package_impact_graph_get_impacted_by_paths_nested(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.package_impact_graph import (
+        PackageImpactGraph,
+    )
+
+    graph = PackageImpactGraph(
+        dependencies={"core": [], "plugin": ["core"], "web": ["plugin"], "cli": []},
+        paths={
+            "core": "/suite/core",
+            "plugin": "/suite/core/plugins/plugin",
+            "web": "/suite/web",
+            "cli": "/suite/cli",
+        },
+    )
+
+    assert graph.get_impacted_by_paths(["/suite/core/plugins/plugin/a.py"]) == {
+        "plugin",
+        "web",
+    }
+    assert graph.get_impacted_by_paths(["/suite/core/src/a.py"]) == {
+        "core",
+        "plugin",
+        "web",
+    }
+    assert graph.get_impacted_by_paths(["/suite/README.md", "/suite/cli2/a"]) == set()
+
+
+class _Build:
+    """Reads each package dependencies from a `requires` line of its manifest."""
+
+    def __init__(self, root: Path) -> None:
+        self.calls = 0
+        self._root = root
+
+    def __call__(self) -> tuple[dict[str, list[str]], dict[str, str]]:
+        self.calls += 1
+        dependencies: dict[str, list[str]] = {}
+        paths: dict[str, str] = {}
+        for manifest in sorted(self._root.glob("*/pyproject.toml")):
+            name = manifest.parent.name
+            requires = [
+                line.split("=", 1)[1].strip()
+                for line in manifest.read_text().splitlines()
+                if line.startswith("requires =")
+            ]
+            dependencies[name] = requires
+            paths[name] = str(manifest.parent)
+        return dependencies, paths
+
+
+def _create_packages(root: Path, *names: str) -> list[Path]:
+    requires = {"web": "core"}
+    paths = []
+    for name in names:
+        path = root / name
+        path.mkdir()
+        lines = ["[project]", f'name = "{name}"']
+        if name in requires:
+            lines.append(f"requires = {requires[name]}")
+        (path / "pyproject.toml").write_text("\n".join(lines) + "\n")
+        paths.append(path)
+    return paths
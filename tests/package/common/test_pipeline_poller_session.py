@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def test_pipeline_poller_session_polls_concurrent_waits_together() -> None:
+    from wexample_wex_addon_app.common.pipeline_poller_session import (
+        PipelinePollerSession,
+    )
+
+    progress: list[dict[str, str]] = []
+    session = PipelinePollerSession(
+        interval=0.01,
+        max_interval=0.02,
+        pool_size=2,
+        on_progress=lambda statuses, elapsed: progress.append(statuses),
+    )
+    results: dict[str, Any] = {}
+
+    with _FakeCiServer(
+        {
+            "/pipelines/1": ["running"] * 3 + ["success"],
+            "/pipelines/2": ["running"] * 5 + ["failed"],
+        }
+    ) as server:
+
+        def wait(key: str) -> None:
+            results[key] = session.wait(
+                key=key,
+                base_url=server.url,
+                path=f"pipelines/{key}",
+                describe=_describe,
+                timeout=5,
+            )
+
+        threads = [threading.Thread(target=wait, args=(key,)) for key in "12"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        session.close()
+
+    assert results == {"1": {"status": "success"}, "2": {"status": "failed"}}
+    # One view shows every pending wait.
+    assert {"1": "running", "2": "running"} in progress
+    assert len(server.connections) <= 2
+
+
+def test_pipeline_poller_session_serves_other_processes(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.pipeline_poller_session import (
+        PipelinePollerSession,
+    )
+
+    progress: list[dict[str, str]] = []
+    socket_path = tmp_path / "pipeline-poller.sock"
+    served = PipelinePollerSession(
+        interval=0.01,
+        max_interval=0.02,
+        on_progress=lambda statuses, elapsed: progress.append(statuses),
+        socket_path=socket_path,
+    )
+    client = PipelinePollerSession(socket_path=socket_path)
+
+    with _FakeCiServer({"/pipelines/3": ["running", "success"]}) as server:
+        served.serve()
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        try:
+            payload = client.wait(
+                key="3",
+                base_url=server.url,
+                path="pipelines/3",
+                describe=_describe,
+                timeout=5,
+            )
+        finally:
+            served.close()
+
+    assert payload == {"status": "success"}
+    # The serving session shows what the client reported.
+    assert progress[-1] == {"3": "success"}
+    assert not socket_path.exists()
+
+
+def test_pipeline_poller_session_polls_alone_when_not_served(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.pipeline_poller_session import (
+        PipelinePollerSession,
+    )
+
+    session = PipelinePollerSession(
+        interval=0.01, socket_path=tmp_path / "pipeline-poller.sock"
+    )
+
+    with _FakeCiServer({"/pipelines/4": ["success"]}) as server:
+        try:
+            payload = session.wait(
+                key="4",
+                base_url=server.url,
+                path="pipelines/4",
+                describe=_describe,
+                timeout=5,
+            )
+        finally:
+            session.close()
+
+    assert payload == {"status": "success"}
+
+
+def test_pipeline_poller_session_wait_errors(tmp_path: Path) -> None:
+    from wexample_wex_addon_app.common.pipeline_poller_session import (
+        PipelinePollerSession,
+    )
+    from wexample_wex_addon_app.exception.pipeline_poll_exception import (
+        PipelinePollException,
+    )
+
+    socket_path = tmp_path / "pipeline-poller.sock"
+    served = PipelinePollerSession(
+        interval=0.01, max_interval=0.02, socket_path=socket_path
+    )
+    client = PipelinePollerSession(socket_path=socket_path)
+
+    with _FakeCiServer({"/pipelines/5": ["running"]}) as server:
+        served.serve()
+        try:
+            for session in (served, client):
+                with pytest.raises(TimeoutError, match="5"):
+                    session.wait(
+                        key="5",
+                        base_url=server.url,
+                        path="pipelines/5",
+                        describe=_describe,
+                        timeout=0.2,
+                    )
+                with pytest.raises(PipelinePollException) as error:
+                    session.wait(
+                        key="6",
+                        base_url=server.url,
+                        path="pipelines/6",
+                        describe=_describe,
+                        timeout=5,
+                    )
+                assert error.value.status == 404
+        finally:
+            served.close()
+
+
+def _describe(payload: dict[str, str]) -> tuple[str, bool]:
+    return payload["status"], payload["status"] in {"success", "failed"}
+
+
+class _FakeCiServer:
+    """Serve each path a sequence of pipeline statuses, one step per request."""
+
+    def __init__(self, statuses: dict[str, list[str]]) -> None:
+        self.connections: set[tuple] = set()
+        self._lock = threading.Lock()
+        self._statuses = statuses
+        self._steps = dict.fromkeys(statuses, 0)
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                fake._handle(self)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    def __enter__(self) -> _FakeCiServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.connections.add(request.client_address)
+            statuses = self._statuses.get(request.path)
+            if statuses is not None:
+                step = self._steps[request.path]
+                self._steps[request.path] = step + 1
+                status = statuses[min(step, len(statuses) - 1)]
+
+        if statuses is None:
+            request.send_response(404)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        body = json.dumps({"status": status}).encode()
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+
+def test_runner_pool_reap_removes_idle_unleased_containers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from wexample_wex_addon_app.common import runner_pool
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+    removed: list[str] = []
+    monkeypatch.setattr(runner_pool, "_remove_container", removed.append)
+    dead = subprocess.Popen(["true"])
+    dead.wait()
+    now = time.time()
+    state_path = tmp_path / "pool.json"
+    state_path.write_text(
+        json.dumps(
+            {
+                "idle": {"last_used": now - 120},
+                "recent": {"last_used": now - 10},
+                "long_ttl": {"last_used": now - 120, "idle_ttl": 300},
+                "leased": {"last_used": now - 120, "leases": [os.getpid()]},
+                "abandoned": {"last_used": now - 120, "leases": [dead.pid]},
+            }
+        )
+    )
+
+    pool = RunnerPool(state_path=state_path, idle_ttl=60)
+
+    assert sorted(pool.reap()) == ["abandoned", "idle"]
+    assert sorted(removed) == ["abandoned", "idle"]
+    assert sorted(json.loads(state_path.read_text())) == [
+        "leased",
+        "long_ttl",
+        "recent",
+    ]
+
+
+def test_runner_pool_use_leases_the_container(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from wexample_wex_addon_app.common import runner_pool
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+    removed: list[str] = []
+    monkeypatch.setattr(runner_pool, "_remove_container", removed.append)
+    pooled = _FakeRunner("wex-runner-pool-abc")
+    monkeypatch.setattr(RunnerPool, "acquire", lambda self, runner: pooled)
+    state_path = tmp_path / "pool.json"
+    state_path.write_text(
+        json.dumps(
+            {
+                pooled.container_name: {"last_used": 0},
+                "wex-runner-pool-old": {"last_used": 0},
+            }
+        )
+    )
+
+    pool = RunnerPool(state_path=state_path, idle_ttl=60)
+
+    with pool.use(_FakeRunner("runner")) as first:
+        with pool.use(_FakeRunner("runner")) as second:
+            assert first is second is pooled
+        # A command outliving the TTL keeps its container.
+        assert pool.reap() == ["wex-runner-pool-old"]
+        entry = json.loads(state_path.read_text())[pooled.container_name]
+        assert entry["leases"] == [os.getpid()]
+
+    entry = json.loads(state_path.read_text())[pooled.container_name]
+    assert entry["leases"] == []
+    # Used until the command returned.
+    assert time.time() - entry["last_used"] < 60
+    assert pool.reap() == []
+    assert removed == ["wex-runner-pool-old"]
+
+
+def test_runner_pool_use_reaps_idle_containers_when_done(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from wexample_wex_addon_app.common import runner_pool
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+    removed: list[str] = []
+    monkeypatch.setattr(runner_pool, "_remove_container", removed.append)
+    pooled = _FakeRunner("wex-runner-pool-abc")
+    monkeypatch.setattr(RunnerPool, "acquire", lambda self, runner: pooled)
+    state_path = tmp_path / "pool.json"
+    state_path.write_text(
+        json.dumps(
+            {
+                pooled.container_name: {"last_used": time.time()},
+                # Left by a previous image of the runner.
+                "wex-runner-pool-old": {"last_used": 0},
+            }
+        )
+    )
+
+    with RunnerPool(state_path=state_path, idle_ttl=60).use(_FakeRunner("runner")):
+        assert removed == []
+
+    assert removed == ["wex-runner-pool-old"]
+    assert list(json.loads(state_path.read_text())) == [pooled.container_name]
+
+
+def test_runner_reap_command(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from wexample_wex_addon_app.commands.runner.reap import app__runner__reap
+    from wexample_wex_addon_app.common import runner_pool
+    from wexample_wex_addon_app.common.runner_pool import RunnerPool
+
+    removed: list[str] = []
+    monkeypatch.setattr(runner_pool, "_remove_container", removed.append)
+    monkeypatch.setattr(
+        "wexample_app.response.success_response.SuccessResponse",
+        lambda **kwargs: kwargs,
+    )
+
+    class _Workdir:
+        def get_path(self) -> Path:
+            return tmp_path
+
+    class _Context:
+        kernel = None
+
+    def reap() -> dict:
+        return app__runner__reap.function(context=_Context(), app_workdir=_Workdir())
+
+    assert reap()["message"] == "No idle runner container."
+    # Nothing to reap is no reason to create the state file.
+    assert not RunnerPool.get_state_path(tmp_path).exists()
+
+    state_path = RunnerPool.get_state_path(tmp_path)
+    state_path.parent.mkdir(parents=True)
+    state_path.write_text(json.dumps({"wex-runner-pool-old": {"last_used": 0}}))
+
+    assert reap()["message"] == "Removed 1 idle runner container(s)."
+    assert removed == ["wex-runner-pool-old"]
+
+
+class _FakeRunner:
+    def __init__(self, container_name: str) -> None:
+        self.container_name = container_name
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+
+def test_service_readiness_waiter_checks_each_service_when_due() -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    calls: list[str] = []
+    results = {"db": [False, True], "web": [True]}
+
+    def check(name: str):
+        def run() -> bool:
+            calls.append(name)
+            return results[name].pop(0)
+
+        return run
+
+    waiter = ServiceReadinessWaiter(
+        checks={name: check(name) for name in results},
+        recheck_interval=0.3,
+        tick=0.05,
+    )
+
+    ready, lines = waiter.poll()
+    assert (ready, lines) == (False, ["db is not ready yet..."])
+    assert calls == ["db", "web"]
+
+    # Not due yet: the poll only waits, at most one tick.
+    started = time.monotonic()
+    assert waiter.poll()[0] is False
+    assert calls == ["db", "web"]
+    assert time.monotonic() - started < 0.2
+
+    while not waiter.poll()[0]:
+        pass
+    assert calls == ["db", "web", "db"]
+
+
+def test_service_readiness_waiter_runs_due_checks_concurrently() -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    def slow_check() -> bool:
+        time.sleep(0.3)
+        return True
+
+    waiter = ServiceReadinessWaiter(
+        checks={"db": slow_check, "cache": slow_check, "web": slow_check}
+    )
+
+    started = time.monotonic()
+    assert waiter.poll() == (True, [])
+    assert time.monotonic() - started < 0.6
+
+
+def test_service_readiness_waiter_falls_back_without_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    _fake_docker(monkeypatch, engine=False)
+    waiter = ServiceReadinessWaiter(
+        checks={"db": lambda: False},
+        containers={"db": "demo_db"},
+        health_recheck_interval=15,
+        recheck_interval=2,
+    )
+
+    waiter.poll()
+
+    assert waiter._get_interval("db") == 2
+    assert waiter._watcher is None
+
+
+def test_service_readiness_waiter_waits_longer_for_unhealthy_containers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    events = _fake_docker(monkeypatch, health={"demo_db": "starting"})
+    waiter = ServiceReadinessWaiter(
+        checks={"db": lambda: False, "web": lambda: False},
+        containers={"db": "demo_db", "web": "demo_web"},
+        health_recheck_interval=15,
+        recheck_interval=2,
+    )
+
+    try:
+        waiter.poll()
+
+        assert waiter._get_interval("db") == 15
+        assert waiter._get_interval("web") == 2
+        assert events.containers == ["demo_db", "demo_web"]
+    finally:
+        waiter.close()
+
+
+def test_service_readiness_waiter_health_interval_defaults_to_recheck(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    _fake_docker(monkeypatch, health={"demo_db": "starting"})
+    waiter = ServiceReadinessWaiter(
+        checks={"db": lambda: False},
+        containers={"db": "demo_db"},
+        recheck_interval=2,
+    )
+
+    try:
+        waiter.poll()
+
+        # A ready hook may pass before the health check does.
+        assert waiter._get_interval("db") == 2
+    finally:
+        waiter.close()
+
+
+def test_service_readiness_waiter_wakes_on_healthy_event(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    events = _fake_docker(monkeypatch, health={"demo_db": "starting"})
+    results = [False, True]
+    waiter = ServiceReadinessWaiter(
+        checks={"db": lambda: results.pop(0)},
+        containers={"db": "demo_db"},
+        health_recheck_interval=15,
+        tick=0.05,
+    )
+
+    try:
+        assert waiter.poll()[0] is False
+        started = time.monotonic()
+        events.emit("demo_db", "health_status: healthy")
+        while not waiter.poll()[0]:
+            assert time.monotonic() - started < 5
+    finally:
+        waiter.close()
+
+    assert results == []
+    assert waiter._get_interval("db") == waiter.recheck_interval
+
+
+def test_service_readiness_waiter_polls_when_events_die(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from wexample_wex_addon_app.common.service_readiness_waiter import (
+        ServiceReadinessWaiter,
+    )
+
+    events = _fake_docker(monkeypatch, health={"demo_db": "starting"})
+    waiter = ServiceReadinessWaiter(
+        checks={"db": lambda: False},
+        containers={"db": "demo_db"},
+        health_recheck_interval=15,
+        recheck_interval=0.2,
+        tick=0.05,
+    )
+
+    try:
+        waiter.poll()
+        checked_at = time.monotonic()
+        events.die()
+        waiter._watcher.join(timeout=5)
+
+        assert waiter._events_live is False
+        assert waiter._get_interval("db") == 0.2
+        assert waiter._due["db"] <= checked_at + 0.2 + 0.05
+    finally:
+        waiter.close()
+
+
+class _FakeEvents:
+    """Stands for `docker_container_events`, one short window per call."""
+
+    def __init__(self) -> None:
+        self.containers: list[str] = []
+        self._alive = True
+        self._queue: list[dict[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, containers, since, until, on_event) -> bool:
+        self.containers = list(containers)
+        time.sleep(0.02)
+        with self._lock:
+            queued, self._queue = self._queue, []
+            alive = self._alive
+        for event in queued:
+            on_event(event)
+        return alive
+
+    def die(self) -> None:
+        with self._lock:
+            self._alive = False
+
+    def emit(self, name: str, action: str) -> None:
+        with self._lock:
+            self._queue.append({"name": name, "action": action})
+
+
+def _fake_docker(
+    monkeypatch: pytest.MonkeyPatch,
+    health: dict[str, str] | None = None,
+    engine: bool = True,
+) -> _FakeEvents:
+    import wexample_wex_addon_app.helper.docker as docker
+
+    events = _FakeEvents()
+
+    def inspect(names: list[str]) -> dict[str, Any]:
+        return {
+            name: {"State": {"Health": {"Status": health[name]}}}
+            for name in names
+            if name in (health or {})
+        }
+
+    monkeypatch.setattr(
+        docker, "docker_engine_client", lambda: object() if engine else None
+    )
+    monkeypatch.setattr(docker, "docker_inspect_containers", inspect)
+    monkeypatch.setattr(docker, "docker_container_events", events)
+    return events
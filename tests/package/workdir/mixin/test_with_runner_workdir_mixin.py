@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+
+def test_batch_script_splits_output_and_exit_codes() -> None:
+    cmds = [
+        ["echo", "first line"],
+        "printf 'no newline'; echo oops >&2; exit 3",
+        ["sh", "-c", "printf 'a\\n\\nb\\n'"],
+    ]
+
+    results = _run_batch(cmds, stop_on_error=False)
+
+    assert [result.exit_code for result in results] == [0, 3, 0]
+    assert [result.stdout for result in results] == [
+        "first line\n",
+        "no newline",
+        "a\n\nb\n",
+    ]
+    assert [result.stderr for result in results] == ["", "oops\n", ""]
+
+
+def test_batch_script_stops_on_error() -> None:
+    cmds = [["true"], "echo failing; exit 2", ["echo", "never"]]
+
+    results = _run_batch(cmds, stop_on_error=True)
+
+    assert [(result.exit_code, result.stdout) for result in results] == [
+        (0, ""),
+        (2, "failing\n"),
+    ]
+
+
+def test_batch_result_without_markers_is_returned_whole() -> None:
+    from wexample_runner.runner_result import RunnerResult
+
+    from wexample_wex_addon_app.workdir.mixin.with_runner_workdir_mixin import (
+        _split_batch_result,
+    )
+
+    # The exec session failed before running any command.
+    result = RunnerResult(exit_code=126, stderr="exec failed", stdout="")
+
+    assert _split_batch_result(result, "__marker", 2) == [result]
+
+
+def _run_batch(cmds: list[list[str] | str], stop_on_error: bool) -> list:
+    from wexample_runner.runner_result import RunnerResult
+
+    from wexample_wex_addon_app.workdir.mixin.with_runner_workdir_mixin import (
+        _build_batch_script,
+        _split_batch_result,
+    )
+
+    marker = "__wex_batch_test"
+    script = _build_batch_script(cmds, marker, stop_on_error)
+    completed = subprocess.run(
+        ["sh", "-c", script], capture_output=True, text=True, check=False
+    )
+    if completed.returncode not in (0, 2):
+        pytest.fail(completed.stderr)
+
+    return _split_batch_result(
+        RunnerResult(
+            exit_code=completed.returncode,
+            stderr=completed.stderr,
+            stdout=completed.stdout,
+        ),
+        marker,
+        len(cmds),
+    )
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+def test_benchmark_history_append() -> None:
+    pass
+
+def test_benchmark_history_compare() -> None:
+    pass
+
+def test_benchmark_history_find_run() -> None:
+    pass
+
+def test_benchmark_history_machine_fingerprint() -> None:
+    pass
+
+def test_benchmark_history_read() -> None:
+    pass
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+def test_db_dump_extract() -> None:
+    pass
+
+def test_db_dump_file_name() -> None:
+    pass
+
+def test_db_dump_restore() -> None:
+    pass
+
+def test_db_dump_run() -> None:
+    pass
+
+def test_db_dump_stream() -> None:
+    pass
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+def test_dependency_graph_closure() -> None:
+    pass
+
+def test_dependency_graph_reverse() -> None:
+    pass
+
+def test_dependency_graph_run() -> None:
+    pass
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+def test_docker_container_events() -> None:
+    pass
+
+def test_docker_copy_to_container() -> None:
+    pass
+
+def test_docker_engine_client() -> None:
+    pass
+
+def test_docker_exec() -> None:
+    pass
+
+def test_docker_image_exists() -> None:
+    pass
+
+def test_docker_image_id() -> None:
+    pass
+
+def test_docker_inspect_containers() -> None:
+    pass
+
+def test_docker_list_containers() -> None:
+    pass
+
+def test_docker_list_image_tags() -> None:
+    pass
+
+def test_docker_list_running_containers() -> None:
+    pass
+
+def test_docker_remove_container() -> None:
+    pass
+
+def test_docker_remove_image() -> None:
+    pass
+
+def test_docker_stop_container() -> None:
+    pass
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+def test_fingerprint_digest() -> None:
+    pass
+
+def test_fingerprint_file() -> None:
+    pass
+
+def test_fingerprint_files() -> None:
+    pass
@@ -1,5 +1,17 @@
 from __future__ import annotations
 
+def test_build_command() -> None:
+    pass
+
+def test_build_context_files() -> None:
+    pass
+
+def test_build_inputs() -> None:
+    pass
+
+def test_build_tag_reference() -> None:
+    pass
+
 def test_load_builds() -> None:
     pass
 
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+def test_import_index_locations() -> None:
+    pass
+
+def test_import_index_parse_python() -> None:
+    pass
+
+def test_import_index_update() -> None:
+    pass
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+def test_pipeline_poller_close() -> None:
+    pass
+
+def test_pipeline_poller_fetch_round() -> None:
+    pass
+
+def test_pipeline_poller_is_reachable() -> None:
+    pass
+
+def test_pipeline_poller_poll() -> None:
+    pass
@@ -3,6 +3,12 @@ from __future__ import annotations
 def test_python_ensure_pip_or_fail() -> None:
     pass
 
+def test_python_get_editable_installs_in_venv() -> None:
+    pass
+
+def test_python_install_dependencies_batch_in_venv() -> None:
+    pass
+
 def test_python_install_dependencies_in_venv() -> None:
     pass
 
@@ -14,3 +20,6 @@ def test_python_install_environment() -> None:
 
 def test_python_is_package_installed_editable_in_venv() -> None:
     pass
+
+def test_python_normalize_package_name() -> None:
+    pass